@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Times the Excel tracking spreadsheet for runs of 100 and 1,000 sheets, in both layouts.
+
+Run from the repository root:
+    python benchmarks/excel_tracker.py [sheets ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import bingo_card_generator  # noqa: E402
+
+
+def time_tracker(sheets, output, table_tracker=False):
+    """Writes a tracker for the given number of sheets and returns the seconds taken"""
+    cards = bingo_card_generator.generate_cards(sheets * 6, seed=sheets)
+    start = time.perf_counter()
+    tracker = bingo_card_generator.open_tracker(f'bench-{sheets}.xlsx', output, table_tracker)
+    for sheet in range(1, sheets + 1):
+        tracker.add_sheet(sheet, cards[(sheet - 1) * 6:sheet * 6])
+    tracker.save()
+    return time.perf_counter() - start
+
+
+def main():
+    """Prints the time taken for each run size"""
+    sizes = [int(size) for size in sys.argv[1:]] or [100, 1000]
+    with tempfile.TemporaryDirectory() as output:
+        for layout, table_tracker in (('per-sheet', False), ('table', True)):
+            for sheets in sizes:
+                seconds = time_tracker(sheets, output, table_tracker)
+                print(f'{layout:>9} {sheets:>6} sheets: {seconds:8.2f}s  '
+                      f'({seconds / sheets * 1000:.1f} ms/sheet)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Times a cold import of each module, and of the command line help, in a fresh interpreter.
+
+Run from the repository root:
+    python benchmarks/import_time.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+heavy = ('PyQt6', 'openpyxl', 'pdfkit', 'PIL', 'webcolors', 'numpy')
+checks = {
+    'bingo_card_generator': 'import bingo_card_generator',
+    'bingo_engine': 'import bingo_engine',
+    'bingo_excel': 'import bingo_excel',
+    'bingo_pdf': 'import bingo_pdf',
+    'bingo_gui': 'import bingo_gui',
+    '--help': 'import sys; sys.argv = ["bingo-card-generator", "--help"]\n'
+              'import bingo_card_generator\n'
+              'try:\n    bingo_card_generator.main()\nexcept SystemExit:\n    pass',
+}
+report = ('\nimport sys\nprint(",".join(sorted({name.split(".")[0] for name in sys.modules} & '
+          f'{set(heavy)!r})), file=sys.stderr)')
+
+
+def time_import(code, runs):
+    """Runs the code in a fresh interpreter and returns the best time and the heavy modules loaded"""
+    best = None
+    loaded = ''
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', code + report], cwd=root,
+                                capture_output=True, text=True, check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        loaded = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ''
+    return best, loaded
+
+
+def main():
+    """Times each check, taking the best of the runs to skip disk cache effects"""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    baseline, _ = time_import('pass', runs)
+    print(f'{"python":>22}: {baseline * 1000:7.1f} ms')
+    for name, code in checks.items():
+        elapsed, loaded = time_import(code, runs)
+        print(f'{name:>22}: {(elapsed - baseline) * 1000:7.1f} ms over the interpreter, '
+              f'loads {loaded or "no optional packages"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Times the built-in PDF writer drawing 5,000 sheets into one merged PDF, and one PDF per sheet.
+
+Run from the repository root:
+    python benchmarks/pdf_writer.py [sheets]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import bingo_card_generator  # noqa: E402
+import bingo_pdf  # noqa: E402
+
+
+def main():
+    """Draws the sheets both ways and prints the pages per second"""
+    number_of_sheets = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    numbers = bingo_card_generator.generate_cards(number_of_sheets * 6, seed=number_of_sheets)
+    sheets = [(sheet + 1, numbers[sheet * 6:sheet * 6 + 6]) for sheet in range(number_of_sheets)]
+    with tempfile.TemporaryDirectory() as output:
+        merged = os.path.join(output, 'BLUE-cards.pdf')
+        start = time.perf_counter()
+        bingo_pdf.print_vector_pdf(sheets, merged, 'blue', 'Bonanza Bingo')
+        elapsed = time.perf_counter() - start
+        print(f'merged: {number_of_sheets} pages in {elapsed:.2f}s, '
+              f'{number_of_sheets / elapsed:,.0f} pages/s, {os.path.getsize(merged) / 1024:,.0f} KB')
+        start = time.perf_counter()
+        for sheet, sheet_cards in sheets:
+            bingo_pdf.print_vector_pdf([(sheet, sheet_cards)], os.path.join(output, f'{sheet}-BLUE.pdf'),
+                                       'blue', 'Bonanza Bingo')
+        elapsed = time.perf_counter() - start
+        print(f' sheet: {number_of_sheets} files in {elapsed:.2f}s, {number_of_sheets / elapsed:,.0f} files/s')
+
+
+if __name__ == '__main__':
+    main()
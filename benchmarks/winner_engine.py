@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Times the winner engine for a full game of 75 calls over 100,000 cards.
+
+Run from the repository root:
+    python benchmarks/winner_engine.py [cards]
+"""
+
+import os
+import sys
+import time
+from random import Random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import bingo_card_generator  # noqa: E402
+import bingo_engine  # noqa: E402
+
+
+def time_game(cards, use_numpy):
+    """Indexes the cards, calls every number and prints the time taken"""
+    start = time.perf_counter()
+    engine = bingo_engine.WinnerEngine(cards, use_numpy=use_numpy)
+    indexed = time.perf_counter() - start
+    calls = list(range(1, 76))
+    Random(75).shuffle(calls)
+    times = []
+    winners = []
+    first_win = None
+    for called, number in enumerate(calls, start=1):
+        call_start = time.perf_counter()
+        wins = engine.call(number)
+        times.append(time.perf_counter() - call_start)
+        winners.append(len(wins))
+        if wins and first_win is None:
+            first_win = called
+    path = 'numpy' if use_numpy else 'python'
+    quiet = [call_time for call_time, won in zip(times, winners) if not won]
+    print(f'{path:>6}: index {indexed:5.2f}s  first winner on call {first_win}, '
+          f'mean call up to it {sum(times[:first_win]) / first_win * 1000:6.3f} ms, '
+          f'over the whole game {sum(times) / len(times) * 1000:6.3f} ms, '
+          f'without winners {sum(quiet) / max(len(quiet), 1) * 1000:6.3f} ms, '
+          f'slowest {max(times) * 1000:6.3f} ms, most winners in one call {max(winners)}')
+
+
+def main():
+    """Runs the game with each available path"""
+    number_of_cards = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    numbers = bingo_card_generator.generate_cards(number_of_cards, seed=number_of_cards)
+    cards = {sheet + 1: numbers[sheet * 6:sheet * 6 + 6] for sheet in range(len(numbers) // 6 + 1)}
+    print(f'{number_of_cards} cards')
+    time_game(cards, False)
+    if bingo_engine.numpy is not None:
+        time_game(cards, True)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,21 +12,16 @@ CSS Maple Leaf author Andre Lopes - https://codepen.io/alldrops/pen/jAzZmw
 '''
 
 import argparse
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from importlib import import_module
 from random import Random
 import re
 import base64
-import csv
-import imghdr
+import hashlib
+import json
 import os
 import sys
-import pdfkit
-import webcolors
-from PyQt6 import QtCore, QtGui, QtWidgets
-from PIL import Image
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, NamedStyle, PatternFill, Alignment
-from openpyxl.utils import get_column_letter
-from openpyxl.formatting.rule import FormulaRule
+from bingo_layout import layout_from_args, orientations, paper_sizes
 
 __author__ = 'Corey Forman'
 __date__ = '19 Feb 2023'
@@ -35,424 +30,162 @@ __description__ = f'Bingo Card Generator {__version__}'
 __source__ = 'https://github.com/digitalsleuth/bingo-card-generator'
 __colour_groups__ = 'https://www.w3schools.com/colors/colors_groups.asp'
 
+# The GUI, Excel and PDF parts need PyQt6, openpyxl and pdfkit, so they live in their own
+# modules and are only imported when the chosen options use them
+lazy_names = {'UiDialog': 'bingo_gui', 'GenerateWorker': 'bingo_gui',
+              'gui_everything': 'bingo_gui', 'show_results': 'bingo_gui',
+              'Tracker': 'bingo_excel', 'TableTracker': 'bingo_excel', 'sheet_rows': 'bingo_excel',
+              'open_tracker': 'bingo_excel', 'generate_excel': 'bingo_excel',
+              'pdf_options': 'bingo_pdf', 'print_pdf': 'bingo_pdf'}
 
-class UiDialog():
-    """This is the main class for setting up the UI"""
-    def setup_ui(self, Dialog):
-        """Instantiate and layout dialog options"""
-        Dialog.setObjectName("Dialog")
-        Dialog.setFixedSize(390, 260)
-        label_font = QtGui.QFont()
-        label_font.setPointSize(10.5)
-        label_font.setFamily("Arial")
-        label_font.StyleHint("SansSerif")
-        self.dauber_shape = QtWidgets.QComboBox(Dialog)
-        self.dauber_shape.setGeometry(QtCore.QRect(134, 167, 131, 27))
-        self.dauber_shape.setEditable(False)
-        self.dauber_shape.setObjectName("dauber_shape")
-        item_count = 1
-        while item_count < 12:
-            self.dauber_shape.addItem("")
-            item_count += 1
-        self.dauber_shape.currentIndexChanged[int].connect(self.on_select)
-        self.dauber_shape_label = QtWidgets.QLabel(Dialog)
-        self.dauber_shape_label.setGeometry(QtCore.QRect(10, 172, 121, 21))
-        self.dauber_shape_label.setToolTipDuration(-1)
-        self.dauber_shape_label.setObjectName("dauber_shape_label")
-        self.dauber_shape_label.setFont(label_font)
-        self.title_label = QtWidgets.QLabel(Dialog)
-        self.title_label.setGeometry(QtCore.QRect(0, 21, 388, 20))
-        title_font = QtGui.QFont()
-        title_font.setWeight(700)
-        title_font.setPointSize(11)
-        title_font.setFamily("Arial")
-        title_font.StyleHint("SansSerif")
-        self.title_label.setFont(title_font)
-        self.title_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.title_label.setObjectName("title_label")
-        self.dauber_colour_label = QtWidgets.QLabel(Dialog)
-        self.dauber_colour_label.setGeometry(QtCore.QRect(10, 132, 121, 21))
-        self.dauber_colour_label.setToolTipDuration(-1)
-        self.dauber_colour_label.setObjectName("dauber_colour_label")
-        self.dauber_colour_label.setFont(label_font)
-        self.card_colour_label = QtWidgets.QLabel(Dialog)
-        self.card_colour_label.setGeometry(QtCore.QRect(10, 92, 121, 21))
-        self.card_colour_label.setToolTipDuration(-1)
-        self.card_colour_label.setObjectName("card_colour_label")
-        self.card_colour_label.setFont(label_font)
-        self.select_logo_button = QtWidgets.QPushButton(Dialog)
-        self.select_logo_button.setGeometry(QtCore.QRect(280, 167, 100, 27))
-        self.select_logo_button.setDefault(False)
-        self.select_logo_button.setObjectName("select_logo_button")
-        self.select_logo_button.clicked.connect(self.select_logo)
-        self.select_logo_button.setEnabled(False)
-        self.select_logo_button.setVisible(False)
-        self.select_logo_button.setFont(label_font)
-        self.select_result = QtWidgets.QLineEdit(Dialog)
-        self.select_result.setObjectName("select_result")
-        self.select_result.setReadOnly(True)
-        self.select_result.setVisible(False)
-        self.select_result.setGeometry(QtCore.QRect(8, 205, 372, 30))
-        self.select_result.setFont(label_font)
-        self.set_card_title = QtWidgets.QPushButton("Card Title", Dialog)
-        self.set_card_title.setObjectName("set_card_title")
-        self.set_card_title.setFont(label_font)
-        self.set_card_title.clicked.connect(self.enter_title)
-        self.set_card_title.setGeometry(QtCore.QRect(280, 47, 100, 31))
-        self.card_title = QtWidgets.QLineEdit(Dialog)
-        self.card_title.setVisible(False)
-        self.close = QtWidgets.QPushButton(Dialog)
-        self.close.setGeometry(QtCore.QRect(280, 127, 100, 31))
-        self.close.setObjectName("close")
-        self.close.setFont(label_font)
-        self.close.clicked.connect(QtWidgets.QApplication.instance().quit)
-        self.number_label = QtWidgets.QLabel(Dialog)
-        self.number_label.setGeometry(QtCore.QRect(10, 52, 121, 21))
-        self.number_label.setToolTipDuration(-1)
-        self.number_label.setObjectName("number_label")
-        self.number_label.setFont(label_font)
-        self.number = QtWidgets.QLineEdit(Dialog)
-        self.number.setGeometry(QtCore.QRect(134, 47, 131, 31))
-        self.number.setText("1")
-        self.number.setObjectName("number")
-        self.generate = QtWidgets.QPushButton(Dialog)
-        self.generate.setGeometry(QtCore.QRect(280, 87, 100, 31))
-        self.generate.setDefault(False)
-        self.generate.setFont(label_font)
-        self.generate.setObjectName("generate")
-        self.generate.clicked.connect(lambda: gui_everything(int(self.number.text()),
-                                                             self.card_colour.text(),
-                                                             self.dauber_colour.text(),
-                                                             self.dauber_shape.currentText(),
-                                                             self.get_directory(),
-                                                             self.select_logo(),
-                                                             self.allow_select(),
-                                                             self.easy_mode(),
-                                                             self.card_title.text()))
-        self.card_colour = QtWidgets.QLineEdit(Dialog)
-        self.card_colour.setGeometry(QtCore.QRect(134, 87, 131, 31))
-        self.card_colour.setObjectName("card_colour")
-        self.card_colour_picker = QtWidgets.QPushButton(Dialog)
-        self.card_colour_picker.setObjectName("card_colour_picker")
-        self.card_colour_picker.clicked.connect(self.card_colourpicker)
-        self.card_colour_picker.setGeometry(QtCore.QRect(110, 92, 20, 20))
-        self.card_colour_picker.setStyleSheet("background-color: blue; border: 1px solid black")
-        self.dauber_colour = QtWidgets.QLineEdit(Dialog)
-        self.dauber_colour.setGeometry(QtCore.QRect(134, 127, 131, 31))
-        self.dauber_colour.setObjectName("dauber_colour")
-        self.dauber_colour.setEnabled(False)
-        self.dauber_colour_picker = QtWidgets.QPushButton(Dialog)
-        self.dauber_colour_picker.setObjectName("dauber_colour_picker")
-        self.dauber_colour_picker.clicked.connect(self.dauber_colourpicker)
-        self.dauber_colour_picker.setGeometry(QtCore.QRect(110, 132, 20, 20))
-        self.dauber_colour_picker.setStyleSheet("background-color: red; border: 1px solid black")
-        self.dauber_colour_picker.setEnabled(False)
-        self.source_label = QtWidgets.QLabel(Dialog)
-        self.source_label.setGeometry(QtCore.QRect(4, 240, 372, 20))
-        self.source_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.source_label.setObjectName("source_label")
-        self.source_label.setOpenExternalLinks(True)
-        self.source_label.setParent(self)
-        link_template = '<a href={0}>{1}</a>'
-        self.source_label.setText(link_template.format(__source__,
-                                                       'Source @ GitHub.com/digitalsleuth'))
-        self.dauber_shape_label.setBuddy(self.dauber_shape)
-        self.dauber_colour_label.setBuddy(self.dauber_colour)
-        self.card_colour_label.setBuddy(self.card_colour)
-        self.number_label.setBuddy(self.number)
-        self.retranslate_ui(Dialog)
-        QtCore.QMetaObject.connectSlotsByName(Dialog)
-        Dialog.setTabOrder(self.number, self.card_colour)
-        Dialog.setTabOrder(self.card_colour, self.dauber_colour)
-        Dialog.setTabOrder(self.dauber_colour, self.dauber_shape)
-        Dialog.setTabOrder(self.dauber_shape, self.set_card_title)
-        Dialog.setTabOrder(self.set_card_title, self.generate)
-        Dialog.setTabOrder(self.generate, self.select_logo_button)
-        Dialog.setTabOrder(self.select_logo_button, self.close)
-
-    def retranslate_ui(self, Dialog):
-        """Translate layout of the UI components"""
-        _translate = QtCore.QCoreApplication.translate
-        Dialog.setWindowTitle(_translate("Dialog", __description__))
-        self.dauber_shape.setCurrentText(_translate("Dialog", "Circle"))
-        self.dauber_shape.setItemText(0, _translate("Dialog", "Checkmark"))
-        self.dauber_shape.setItemText(1, _translate("Dialog", "Circle"))
-        self.dauber_shape.setItemText(2, _translate("Dialog", "Clover"))
-        self.dauber_shape.setItemText(3, _translate("Dialog", "Heart"))
-        self.dauber_shape.setItemText(4, _translate("Dialog", "Logo"))
-        self.dauber_shape.setItemText(5, _translate("Dialog", "Maple-Leaf"))
-        self.dauber_shape.setItemText(6, _translate("Dialog", "Moon"))
-        self.dauber_shape.setItemText(7, _translate("Dialog", "Square"))
-        self.dauber_shape.setItemText(8, _translate("Dialog", "Star"))
-        self.dauber_shape.setItemText(9, _translate("Dialog", "Unicorn"))
-        self.dauber_shape.setItemText(10, _translate("Dialog", "X-Mark"))
-        self.dauber_shape_label.setToolTip(_translate("Dialog", "Choose the shape of the dauber"))
-        self.dauber_shape_label.setText(_translate("Dialog", "Dauber Shape"))
-        self.title_label.setText(_translate("Dialog", __description__))
-        self.dauber_colour.setText(_translate("Dialog", "Red"))
-        self.dauber_colour_label.setToolTip(_translate("Dialog", "Choose the colour of the dauber"))
-        self.dauber_colour_label.setText(_translate("Dialog", "Dauber Colour"))
-        self.card_colour.setText(_translate("Dialog", "Blue"))
-        self.card_colour_label.setToolTip(_translate("Dialog", "Choose the colour of the card"))
-        self.card_colour_label.setText(_translate("Dialog", "Card Colour"))
-        self.generate.setText(_translate("Dialog", "Generate"))
-        self.select_logo_button.setText(_translate("Dialog", "Select Logo"))
-        self.close.setText(_translate("Dialog", "Close"))
-        self.number_label.setToolTip(_translate("Dialog", "Choose the number of cards"))
-        self.number_label.setText(_translate("Dialog", "# of Cards"))
-        self.card_colour.setPlaceholderText(_translate("Dialog", "Blue"))
-        self.dauber_colour.setPlaceholderText(_translate("Dialog", "Red"))
-        self._menu_bar()
-
-    def get_directory(self):
-        """Get the output directory"""
-        dialogBox = QtWidgets.QFileDialog()
-        dialogBox.setFileMode(QtWidgets.QFileDialog.FileMode.Directory)
-        dialogBox.setOption(QtWidgets.QFileDialog.Option.ShowDirsOnly)
-        chosenPath = dialogBox.getExistingDirectory(self,
-                                                    'Select the output location for your cards',
-                                                    os.path.curdir)
-        selected_dir = QtCore.QDir.toNativeSeparators(chosenPath)
-
-        return selected_dir
-
-    def select_logo(self):
-        """Determine if the Logo option is selected and provide the result"""
-        index = self.dauber_shape.currentIndex()
-        if ((index == 4) and self.select_result.text() == ''):
-            selected_file, _ = QtWidgets.QFileDialog.getOpenFileName(self,
-                                                                     "Select the image to use",
-                                                                     "",
-                                                                     "Image Files (*.jpg *.png)")
-            selected_file = QtCore.QDir.toNativeSeparators(selected_file)
-            self.select_result.setText(selected_file)
-        elif ((index == 4) and self.select_result.text() != ''):
-            selected_file = self.select_result.text()
-        else:
-            selected_file = False
-
-        return selected_file
-
-    def allow_select(self):
-        """Used to determine if the dauber selection option is checked"""
-        return bool(self.allow_choices_action.isChecked())
-
-    def on_select(self, index):
-        """Modifies display of UI components depending on dropdown selection"""
-        self.select_logo_button.setEnabled(index == 4)
-        self.select_logo_button.setVisible(index == 4)
-        self.select_result.setVisible(index == 4)
-        self.dauber_colour.setEnabled(index in (1, 3, 5, 7))
-        self.dauber_colour_picker.setEnabled(index in (1, 3, 5, 7))
-
-    def dauber_colourpicker(self):
-        """Colour picker for choosing the dauber colour"""
-        dauberColour = QtWidgets.QColorDialog.getColor()
-        colour_db = webcolors.CSS3_HEX_TO_NAMES
-        if dauberColour.isValid():
-            if dauberColour.name() in colour_db.keys():
-                colour_name = (colour_db[dauberColour.name()]).capitalize()
-            else:
-                colour_name = (dauberColour.name()).upper()
-            self.dauber_colour_picker.setStyleSheet(f'background-color: {colour_name};'
-                                                    f' border: 1px solid black')
-            self.dauber_colour.setText(colour_name)
-        else:
-            self.dauber_colour_picker.setStyleSheet(f'background-color: {self.dauber_colour.text()};'
-                                                    f' border: 1px solid black')
-            self.dauber_colour.setText(self.dauber_colour.text())
-
-    def card_colourpicker(self):
-        """Colour picker for choosing the card colour"""
-        cardColour = QtWidgets.QColorDialog.getColor()
-        colour_db = webcolors.CSS3_HEX_TO_NAMES
-        if cardColour.isValid():
-            if cardColour.name() in colour_db.keys():
-                colour_name = (colour_db[cardColour.name()]).capitalize()
-            else:
-                colour_name = (cardColour.name()).upper()
-            self.card_colour_picker.setStyleSheet(f'background-color: {colour_name};'
-                                                  f' border: 1px solid black')
-            self.card_colour.setText(colour_name)
-        else:
-            self.card_colour_picker.setStyleSheet(f'background-color: {self.card_colour.text()};'
-                                                  f' border: 1px solid black')
-            self.card_colour.setText(self.card_colour.text())
-
-    def enter_title(self):
-        """Enter the title for the card"""
-        title_dialog = QtWidgets.QInputDialog()
-        title_dialog.setWindowFlags(QtCore.Qt.WindowType.WindowSystemMenuHint |
-                                    QtCore.Qt.WindowType.WindowTitleHint)
-        title, clicked = title_dialog.getText(self,
-                                              "Enter your title choice",
-                                              "Title:",
-                                              QtWidgets.QLineEdit.EchoMode.Normal,
-                                              self.card_title.text())
-        if clicked and title:
-            self.card_title.setText(title)
-        else:
-            self.card_title.setText(self.card_title.text())
-
-    def easy_mode(self):
-        """That was easy.."""
-
-        return bool(self.easy_mode_action.isChecked())
-
-    def _menu_bar(self):
-        """Add a menu bar"""
-        self.menu_bar = self.menuBar()
-        self.exit_action = QtGui.QAction("&Exit", self)
-        self.exit_action.triggered.connect(QtWidgets.QApplication.instance().quit)
-        self.file_menu = QtWidgets.QMenu("&File", self)
-        self.file_menu.addAction(self.exit_action)
-        self.menu_bar.addMenu(self.file_menu)
-        self.options_menu = self.menu_bar.addMenu("&Options")
-        self.easy_mode_action = QtGui.QAction("&Easy", self, checkable=True)
-        self.easy_mode_action.triggered.connect(self.easy_mode)
-        self.options_menu.addAction(self.easy_mode_action)
-        self.allow_choices_action = QtGui.QAction("&Allow Dauber Selection", self, checkable=True)
-        self.allow_choices_action.triggered.connect(self.allow_select)
-        self.options_menu.addAction(self.allow_choices_action)
-        self.help_menu = self.menu_bar.addMenu("&Help")
-        self.help_content_action = QtGui.QAction("&Usage", self)
-        self.help_content_action.triggered.connect(self._help_menu)
-        self.about_action = QtGui.QAction("&About", self)
-        self.about_action.triggered.connect(self._about)
-        self.help_menu.addAction(self.help_content_action)
-        self.help_menu.addAction(self.about_action)
-
-    def _help_menu(self):
-        """Add a help menu to the menu bar"""
-        self.help_box = QtWidgets.QDialog(None, QtCore.Qt.WindowType.WindowCloseButtonHint)
-        self.help_box.setWindowTitle("Help")
-        self.help_box.setFixedSize(610, 730)
-        self.help_label = QtWidgets.QLabel(self.help_box)
-        help_font = QtGui.QFont()
-        help_font.setPointSize(10)
-        help_font.setFamily("Arial")
-        help_font.StyleHint("SansSerif")
-        self.help_label.move(10, 10)
-        self.help_label.setFont(help_font)
-        text = (f"# of Cards:\tChoose how many cards you would like to generate - must be a "
-                f"number\n\n"
-                f"Card Colour:\tEither click the colour box to open a Colour Picker dialog box\n"
-                f"\t\tor type the colour into the text box. Colour names are drawn from:\n"
-                f"\t\t{__colour_groups__}\n\n"
-                f"Dauber Colour:\tAs with Card Colour, click the colour box for the"
-                f" Colour Picker\n"
-                f"\t\tor type the colour into the text box. Colour names are drawn from:\n"
-                f"\t\t{__colour_groups__}\n\n"
-                f"Dauber Shape:\tClick the dropdown box to choose the shape of the dauber to be"
-                f" used\n"
-                f"\t\tThe 'Logo' option will present the option to choose a custom file or logo to"
-                f" use\n"
-                f"\t\tas a dauber. This file will be resized to 48x48px, so ensure the image you"
-                f" choose\n"
-                f"\t\tis of a good quality to start.\n"
-                f"\t\tThe Dauber Shape option works in conjunction with 'Allow Dauber Choices'."
-                f"\n\n"
-                f"Card Title:\tThis allows you to put a title or text banner at the top of the "
-                f"card, which\n\t\tappears under the card number - eg. 'BINGO BONANZA 2023!'\n\n"
-                f"Generate:\tWill generate the bingo cards with the selected options. "
-                f"If some options\n"
-                f"\t\tare left blank, defaults will be selected (blue card, red circle dauber).\n"
-                f"\t\tWill then pop up a directory selection box to choose where to save the files."
-                f"\n\n"
-                f"Close:\t\tSelf-explanatory, will close the application.\n\n"
-                f"Select Logo:\tThis option only appears when 'Logo' is chosen from the"
-                f" 'Dauber Shape'\n"
-                f"\t\tdrop-down box. Opens a File Chooser dialog to select either a"
-                f" JPG or PNG file.\n"
-                f"\t\tThe file chosen will show in the box below to confirm the choice.\n\n"
-                f"Options Menu:\tEasy means when a number is selected, it is selected on all spots "
-                f"that contain\n"
-                f"\t\tthe number which was clicked. If B4 is called, when the player daubs it on\n"
-                f"\t\tone card, it is automatically 'daubbed' on all cards on the sheet.\n"
-                f"\t\tIf this option is not selected, play is as per normal.\n"
-                f"\t\tNOTE: This option is not presented to the player, and is only available "
-                f"within\n\t\tthe application.\n\n"
-                f"\t\tAllow Dauber Choices presents the player the option to choose their own "
-                f"dauber\n\t\tfrom a drop-down box at the top of the card. "
-                f"Option is not available if not selected.\n\n"
-                f"The final output of the application will be a combination of HTML files, "
-                f"PDF files and a single Excel\n"
-                f"spreadsheet. The HTML and PDF files will be named for the card number and "
-                f"colour\n(ie. 1-BLUE.html, 1-BLUE.pdf). Both the HTML and PDF file should be given"
-                f" to the player so they have\nan option to print or click.\n\n"
-                f"The Excel file is named for the card colour, and allows you to enter the numbers "
-                f"called into the CALL\n"
-                f"sheet, and when Bingo is called, you can click on the sheet with the card number "
-                f"on it and the called\nnumbers will be automatically highlighted. "
-                f"This enables easy confirmation of a successful BINGO!")
-        self.help_label.setText(text)
-        self.help_label.adjustSize()
-
-        self.help_box.exec()
-
-    def _about(self):
-        """Add an About menu to the menu bar"""
-        self.about_box = QtWidgets.QMessageBox()
-        self.about_box.setIcon(QtWidgets.QMessageBox.Icon.Information)
-        self.about_box.setWindowTitle(f"About {__description__}")
-        self.about_box.setText(f"{__description__}\t\t\t\n"
-                               f"Last Updated: {__date__}")
-        link_template = '<a href={0}>{1}</a>'
-        self.about_box.setInformativeText(link_template.format(__source__, __source__))
-        self.about_box.setStandardButtons(QtWidgets.QMessageBox.StandardButton.Ok)
-        self.about_box.exec()
-
-def gui_everything(number, card_colour, dauber_colour, dauber_shape,
-                   output, logo, allow_select, easy, title):
-    """Takes all input from the GUI and passes it to the various functions"""
-    args = {'num': number,
-            'pdf': True,
-            'card_colour': card_colour,
-            'dauber_colour': dauber_colour,
-            'dauber_shape': dauber_shape,
-            'logo': logo,
-            'allow_select': allow_select,
-            'base_colour': card_colour,
-            'output': output,
-            'easy': easy,
-            'title': title,
-            'excel': f'{str((card_colour).strip("#"))}-cards.xlsx',
-            'everything': True}
-    if not output:
-        return
-    create_card(args)
-    grab_numbers(args)
-    generate_excel(args['num'], args['card_colour'], args['excel'], args['output'])
-    if number == 1:
-        amt = 'card'
-    else:
-        amt = 'cards'
-    if dauber_shape.lower() not in ('circle', 'square', 'maple-leaf', 'heart'):
-        dauber_colour = ''
-    else:
-        dauber_colour = f'{dauber_colour.lower()} '
-    results_msgbox = QtWidgets.QMessageBox()
-    results_msgbox.setIcon(QtWidgets.QMessageBox.Icon.Information)
-    results_msgbox.setWindowTitle("Finished")
-    results_msgbox.setText(f"All files created in {output}\n\n{str(number)}"
-                           f" {card_colour.upper().strip('#')} {amt} created with a "
-                           f"{dauber_colour.upper().strip('#')}{dauber_shape.upper()} dauber.\n"
-                           f"Excel file named {(args['excel'].upper())} created for tracking "
-                           f"called numbers.\n\n"
-                           f"You may now close the Bingo Card Generator, or generate more cards.")
-    results_msgbox.setStandardButtons(QtWidgets.QMessageBox.StandardButton.Ok)
-    results_msgbox.exec()
-
-def create_card(arguments):
-    """Creates the HTML version of the card"""
+
+def __getattr__(name):
+    """Loads names which moved to the GUI, Excel and PDF modules on first use"""
+    if name in lazy_names:
+        return getattr(import_module(lazy_names[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class CardIndex():
+    """Index of card signatures, used to keep every card of a series unique"""
+    def __init__(self, index_file=None):
+        """Load the signatures of earlier runs when an index file is used"""
+        self.index_file = index_file
+        self.signatures = set()
+        self.new_signatures = []
+        if index_file and os.path.exists(index_file):
+            with open(index_file, 'rb') as index:
+                data = index.read()
+            for pos in range(0, len(data), 10):
+                self.signatures.add(int.from_bytes(data[pos:pos + 10], 'little'))
+
+    @staticmethod
+    def signature(card):
+        """Canonical signature of a card: a bitmap of the 24 numbers on it, in any position"""
+        return sum(1 << number for position, number in enumerate(card) if position != 12)
+
+    def add(self, card):
+        """Adds a card to the index, returning False if a card with the same numbers exists"""
+        signature = self.signature(card)
+        if signature in self.signatures:
+            return False
+        self.signatures.add(signature)
+        if self.index_file:
+            self.new_signatures.append(signature)
+        return True
+
+    def add_all(self, cards):
+        """Adds cards which are already part of the series, such as those of a resumed run,
+        queueing any the index file is missing"""
+        for card in cards:
+            signature = self.signature(card)
+            if signature not in self.signatures:
+                self.signatures.add(signature)
+                if self.index_file:
+                    self.new_signatures.append(signature)
+
+    def discard_all(self, cards):
+        """Takes out the cards of a sheet which is about to be generated again, so that its new
+        cards aren't turned away as repeats of the ones they replace"""
+        for card in cards:
+            self.signatures.discard(self.signature(card))
+
+    def save(self):
+        """Appends the signatures added during this run to the index file"""
+        if self.index_file and self.new_signatures:
+            with open(self.index_file, 'ab') as index:
+                index.write(b''.join(signature.to_bytes(10, 'little')
+                                     for signature in self.new_signatures))
+            self.new_signatures = []
+
+class Manifest():
+    """Records each sheet's cards and finished files, so an interrupted run can be resumed"""
+    def __init__(self, manifest_file, reset=False):
+        """Load the records of earlier runs into the same output directory, unless starting over.
+        Only each sheet's card count, hash, PDF state and the offset of its cards in the file are
+        kept, so the memory used doesn't grow with the cards of every sheet"""
+        self.manifest_file = manifest_file
+        self.seed = None
+        self.sheets = {}
+        if not reset and os.path.exists(manifest_file):
+            with open(manifest_file, 'rb') as manifest:
+                offset = 0
+                for line in manifest:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        record = {}
+                    if 'seed' in record:
+                        self.seed = record['seed']
+                    elif 'cards' in record:
+                        self.sheets[record['sheet']] = {'count': len(record['cards']),
+                                                        'hash': record.get('hash'),
+                                                        'pdf': record.get('pdf', False), 'offset': offset}
+                    elif record.get('sheet') in self.sheets and 'pdf' in record:
+                        self.sheets[record['sheet']]['pdf'] = record['pdf']
+                    offset += len(line)
+        self.manifest = open(manifest_file, 'w' if reset else 'a', encoding='utf-8')
+
+    def write(self, record):
+        """Appends one record, flushed so that it survives an interrupted run"""
+        self.manifest.write(json.dumps(record) + '\n')
+        self.manifest.flush()
+
+    def set_seed(self, seed):
+        """Records the series seed"""
+        self.seed = seed
+        self.write({'seed': seed})
+
+    def add_sheet(self, sheet, sheet_cards, html_hash):
+        """Records a sheet whose HTML file has been written"""
+        self.sheets[sheet] = {'count': len(sheet_cards), 'hash': html_hash, 'pdf': False,
+                              'offset': self.manifest.tell()}
+        self.write({'sheet': sheet, 'cards': sheet_cards, 'hash': html_hash, 'html': True, 'pdf': False})
+
+    def cards(self, sheet):
+        """Reads one recorded sheet's cards back from the manifest file"""
+        with open(self.manifest_file, 'rb') as manifest:
+            manifest.seek(self.sheets[sheet]['offset'])
+            return json.loads(manifest.readline())['cards']
+
+    def all_cards(self):
+        """Yields the sheet number and cards of every recorded sheet, in one pass over the file"""
+        offsets = {state['offset']: sheet for sheet, state in self.sheets.items()}
+        with open(self.manifest_file, 'rb') as manifest:
+            offset = 0
+            for line in manifest:
+                if offset in offsets:
+                    yield offsets[offset], json.loads(line)['cards']
+                offset += len(line)
+
+    def pdf_done(self, sheets):
+        """Records the sheets whose PDF has been printed"""
+        for sheet in sheets:
+            self.sheets[sheet]['pdf'] = True
+            self.write({'sheet': sheet, 'pdf': True})
+
+    def is_current(self, sheet, html_file):
+        """Checks that a sheet's HTML file still matches the hash it was recorded with"""
+        if not os.path.exists(html_file):
+            return False
+        with open(html_file, 'rb') as html:
+            return hashlib.sha256(html.read()).hexdigest() == self.sheets[sheet]['hash']
+
+    def close(self):
+        """Close the manifest file"""
+        self.manifest.close()
+
+def create_card(arguments, tracker=None, progress=None, cancelled=None):
+    """Creates the HTML version of the card one sheet at a time, passing each sheet on to the
+    tracker when there is one"""
     card_colour = arguments['card_colour'].lower()
     dauber_colour = arguments['dauber_colour'].lower()
     dauber_shape = arguments['dauber_shape'].lower()
     output_path = f"{arguments['output']}{os.sep}"
-    cards_per_sheet = 6
+    layout = layout_from_args(arguments)
+    cards_per_sheet = layout.cards_per_sheet
     if not os.path.exists(output_path):
         os.mkdir(output_path)
-    total = 1
     if not arguments['title']:
         card_title = ""
     else:
@@ -460,13 +193,20 @@ def create_card(arguments):
     open_head = '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">'
     open_style = "<style>"
     if not arguments['logo'] or arguments['logo'] == '':
-        selected_logo = 'url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAACgAAAAyCAYAAAAus5mQAAAABmJLR0QAAABxAK/qGQdhAAAACXBIWXMAAA7DAAAOwwHHb6hkAAAR4ElEQVRYw81ZaZgU1bl+q7qqeqnee3p69n0GZoMBhh0ElEUGUUEMKBhQk5gYDSEGvUluNpN4Ta5LNKKicQkkcQkgi8ggkgEHGGZhmH3fp6ent+l9ra4lP7iPXh/jFaLeJ+d31Tnveb/3/c53zkfgSxxN9ecJU6xZMz4RCF1350/EL2NO8ssCNzk8RrCJ8WVC0H0qLT/v5mNvvUv8WwH0hhMAFygNh8NJBBdOo+Vy/FsA7O7uIAGgpCxfCoQ9o35BnjnS3+G68dZVEgBcvnCG6u9q+pfZ/Jd+rL94QU6I0TyDTn99wOeamZyec2JybLQpNNawNzHesZbXpdVYKrds1bKy+bFwYJ2KZds5gawW4+Jo2dz58a8U4PvVhxiLOW0ZN1n/uIJ39xMy2hPjyPlhOn1ccvXO1FGhnCC0g6Iur0lDuPMYmrmk1DCacJwpoIzlj3ntk9VLqjZyX1mIjVqzWfL2/EwTHnh90CZtLVv/s/tJkVivnzrbKBet9oRAgvB2ezTO2g4jI6sqr/rBd9Rs+XZWkXgtMt70kDE9K/krZbCx9uRdlKvuoZF+dhVz4E1KlpO9XeaYnO81GP5GVqYnp0/PfDrgFXcGTzRNqR32rwX1xg4MDTxveGi3aNSNHTeUbfx5bsncY1e7HnWtAEOhIKXhEnSkpvplw8joWjgniAQfp9lJ/63j1gyk/OhejO599RntZSuQZ4FuoP8mIso/Mnns8Ie628uYUDROfqUuNhhTjkXkGT63MHrThNfL+LK1dOyuRXCUmBGKEIg2HYc/LCA0PRWK+9fARodJazQuS7C+5aSx3MMoNeeuZb1rZtCckuKxXX73rdL5mYtGdRZkr8gGJxFg75gHo3US2oJ5mF7VBlNRCSLuIRT9eDtaD9XDoo4TCb/toJFa7P1KGUzPLhAF7bSTptK5cUMSh7aDDYja7eg424PxThe4wCCGm+2oP1SDQJxGw5tnYEglkDlrVsQnGY+aiwqv6QiUXSvA2rMjRCjiCMYHmjKEsHM2DEZYspRIm1EINoUBa9ZBX5SNoqUVoKQIRIaBURWEkiHfdKdv3L9u3Qbp8DtvfvkMvv3H32bVfnCSNSvOVpRYhp4iTZkRNRuSMrNVsHljEPQ5SJm9DK/U0tBY0hElVXD4YshKI6FK1iKaXslnTbzybInr5LymM8fY9//2bO6XxmDz2ddTM9W21zzv/HG3IU9ZqONdO0ZPt3g9QZbJmrdMn1qyAEGOQU7FapiSLMiYVglGZYZCaYA+KQvuIV99RkUyk6YXt9h7BvTZpfi13GNdtnX1ypOvvHsu9IVNYvfSsUW5isJYBpuTrMW0vneaJeWMm2LFK9YmTU1OQEURMMqG4Dj/NpISHKJhNQi5DnplEiRTOfK2ryzydR85mVmkQbIxcptOIRKT7c1RoWR79Aslap+7l3BNjOsGWxt0BSn+TZqE8wmeA0JuNxL5y0XXpS5SmxiFKxTH2LAV9jCBMCioCAHJSh7ZhXlIkgkQsioRtw2IhbkCSbJ6iAKBzmb/D3M23XsgmtBOhSOa8KLlc6VrZrC7o8ucqR15QzvygTmgWPYIm5J6ynGhfgVdMo+S2YbJtuZzOGDl0S5jECWU/0vQFKSAHJTdjlIhgc15p1B14wLSEY1DzXtELkIf1s5dMqZNdFU7jlRPkDM33QHAddUAu84ckQVttS+ZZT28muJLFVw4mWb5m0O8MaKeszxmbTyn/s2JfpyjFCApGfQAlmsJ9PsFDBHkR6ERCAJtFIOWMQHvvFCDHy1NR/6COULAbU/EO9vW6fLzC+mII9WS4n2q/fgvAwEu5YHFG+6TPtfFjc1dhnBjbZVadH2LlissCrOOSE8lvk3J+Ft6ak+qv1E9gguU4qOfi1gSv7y7HPsfnIU1hk/u+Xo9gxkKCk0yBt+qtePSqRo6KT95M22t2R4P+mRJOWadgQls41rOrYK2kL0qFx8+eTqyperWulDzhzfrMlNYcGH4pWSMN57BN2qccJKf3NdEQkJjiwvrFxXh+socnL80ATd/JR/fVmTE3asL0XbZiTGSQI09gWUqH8yzlgKecSh1atib+8dciZQty+/ZPXJVAC+feW3hlNsXMJUV2PyjVrdX0E5TE1HqwbdaMAwZ1IIIPyeAJwmQBAESgEOQUHtpAvEpDhsWF+J8zySiElDOMth080IcPNWOSQngCAItw0FsnW+GmzP6pWjszzFzwXEyu2hsy/LZBfvfPT/6f4bYafdQJk342Wyhp84+GApTeQWsOSeTeefI+2gBjQVqCr+/pQCDv1qBht2r8KfNy/DrGyqxc04RytPy0RM04NQlB+6dmQUCgDMsIBInYCM+Thi9BIWDJ+uRlKZlB1u8cjYpky9O52vo7r8//srujfRnmmSi95ys5YNn55cXq4dTytIq6XHnM1qVWhmyBbB3jIJEAwuyVFBrWNT3BjHpdOL1v3dj7ZL1uPveXUhJNsPz4TmoFyzA0FA/xv0v4sRQD5panYhKBICP9f9iP4mNiQClgusuub9jYzBAqmQaizW7pHShe/Thc0nZC8RPAbS1nFtaqrO/oRQNRiZVj7jToUyEougf7MEkTYMA8PuuANDVDgBgBAkPr9+K733nPsgZBn2//R3sx6uRt/N+zNm0CZa0DIzufgiDVi9C4hVNlsopyAigJQb0DLmQMasMag3Dulp7UbKyYlMsHl462n5xJYCOT2mw1JIqKHs7p/nbmnMJkpAnQHNgtfGG9j76tEP4hBQKlCpsLinB93c9jGhnJxzvVSM6PIapoyegmz8PgcEhJGVnoLCwGLXnT6PFG0AhBbz63UoEA3E0OsIo11Aom1kixn0BgaEI0t4+5He0244OhVIPHTp9NvopBr+/Z/94c+3fd9jbTq6RUeGMCKGcma3Gjq7RAIAr91wJwLr0JKxfUIEgsqDRaDDcN4jhBx8GSZEQSBIT//U7JDx+qC/WYOaMMrz1lgYpJIFnd1RAQVM40+EGAAyMOUEp5WRjbXTvtKKM7jFNcU/66qq6rQuXhT7TJGTf0Ttmz1Y9py+YISucprxFrlJS9gT9UfLdWZGFn359Id54/wL0JhMACWk3rYXhgfsQ4QWESAlRXxAZTz8OQ2kxFAo5rL44qrLUsJhVeOZgB1r/J9zeKA+GFsAOntpqLMjiFi5Uvp7oOPa1zzTJ3/Y8LgsPvL84GKLSkpcv/pUgQRkTGGgUDBDmsd7M4of3rERjmxUd4Rj4eOzKJGoWlm/uQEAtBzdug0ohR8rGDSAZOWLhCJiYB0sXpuJ7zzfhnD/+ESsqWoZEnINCq9VoFaGnbGeblNGJ4Lw3X35635Zv7uI/pcFdP3kc2aXKmH/cOoefHMlQZ6SS/ikfXCEJH457cM+yQjAUg2+9dApuQUB6JIilS1bjiaf/gMdefRFOjGAQQbQyPPbsfwcWnQkyXsJo+zG80GhHZ+yTOr6lJANFFjlSMlMIf/8YzZNUi3Jh1T5TwY2de1/c8+kQk6HmhYRv9K20aeYSmubhaW1DyOEO52ZZAADvXhjEt/9wHDaeB00ABrUHbx8+gjhIDPN+LMg0on7Mj0KNiM6AGx6vHy/vexkvjUQwIX2ycJIAFOTkQgyHOD4UhkonQ0ZJyiyzaN0jeZvL/2mIo2Rhfe+pI3sZ3p6uK8gokBRpf3X5px4uzk1h5aKEWv/HrxZsQoBRLcNP9j+H327/LhpeOABGimH17VFIFIvVt0fw0l9fw4nORsw1GUASIiAJGAnEYBMEsLyIGSW56Dj+3nBmXtY+RTSy3tFja/BzsUDBfzzWAWz77Hrw2KHnFEaGX0uCT2SZvAfjUx7m6ROD+GOX9aNvrmMpPPfDNdj8aDUckoA7S8sgKi3QaTSIRwJIxKeQpJOjtFCPipk5gMjD6XTjx8+fxhlvGA/OnoH7VqRh/OC+UHzR179OG7TJAtg/r9q0O/y55RZr69ueW6J+UmlS+uQKFdHV3oO7bijG4V4b3MIVBxZn6mFJZqFXyNAdFdA2MYwNS4w4UluDWr8fIUkCmxCQV0thul4JllWhftiFYYpEGkjcuWomBo++An1OrqJ8jvbVqMsn7+iZcgM4+LnFwqa5M9ICZ07cmPAFU2mNRqY0qBAatUszp+cQRzsnQBAAFYhhxewMfHBxCCOciNFYAtkKCr+4/wYUqXU40zMGgSLhkYC+KI/OQBQ+kgAD4LkdG6B19gpJ6XrSVFRAWmvqFJPN/cOSpeIv+987O/65AF86fbQ/Lo/IWTV3XdwxSUqhmNcaUncXWZjUHD2Lk4Mu2EXAFA6i3eqHXbyilGaHF/myGK5fMg2Ls82obRtHRPr4/JVJwJO3VaFCw2FgPFhn1pImUogx8uxUjqlY8eiiLT89eFXXTk+fnUHQvcE7MElNNPRxYZ7+S/7c6ecotQyrMlV4edNiJBEEft3kwGWe+IQz/7O6F/f9/AAmrU4k0R9PnyWj8cr2jVicLGH04AuQ2z31Xj8O9L7XwDtaR2gx4FkzaXPIrqrkF2Uc19/CPEW8WP8XQgQhzV52ndHvmcjPS5VGglGimA9IB3euJ/50uhVvt48hAOkjt0UJAhc5HnXvd155ywGwtSwLd61bDr6nURz/4AyZXFQiKpbMLRm80JMpHpokXbRTSuzIf7kylxev6lZXP9hJWPc+fAF1bQs0i4uRkpOM1AId5GoGoUgM1uEIF/Yx1XoLURVRqqjL3RM42TiM0WAMkiSBgIRsjRxrZmejojgNLJfAhDXWnJTCFphNpNaglyMWlDDY2IGYxCB4sQ9i5ex9m37z9varAnh4zy8KLBMnOmVmI5NRlOofrBlpVFNhC6mKl18OJqPdwYEkJAASeF4ECBIkSYKmCEiiCAhxcDwgCABBUqDkckBIgJdIXJcnx9xSI0bqhlslubGz6Prsm4e6J9R8f0skULkrZ/09u1yfq0HW1nm7QuZjFHoGQU61J2nbj+/U37SSMs2cA78/jtYhF3xxAVNREVNREXZ/DDZPCKSKgTsuIkgoYQ+LcMQBY6YBx850ISnLhGf+egnxqAiRpJB+2yrJN/+B77hC5CEtK0Kjk6tkPbV3XJVJaAJzFAYT9Col4hK5sOfyxaJg75C1r6bjrEgxAUEC5AoKpiQNtGoGcqUSDi+HYISDSBAoyjODoChotSooaBm23T4HoRAHEAR4iK6BDzvPujvGxslwyyxGTswypyVDk5mNeGBs+lWZJEqpDqjMlg20UkVmWbQrTGn8G0PW/LvNd2xulO17ts81FdYmspIwPGqDnBYRCAuYmgqjf0CC0xvGQP8kaBmJQJRH3SUJkiRCp1YAtAwkLfOIi3avoZj2tQtSuQMq2pzEeaYQ0WgFPr3gXaDp8zUoSRLR9Op3X8otYO9VmEzEwLgHIh9PaHSG4z117Us5QjmV4OKyOJewyMSoWuAFUZWcMU5CFMALgChAEEUqASITiSghJXi3giH8ECVSJonK9NklzRTB31hWkk1ClBANeMWBsdgTczY++chVMUgQhPTaq/se0GJqxCDhkVCE0+h1Stpud9867/pybsIpXoiL8rcnbYFCbWg40945MNlT/NRv1PnlAqG+su1wZwezxvLBL2OOSX1ze+DivMoUMUmv2eZw2ZboTIaqzo5BGI1emIxa35CD/Jk97QfPA09e+yt/Q/UTSzJSqWfiEd/sS00DULAqlM+YBokPwWbzRsyW9Eaf196qYg3dNpvfFgpNRLWsikrPzMzmYpEZsZhQQpPhhV5/nMkvzEVD8yjSUnRQMASUjOJDm4f+wcrNP7/0hdoQredPKTlf3T06JbfTZvcUlJTlE8PjLtAkIAgCFCoKbZeHcNuGJdLImBNO9xQIkScoRgmNRolENAaRoKBUMFCzCpFLoMvplf23fYp6Y+PdjyS+tD7J0T89x2aZfav0WnwjkkjMV8hJkyQKRN/wFLiEhHWrZ2Fg0IZI0A+GphGMJTAtx4ThEaeYmaZ3TTgjdWFO/8KIQ3V227d3XVVL7F9u8v35D79KKcgIV+bkphUE/L45jIzPs6QYyFiMh5jgEAqGBZs9OJhbmNXQ2jw27AoZGrftfNT1/9JM/Gdjy3sSOW8AKJ4JHD4CWO4BHi0jvnBT+x8+c0PISk6iJwAAAABJRU5ErkJggg==);'
+        logo_uri = 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAACgAAAAyCAYAAAAus5mQAAAABmJLR0QAAABxAK/qGQdhAAAACXBIWXMAAA7DAAAOwwHHb6hkAAAR4ElEQVRYw81ZaZgU1bl+q7qqeqnee3p69n0GZoMBhh0ElEUGUUEMKBhQk5gYDSEGvUluNpN4Ta5LNKKicQkkcQkgi8ggkgEHGGZhmH3fp6ent+l9ra4lP7iPXh/jFaLeJ+d31Tnveb/3/c53zkfgSxxN9ecJU6xZMz4RCF1350/EL2NO8ssCNzk8RrCJ8WVC0H0qLT/v5mNvvUv8WwH0hhMAFygNh8NJBBdOo+Vy/FsA7O7uIAGgpCxfCoQ9o35BnjnS3+G68dZVEgBcvnCG6u9q+pfZ/Jd+rL94QU6I0TyDTn99wOeamZyec2JybLQpNNawNzHesZbXpdVYKrds1bKy+bFwYJ2KZds5gawW4+Jo2dz58a8U4PvVhxiLOW0ZN1n/uIJ39xMy2hPjyPlhOn1ccvXO1FGhnCC0g6Iur0lDuPMYmrmk1DCacJwpoIzlj3ntk9VLqjZyX1mIjVqzWfL2/EwTHnh90CZtLVv/s/tJkVivnzrbKBet9oRAgvB2ezTO2g4jI6sqr/rBd9Rs+XZWkXgtMt70kDE9K/krZbCx9uRdlKvuoZF+dhVz4E1KlpO9XeaYnO81GP5GVqYnp0/PfDrgFXcGTzRNqR32rwX1xg4MDTxveGi3aNSNHTeUbfx5bsncY1e7HnWtAEOhIKXhEnSkpvplw8joWjgniAQfp9lJ/63j1gyk/OhejO599RntZSuQZ4FuoP8mIso/Mnns8Ie628uYUDROfqUuNhhTjkXkGT63MHrThNfL+LK1dOyuRXCUmBGKEIg2HYc/LCA0PRWK+9fARodJazQuS7C+5aSx3MMoNeeuZb1rZtCckuKxXX73rdL5mYtGdRZkr8gGJxFg75gHo3US2oJ5mF7VBlNRCSLuIRT9eDtaD9XDoo4TCb/toJFa7P1KGUzPLhAF7bSTptK5cUMSh7aDDYja7eg424PxThe4wCCGm+2oP1SDQJxGw5tnYEglkDlrVsQnGY+aiwqv6QiUXSvA2rMjRCjiCMYHmjKEsHM2DEZYspRIm1EINoUBa9ZBX5SNoqUVoKQIRIaBURWEkiHfdKdv3L9u3Qbp8DtvfvkMvv3H32bVfnCSNSvOVpRYhp4iTZkRNRuSMrNVsHljEPQ5SJm9DK/U0tBY0hElVXD4YshKI6FK1iKaXslnTbzybInr5LymM8fY9//2bO6XxmDz2ddTM9W21zzv/HG3IU9ZqONdO0ZPt3g9QZbJmrdMn1qyAEGOQU7FapiSLMiYVglGZYZCaYA+KQvuIV99RkUyk6YXt9h7BvTZpfi13GNdtnX1ypOvvHsu9IVNYvfSsUW5isJYBpuTrMW0vneaJeWMm2LFK9YmTU1OQEURMMqG4Dj/NpISHKJhNQi5DnplEiRTOfK2ryzydR85mVmkQbIxcptOIRKT7c1RoWR79Aslap+7l3BNjOsGWxt0BSn+TZqE8wmeA0JuNxL5y0XXpS5SmxiFKxTH2LAV9jCBMCioCAHJSh7ZhXlIkgkQsioRtw2IhbkCSbJ6iAKBzmb/D3M23XsgmtBOhSOa8KLlc6VrZrC7o8ucqR15QzvygTmgWPYIm5J6ynGhfgVdMo+S2YbJtuZzOGDl0S5jECWU/0vQFKSAHJTdjlIhgc15p1B14wLSEY1DzXtELkIf1s5dMqZNdFU7jlRPkDM33QHAddUAu84ckQVttS+ZZT28muJLFVw4mWb5m0O8MaKeszxmbTyn/s2JfpyjFCApGfQAlmsJ9PsFDBHkR6ERCAJtFIOWMQHvvFCDHy1NR/6COULAbU/EO9vW6fLzC+mII9WS4n2q/fgvAwEu5YHFG+6TPtfFjc1dhnBjbZVadH2LlissCrOOSE8lvk3J+Ft6ak+qv1E9gguU4qOfi1gSv7y7HPsfnIU1hk/u+Xo9gxkKCk0yBt+qtePSqRo6KT95M22t2R4P+mRJOWadgQls41rOrYK2kL0qFx8+eTqyperWulDzhzfrMlNYcGH4pWSMN57BN2qccJKf3NdEQkJjiwvrFxXh+socnL80ATd/JR/fVmTE3asL0XbZiTGSQI09gWUqH8yzlgKecSh1atib+8dciZQty+/ZPXJVAC+feW3hlNsXMJUV2PyjVrdX0E5TE1HqwbdaMAwZ1IIIPyeAJwmQBAESgEOQUHtpAvEpDhsWF+J8zySiElDOMth080IcPNWOSQngCAItw0FsnW+GmzP6pWjszzFzwXEyu2hsy/LZBfvfPT/6f4bYafdQJk342Wyhp84+GApTeQWsOSeTeefI+2gBjQVqCr+/pQCDv1qBht2r8KfNy/DrGyqxc04RytPy0RM04NQlB+6dmQUCgDMsIBInYCM+Thi9BIWDJ+uRlKZlB1u8cjYpky9O52vo7r8//srujfRnmmSi95ys5YNn55cXq4dTytIq6XHnM1qVWhmyBbB3jIJEAwuyVFBrWNT3BjHpdOL1v3dj7ZL1uPveXUhJNsPz4TmoFyzA0FA/xv0v4sRQD5panYhKBICP9f9iP4mNiQClgusuub9jYzBAqmQaizW7pHShe/Thc0nZC8RPAbS1nFtaqrO/oRQNRiZVj7jToUyEougf7MEkTYMA8PuuANDVDgBgBAkPr9+K733nPsgZBn2//R3sx6uRt/N+zNm0CZa0DIzufgiDVi9C4hVNlsopyAigJQb0DLmQMasMag3Dulp7UbKyYlMsHl462n5xJYCOT2mw1JIqKHs7p/nbmnMJkpAnQHNgtfGG9j76tEP4hBQKlCpsLinB93c9jGhnJxzvVSM6PIapoyegmz8PgcEhJGVnoLCwGLXnT6PFG0AhBbz63UoEA3E0OsIo11Aom1kixn0BgaEI0t4+5He0244OhVIPHTp9NvopBr+/Z/94c+3fd9jbTq6RUeGMCKGcma3Gjq7RAIAr91wJwLr0JKxfUIEgsqDRaDDcN4jhBx8GSZEQSBIT//U7JDx+qC/WYOaMMrz1lgYpJIFnd1RAQVM40+EGAAyMOUEp5WRjbXTvtKKM7jFNcU/66qq6rQuXhT7TJGTf0Ttmz1Y9py+YISucprxFrlJS9gT9UfLdWZGFn359Id54/wL0JhMACWk3rYXhgfsQ4QWESAlRXxAZTz8OQ2kxFAo5rL44qrLUsJhVeOZgB1r/J9zeKA+GFsAOntpqLMjiFi5Uvp7oOPa1zzTJ3/Y8LgsPvL84GKLSkpcv/pUgQRkTGGgUDBDmsd7M4of3rERjmxUd4Rj4eOzKJGoWlm/uQEAtBzdug0ohR8rGDSAZOWLhCJiYB0sXpuJ7zzfhnD/+ESsqWoZEnINCq9VoFaGnbGeblNGJ4Lw3X35635Zv7uI/pcFdP3kc2aXKmH/cOoefHMlQZ6SS/ikfXCEJH457cM+yQjAUg2+9dApuQUB6JIilS1bjiaf/gMdefRFOjGAQQbQyPPbsfwcWnQkyXsJo+zG80GhHZ+yTOr6lJANFFjlSMlMIf/8YzZNUi3Jh1T5TwY2de1/c8+kQk6HmhYRv9K20aeYSmubhaW1DyOEO52ZZAADvXhjEt/9wHDaeB00ABrUHbx8+gjhIDPN+LMg0on7Mj0KNiM6AGx6vHy/vexkvjUQwIX2ycJIAFOTkQgyHOD4UhkonQ0ZJyiyzaN0jeZvL/2mIo2Rhfe+pI3sZ3p6uK8gokBRpf3X5px4uzk1h5aKEWv/HrxZsQoBRLcNP9j+H327/LhpeOABGimH17VFIFIvVt0fw0l9fw4nORsw1GUASIiAJGAnEYBMEsLyIGSW56Dj+3nBmXtY+RTSy3tFja/BzsUDBfzzWAWz77Hrw2KHnFEaGX0uCT2SZvAfjUx7m6ROD+GOX9aNvrmMpPPfDNdj8aDUckoA7S8sgKi3QaTSIRwJIxKeQpJOjtFCPipk5gMjD6XTjx8+fxhlvGA/OnoH7VqRh/OC+UHzR179OG7TJAtg/r9q0O/y55RZr69ueW6J+UmlS+uQKFdHV3oO7bijG4V4b3MIVBxZn6mFJZqFXyNAdFdA2MYwNS4w4UluDWr8fIUkCmxCQV0thul4JllWhftiFYYpEGkjcuWomBo++An1OrqJ8jvbVqMsn7+iZcgM4+LnFwqa5M9ICZ07cmPAFU2mNRqY0qBAatUszp+cQRzsnQBAAFYhhxewMfHBxCCOciNFYAtkKCr+4/wYUqXU40zMGgSLhkYC+KI/OQBQ+kgAD4LkdG6B19gpJ6XrSVFRAWmvqFJPN/cOSpeIv+987O/65AF86fbQ/Lo/IWTV3XdwxSUqhmNcaUncXWZjUHD2Lk4Mu2EXAFA6i3eqHXbyilGaHF/myGK5fMg2Ls82obRtHRPr4/JVJwJO3VaFCw2FgPFhn1pImUogx8uxUjqlY8eiiLT89eFXXTk+fnUHQvcE7MElNNPRxYZ7+S/7c6ecotQyrMlV4edNiJBEEft3kwGWe+IQz/7O6F/f9/AAmrU4k0R9PnyWj8cr2jVicLGH04AuQ2z31Xj8O9L7XwDtaR2gx4FkzaXPIrqrkF2Uc19/CPEW8WP8XQgQhzV52ndHvmcjPS5VGglGimA9IB3euJ/50uhVvt48hAOkjt0UJAhc5HnXvd155ywGwtSwLd61bDr6nURz/4AyZXFQiKpbMLRm80JMpHpokXbRTSuzIf7kylxev6lZXP9hJWPc+fAF1bQs0i4uRkpOM1AId5GoGoUgM1uEIF/Yx1XoLURVRqqjL3RM42TiM0WAMkiSBgIRsjRxrZmejojgNLJfAhDXWnJTCFphNpNaglyMWlDDY2IGYxCB4sQ9i5ex9m37z9varAnh4zy8KLBMnOmVmI5NRlOofrBlpVFNhC6mKl18OJqPdwYEkJAASeF4ECBIkSYKmCEiiCAhxcDwgCABBUqDkckBIgJdIXJcnx9xSI0bqhlslubGz6Prsm4e6J9R8f0skULkrZ/09u1yfq0HW1nm7QuZjFHoGQU61J2nbj+/U37SSMs2cA78/jtYhF3xxAVNREVNREXZ/DDZPCKSKgTsuIkgoYQ+LcMQBY6YBx850ISnLhGf+egnxqAiRpJB+2yrJN/+B77hC5CEtK0Kjk6tkPbV3XJVJaAJzFAYT9Col4hK5sOfyxaJg75C1r6bjrEgxAUEC5AoKpiQNtGoGcqUSDi+HYISDSBAoyjODoChotSooaBm23T4HoRAHEAR4iK6BDzvPujvGxslwyyxGTswypyVDk5mNeGBs+lWZJEqpDqjMlg20UkVmWbQrTGn8G0PW/LvNd2xulO17ts81FdYmspIwPGqDnBYRCAuYmgqjf0CC0xvGQP8kaBmJQJRH3SUJkiRCp1YAtAwkLfOIi3avoZj2tQtSuQMq2pzEeaYQ0WgFPr3gXaDp8zUoSRLR9Op3X8otYO9VmEzEwLgHIh9PaHSG4z117Us5QjmV4OKyOJewyMSoWuAFUZWcMU5CFMALgChAEEUqASITiSghJXi3giH8ECVSJonK9NklzRTB31hWkk1ClBANeMWBsdgTczY++chVMUgQhPTaq/se0GJqxCDhkVCE0+h1Stpud9867/pybsIpXoiL8rcnbYFCbWg40945MNlT/NRv1PnlAqG+su1wZwezxvLBL2OOSX1ze+DivMoUMUmv2eZw2ZboTIaqzo5BGI1emIxa35CD/Jk97QfPA09e+yt/Q/UTSzJSqWfiEd/sS00DULAqlM+YBokPwWbzRsyW9Eaf196qYg3dNpvfFgpNRLWsikrPzMzmYpEZsZhQQpPhhV5/nMkvzEVD8yjSUnRQMASUjOJDm4f+wcrNP7/0hdoQredPKTlf3T06JbfTZvcUlJTlE8PjLtAkIAgCFCoKbZeHcNuGJdLImBNO9xQIkScoRgmNRolENAaRoKBUMFCzCpFLoMvplf23fYp6Y+PdjyS+tD7J0T89x2aZfav0WnwjkkjMV8hJkyQKRN/wFLiEhHWrZ2Fg0IZI0A+GphGMJTAtx4ThEaeYmaZ3TTgjdWFO/8KIQ3V227d3XVVL7F9u8v35D79KKcgIV+bkphUE/L45jIzPs6QYyFiMh5jgEAqGBZs9OJhbmNXQ2jw27AoZGrftfNT1/9JM/Gdjy3sSOW8AKJ4JHD4CWO4BHi0jvnBT+x8+c0PISk6iJwAAAABJRU5ErkJggg=='
+    else:
+        logo_uri = convert_logo(arguments['logo'])
+    github_icon = 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AcxV9TpSIVETuIOASsThbEijhKFYtgobQVWnUwufQLmjQkKS6OgmvBwY/FqoOLs64OroIg+AHi6uKk6CIl/i8ptIjx4Lgf7+497t4BQqPCVLNrElA1y0jFY2I2tyoGXiHAjwGMIioxU0+kFzPwHF/38PH1LsKzvM/9OfqUvMkAn0g8x3TDIt4gntm0dM77xCFWkhTic+IJgy5I/Mh12eU3zkWHBZ4ZMjKpeeIQsVjsYLmDWclQiaeJw4qqUb6QdVnhvMVZrdRY6578hcG8tpLmOs0RxLGEBJIQIaOGMiqwEKFVI8VEivZjHv5hx58kl0yuMhg5FlCFCsnxg//B727NQnTKTQrGgO4X2/4YAwK7QLNu29/Htt08AfzPwJXW9lcbwOwn6fW2Fj4C+reBi+u2Ju8BlzvA0JMuGZIj+WkKhQLwfkbflAMGb4HeNbe31j5OH4AMdbV8AxwcAuNFyl73eHdPZ2//nmn19wOfLXK54rfCmAAAAAlwSFlzAAA3XQAAN10BGYBGXQAAA8hJREFUWMPVmE1oVUcUx3/vkkXc1GxMFsaNtgubB360wY9CqA3YLEpAUHGhVyJXL6KC2grVgJ/oRrC1BMLIqDAtKBJQESRGJHRjlGK1kOjC6MKsEjfqps8u8tycF4ebd+fe93HVDrzFuzN37m9mzvnPOQc+8Zar9kWjVROwEugAPgdagc+k+w0wATwG7gP3/CB8lTmg0SoHrAc2A2uBxpSvFoAh4A9gwA/CYl0BLbDDQL7GUxsFjqcFzaWAWwCcA7rqbF6DwA4/CCeqBjRarQEuA80Z+cAUsMkPwuGKAY1WXcDVCuys2lYA1vlBOJga8APCJULmysDlgb8+IJwN2e4H4aj90IvANQKXysC9Ar4GtgO3gGKVEHeB3TLXeKSvEbgkDDOtITJoX4yM3PaD8AHwANCyy78Ba4BJ4AnwUn5vRbTnAYvFwR4CP9nOYLQaEoG3W16k7NAsQJGTwzErH7P/+EE4arTqBBYBz+L0TPSzFXjpB2HBNae9SUar/pL8NER2L7XdCdR4ijFxOvdfzPNGYdk/Y4Ny7j2Ob7Vl4BRfOvp6SrZYcpK1QJPjhWIGgK45m4RpBrA7Qe3DDAB7gaeO/m4bsMMx8NdqQ6UE+ywAJxxDOgA8o5Un3hh3DAMZivMNx1EvMlrN8USrPAfgs6zo5GTi5veAhV7CHE/8IJzO+Ip76+pMAlwsJvDRWtLHc1aeUfcmN838WgGXZrhBC4C5ruP35KJ32dn3GQL+4Aiap4HnnjjBI8ck24xWczM63p2OIY/8IJwuHfGIY2AzcCqD3fs5IUMcsW0wSYx3Gq0OyqrrsXu7gJMJwwZswD+BF2VsoGg5yyngptHqqxrA8kara0BfQkb5QpjeDzJaHQGOWjdIh1zmp4EtkQn+lgkeAiN+EI7HALUCq4EVwLfAspTFgqN+EB6LBqxngb0S6uSA25I/bJV+G3K5/ApAe4JMnUuQknLR09lZOij3Ym8ksu2TYHWPlCxm2Uk0C4vctRPAhQot4ZAdPUWFuh8YjkCe9oPwNdAJXAH+FfscA86n+OC9CuCGowsqlxe3AP8ALZY9tktWR+luThtEGK02yMKS2iSwxA/CyTSVhTxwx6rJTElOfMPO4IxWuaQKVUrAKaCznLk0xNhOKa0sQTYD14FJo9VzCZHmidfXGtDGwjmDBXnhm4hztACrRDLaqKFCa9UKv3M5mpcQ8Y6LjJwRSalnRveL2PaYa2BDyuTmR6PVRak8rK9h54pS2zng2rWKACNHvtFo9YUk+a2l6yihDQG/S93mYlqw/017B09eQK3tE7jIAAAAAElFTkSuQmCC'
+    if arguments.get('shared_assets'):
+        logo_url = save_image(logo_uri, f'{output_path}bingo-logo')
+        github_url = save_image(github_icon, f'{output_path}bingo-github')
     else:
-        selected_logo = f"url({convert_logo(arguments['logo'])});"
+        logo_url = logo_uri
+        github_url = github_icon
     page_css = '''
 :root {
-  --logo: ''' + selected_logo + '''
-  --github: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAABhGlDQ1BJQ0MgcHJvZmlsZQAAKJF9kT1Iw0AcxV9TpSIVETuIOASsThbEijhKFYtgobQVWnUwufQLmjQkKS6OgmvBwY/FqoOLs64OroIg+AHi6uKk6CIl/i8ptIjx4Lgf7+497t4BQqPCVLNrElA1y0jFY2I2tyoGXiHAjwGMIioxU0+kFzPwHF/38PH1LsKzvM/9OfqUvMkAn0g8x3TDIt4gntm0dM77xCFWkhTic+IJgy5I/Mh12eU3zkWHBZ4ZMjKpeeIQsVjsYLmDWclQiaeJw4qqUb6QdVnhvMVZrdRY6578hcG8tpLmOs0RxLGEBJIQIaOGMiqwEKFVI8VEivZjHv5hx58kl0yuMhg5FlCFCsnxg//B727NQnTKTQrGgO4X2/4YAwK7QLNu29/Htt08AfzPwJXW9lcbwOwn6fW2Fj4C+reBi+u2Ju8BlzvA0JMuGZIj+WkKhQLwfkbflAMGb4HeNbe31j5OH4AMdbV8AxwcAuNFyl73eHdPZ2//nmn19wOfLXK54rfCmAAAAAlwSFlzAAA3XQAAN10BGYBGXQAAA8hJREFUWMPVmE1oVUcUx3/vkkXc1GxMFsaNtgubB360wY9CqA3YLEpAUHGhVyJXL6KC2grVgJ/oRrC1BMLIqDAtKBJQESRGJHRjlGK1kOjC6MKsEjfqps8u8tycF4ebd+fe93HVDrzFuzN37m9mzvnPOQc+8Zar9kWjVROwEugAPgdagc+k+w0wATwG7gP3/CB8lTmg0SoHrAc2A2uBxpSvFoAh4A9gwA/CYl0BLbDDQL7GUxsFjqcFzaWAWwCcA7rqbF6DwA4/CCeqBjRarQEuA80Z+cAUsMkPwuGKAY1WXcDVCuys2lYA1vlBOJga8APCJULmysDlgb8+IJwN2e4H4aj90IvANQKXysC9Ar4GtgO3gGKVEHeB3TLXeKSvEbgkDDOtITJoX4yM3PaD8AHwANCyy78Ba4BJ4AnwUn5vRbTnAYvFwR4CP9nOYLQaEoG3W16k7NAsQJGTwzErH7P/+EE4arTqBBYBz+L0TPSzFXjpB2HBNae9SUar/pL8NER2L7XdCdR4ijFxOvdfzPNGYdk/Y4Ny7j2Ob7Vl4BRfOvp6SrZYcpK1QJPjhWIGgK45m4RpBrA7Qe3DDAB7gaeO/m4bsMMx8NdqQ6UE+ywAJxxDOgA8o5Un3hh3DAMZivMNx1EvMlrN8USrPAfgs6zo5GTi5veAhV7CHE/8IJzO+Ip76+pMAlwsJvDRWtLHc1aeUfcmN838WgGXZrhBC4C5ruP35KJ32dn3GQL+4Aiap4HnnjjBI8ck24xWczM63p2OIY/8IJwuHfGIY2AzcCqD3fs5IUMcsW0wSYx3Gq0OyqrrsXu7gJMJwwZswD+BF2VsoGg5yyngptHqqxrA8kara0BfQkb5QpjeDzJaHQGOWjdIh1zmp4EtkQn+lgkeAiN+EI7HALUCq4EVwLfAspTFgqN+EB6LBqxngb0S6uSA25I/bJV+G3K5/ApAe4JMnUuQknLR09lZOij3Ym8ksu2TYHWPlCxm2Uk0C4vctRPAhQot4ZAdPUWFuh8YjkCe9oPwNdAJXAH+FfscA86n+OC9CuCGowsqlxe3AP8ALZY9tktWR+luThtEGK02yMKS2iSwxA/CyTSVhTxwx6rJTElOfMPO4IxWuaQKVUrAKaCznLk0xNhOKa0sQTYD14FJo9VzCZHmidfXGtDGwjmDBXnhm4hztACrRDLaqKFCa9UKv3M5mpcQ8Y6LjJwRSalnRveL2PaYa2BDyuTmR6PVRak8rK9h54pS2zng2rWKACNHvtFo9YUk+a2l6yihDQG/S93mYlqw/017B09eQK3tE7jIAAAAAElFTkSuQmCC);
+  --logo: url(''' + logo_url + ''');
+  --github: url(''' + github_url + ''');
 }
 .clear {
   width: 100%;
@@ -503,7 +243,7 @@ def create_card(arguments):
 }
 .grid-container {
   display: grid;
-  grid-template-columns: auto auto auto;
+  grid-template-columns: ''' + layout.grid_css() + ''';
   grid-gap: 5px;
   grid-template-rows: auto;
   grid-row-gap: 0px;
@@ -720,6 +460,17 @@ select {
 .footer:hover {
   opacity: 1.0;
 }
+'''
+    if arguments.get('sprite_daubers'):
+        page_css = sprite_css(page_css, dauber_colour)
+    merged_css = '''
+.page-break {
+  clear: both;
+  page-break-after: always;
+}
+.page-break:last-child {
+  page-break-after: auto;
+}
 '''
     close_style = "\n</style>\n"
     close_head = "</head>\n"
@@ -744,23 +495,96 @@ select {
         select_box = '\n'
     body_title = f'<div class="card-title">{card_title}</div>'
     footer = '<a href="https://github.com/digitalsleuth/bingo-card-generator" class="footer"></a>'
-    script = '''
-<script src='https://cdnjs.cloudflare.com/ajax/libs/jquery/3.6.3/jquery.min.js'></script>
-<script id='rendered-js' >
-'''
     if arguments['easy']:
         emode = '\nvar easy = true;\n'
     else:
         emode = '\nvar easy = false;\n'
 
+    daubers = json.dumps(['checkmark', 'circle', 'clover', 'heart', 'logo', 'maple-leaf',
+                          'moon', 'square', 'star', 'unicorn', 'x-mark'])
     js_array = "$i = ["
     for card_num in range(1, (cards_per_sheet + 1)):
         js_array = js_array + str(f"$card{card_num}, ")
     js_array = f'\n{js_array.rstrip(", ")}]\n'
 
-    js1 = '''
+    if arguments.get('offline'):
+        script = '''
+<script id='rendered-js' >
+'''
+        js1 = '''
+document.addEventListener('DOMContentLoaded', function() {
+  var idArray = [];
+  var daubers = ''' + daubers + ''';
+  var dauberSelect = document.querySelector('select[name=dauber]');
+  for (var $card = 1; $card <= ''' + str(cards_per_sheet) + '''; $card++) {
+    for (var $x = 0; $x <= 24; $x++) {
+      var numberId = ("card" + $card + "-c" + ($x+1));
+      var number = document.createElement('span');
+      idArray.push(numberId);
+      number.textContent = $i[($card - 1)][$x];
+      document.getElementById(numberId).appendChild(number);
+    }
+  }
+
+function toggle(id) {
+  var element = document.getElementById(id);
+  var dauberChoice = null;
+  if (dauberSelect) {
+    if (dauberSelect.selectedIndex > 0)
+      { dauberChoice = dauberSelect.value };
+    dauberSelect.disabled = true;
+  }
+  if (dauberChoice == null)
+    { dauberChoice = "''' + dauber_shape + '''" };
+  element.classList.toggle(dauberChoice);
+};
+
+function easy_mode(clickedNumber) {
+  ($numbers[clickedNumber] || []).forEach(function(cardId) {
+    toggle(cardId);
+  });
+};
+
+function clear_card() {
+  idArray.forEach(function(cardId) {
+    var element = document.getElementById(cardId);
+    daubers.forEach(function(dauber) {
+      element.classList.remove(dauber);
+    });
+  });
+  if (dauberSelect) {
+    dauberSelect.disabled = false;
+    dauberSelect.selectedIndex = 0;
+  }
+};
+'''
+        js2 = '''
+  Array.prototype.forEach.call(document.querySelectorAll('.number'), function(cell) {
+    cell.addEventListener('click', function() {
+      if (easy == true) {
+        var callNumber = (this.innerHTML).replace( /(<([^>]+)>)/ig, '');
+        easy_mode(callNumber);
+      } else { toggle(this.id) };
+    });
+  });
+
+  document.getElementById('clear-card').addEventListener('click', function() {
+    clear_card();
+  });
+});
+'''
+        free_space = ('Array.prototype.forEach.call(document.querySelectorAll(".col-13"), '
+                      f'function(cell) {{ cell.innerHTML = \'<span style="color: {card_colour};'
+                      f' font-weight:bold">FREE</span>\'; }});')
+    else:
+        script = '''
+<script src='https://cdnjs.cloudflare.com/ajax/libs/jquery/3.6.3/jquery.min.js'></script>
+<script id='rendered-js' >
+'''
+        js1 = '''
 $(document).ready(function() {
   var idArray = [];
+  var daubers = ''' + daubers + ''';
   for ($card = 1; $card <= ''' + str(cards_per_sheet) + '''; $card++) {
     for ($x = 0; $x <= 24; $x++) {
 	var numberId = ("card" + $card + "-c" + ($x+1));
@@ -779,183 +603,467 @@ function toggle(id) {
 };
 
 function easy_mode(clickedNumber) {
+  ($numbers[clickedNumber] || []).forEach(function(cardId) {
+    toggle(cardId);
+  });
+};
+
+function clear_card() {
   idArray.forEach(function(cardId) {
-    var currentNumber = ((document.getElementById(cardId)).innerHTML).replace( /(<([^>]+)>)/ig, '');
-    if (currentNumber == clickedNumber)
-	{ toggle(cardId) };
+    var element = document.getElementById(cardId);
+    daubers.forEach(function(dauber) {
+      element.classList.remove(dauber);
+    });
   });
+  $('select[name=dauber]').prop('disabled', false).prop('selectedIndex', 0);
 };
 '''
-    js2 = '''
+        js2 = '''
   $('.number').click(function() {
     if (easy == true) {
   var callNumber = (this.innerHTML).replace( /(<([^>]+)>)/ig, '');
   easy_mode(callNumber);
   } else { toggle(this.id) };
+  });
 
   $('#clear-card').click(function() {
-    location.reload();
-    });
+    clear_card();
   });
 });
-</script>
+'''
+        free_space = (f'$(\".col-13\").html(\'<span style=\"color: {card_colour};'
+                      f' font-weight:bold\">FREE</span>\');')
+    close_script = '''</script>
 
 '''
-    header = ['B', 'I', 'N', 'G', 'O']
-    columns = {1: [1, 6, 11, 16, 21],
-               2: [2, 7, 12, 17, 22],
-               3: [3, 8, 13, 18, 23],
-               4: [4, 9, 14, 19, 24],
-               5: [5, 10, 15, 20, 25]
-              }
+    pending_cards = []
+    colour_name = card_colour.upper().strip("#")
+    first_sheet = int(arguments.get('start_at') or 1)
+    last_sheet = first_sheet + int(arguments['num']) - 1
+    new_series = first_sheet == 1 and not arguments.get('resume')
+    manifest = Manifest(f'{output_path}{colour_name}-manifest.jsonl', reset=new_series)
+    seed = arguments.get('seed')
+    if not new_series and manifest.seed is not None:
+        # Resuming or extending a seeded series keeps drawing its cards from the same seed
+        if seed is not None and seed != manifest.seed:
+            manifest.close()
+            raise ValueError(f'--seed {seed} does not match the seed {manifest.seed} recorded for the '
+                             f'{colour_name} series in {output_path} - leave out --seed to continue it')
+        seed = manifest.seed
+    if seed is not None and seed != manifest.seed:
+        manifest.set_seed(seed)
+    if arguments.get('series_index'):
+        card_index = CardIndex(f'{output_path}bingo-cards.idx')
+    else:
+        card_index = CardIndex()
+    for sheet, sheet_cards in manifest.all_cards():
+        if (first_sheet <= sheet <= last_sheet and
+                not (arguments.get('resume') and len(sheet_cards) == cards_per_sheet)):
+            card_index.discard_all(sheet_cards)
+        else:
+            card_index.add_all(sheet_cards)
+    total = first_sheet
+    merged_dirty = False
+    jobs = max(int(arguments.get('jobs') or 1), 1)
+    merge_pdf = arguments.get('merge_pdf')
+    builtin_pdf = arguments.get('pdf_engine') == 'builtin'
+    if builtin_pdf:
+        from bingo_pdf import print_vector_pdf
+    elif arguments['pdf'] or merge_pdf:
+        from bingo_pdf import print_pdf
+    pages_per_pdf = int(arguments.get('pages_per_pdf') or 0)
+    merged_pages = []
+    pdf_pool = None
+    pdf_jobs = {}
+    pdf_failed = []
+    pdf_count = 0
+    if merge_pdf:
+        arguments['pdf'] = True
+    # The PDF's are printed from a static copy of each sheet with the numbers filled in and the
+    # clear button, dauber selection and scripts left out, piped to wkhtmltopdf over stdin
+    print_footer = ('<div align="center" style="font-family: Roboto Condensed">'
+                    'https://github.com/digitalsleuth/bingo-card-generator</div>')
+    print_free = f'<span style="color: {card_colour}; font-weight:bold">FREE</span>'
+    print_style = f'{open_style}{page_css}{layout.print_css()}{close_style}{close_head}{open_body}'
+    page_head = open_head.encode('utf-8')
+    page_body = (select_box + body_title + card_grid(layout) + footer +
+                 script).encode('utf-8')
+    if arguments.get('shared_assets'):
+        css_name = save_asset(page_css.encode('utf-8'), f'{output_path}bingo', 'css')
+        js_name = save_asset((emode + js1 + free_space + js2).encode('utf-8'), f'{output_path}bingo', 'js')
+        shared_style = f'<link rel="stylesheet" href="{css_name}">\n'
+        shared_script = f"<script src='{js_name}'></script>\n"
+        page_style = (shared_style + close_head + open_body).encode('utf-8')
+        page_tail = (js_array + close_script + shared_script + "</body></html>").encode('utf-8')
+    else:
+        page_style = (open_style + page_css + close_style + close_head + open_body).encode('utf-8')
+        page_tail = (emode + js_array + js1 + free_space + js2 + close_script +
+                     "</body></html>").encode('utf-8')
     if arguments['pdf']:
         print("Generating PDF's, please wait")
-    while total <= int(arguments['num']):
-        filename = f'{output_path}{str(total)}-{(card_colour.upper().strip("#"))}.html'
+        if jobs > 1:
+            pdf_pool = ThreadPoolExecutor(max_workers=jobs)
+    if tracker is not None:
+        for sheet in sorted(manifest.sheets):
+            if sheet < first_sheet:
+                tracker.add_sheet(sheet, manifest.cards(sheet))
+    current_count = 0
+    while total <= last_sheet:
+        if cancelled is not None and cancelled():
+            print(f"Cancelled after {current_count} of {int(arguments['num'])} sheets")
+            for job, _ in pdf_jobs.values():
+                job.cancel()
+            break
+        filename = f'{output_path}{str(total)}-{colour_name}.html'
+        record = manifest.sheets.get(total) if arguments.get('resume') else None
+        if record is not None and record['count'] != cards_per_sheet:
+            record = None
+        record_cards = manifest.cards(total) if record is not None else None
         title = f"<title>CARD {str(total)} </title>\n"
         count = 1
         card_clear = ('<div class="card-number" id="clear-card"><button class="button button-clear">CARD ' +
                       str(total) +
                       ' - CLICK HERE TO CLEAR CARD</button></div>\n')
-        free_space = (f'$(\".col-13\").html(\'<span style=\"color: {card_colour};'
-                      f' font-weight:bold\">FREE</span>\');')
-        html = open(filename, 'w')
-        html.write(open_head)
-        html.write(title)
-        html.write(open_style)
-        html.write(page_css)
-        html.write(close_style)
-        html.write(close_head)
-        html.write(open_body)
-        html.write(card_clear)
-        html.write(select_box)
-        html.write(body_title)
-        html.write('<div class="grid-container 1">\n')
-        if cards_per_sheet > 3:
-            second_grid = int(-(-cards_per_sheet // 2))
-        else:
-            second_grid = ''
-        for card in range(1, (cards_per_sheet +1)):
-            html.write(f'<div class="grid-child {card}">\n')
-            html.write('<div class="clear"></div>\n')
-            html.write(f'<div class="card {card}">\n')
-            html.write('  <div class="headers">\n')
-            for letter in header:
-                html.write(f'    <div><span>{letter}</span></div>\n')
-            html.write('  </div>\n')
-            for col, _ in columns.items():
-                html.write(f'  <div class="column {col}">\n')
-                for colnumber in columns[col]:
-                    html.write(f'    <div class="number col-{colnumber}"'
-                               f' id="card{card}-c{colnumber}"></div>\n')
-                html.write('  </div>\n')
-            html.write('</div>\n</div>\n')
-            if card == second_grid:
-                html.write('</div>\n<div class="grid-container 2">\n')
-        html.write('</div>\n')
-        html.write(footer)
-        html.write(script)
+        sheet_cards = []
+        card_lines = []
+        attempt = 0
         while count <= cards_per_sheet:
-            nums = str(generate_numbers())
-            html.write(f'$card{str(count)} = {nums};\n')
+            if record is not None:
+                nums = record_cards[count - 1]
+            elif seed is not None:
+                nums = card_numbers(seed, total, count, attempt)
+            else:
+                if not pending_cards:
+                    batch_sheets = min(1000, last_sheet - total + 1)
+                    pending_cards = generate_cards(batch_sheets * cards_per_sheet)
+                    pending_cards.reverse()
+                nums = pending_cards.pop()
+            if record is None and not card_index.add(nums):
+                attempt += 1
+                continue
+            attempt = 0
+            sheet_cards.append(nums)
+            card_lines.append(f'$card{str(count)} = {str(nums)};\n')
             count += 1
-        html.write(emode)
-        html.write(js_array)
-        html.write(js1)
-        html.write(free_space)
-        html.write(js2)
-        html.write("</body></html>")
-        html.close()
-        if arguments['pdf']:
-            pdffile = f'{output_path}{str(total)}-{(card_colour.upper().strip("#"))}.pdf'
-            print_pdf(filename, pdffile)
-        current_count = total
+        if record is None or not manifest.is_current(total, filename):
+            card_lines.append(f'$numbers = {json.dumps(number_cells(sheet_cards))};\n')
+            html_page = b''.join((page_head, title.encode('utf-8'), page_style,
+                                  card_clear.encode('utf-8'), page_body,
+                                  ''.join(card_lines).encode('utf-8'), page_tail))
+            with open(f'{filename}.tmp', 'wb') as html:
+                html.write(html_page)
+            os.replace(f'{filename}.tmp', filename)
+            manifest.add_sheet(total, sheet_cards, hashlib.sha256(html_page).hexdigest())
+            card_index.save()
+            record = manifest.sheets[total]
+        if merge_pdf:
+            if builtin_pdf:
+                merged_pages.append((total, sheet_cards))
+            else:
+                merged_pages.append(print_page(total, body_title, card_grid(layout, sheet_cards, print_free),
+                                               print_footer) +
+                                    '<div class="page-break"></div>\n')
+            merged_dirty = merged_dirty or not record.get('pdf')
+            if len(merged_pages) == pages_per_pdf or total == last_sheet:
+                first = total - len(merged_pages) + 1
+                if pages_per_pdf or first > 1:
+                    pdf_name = f'{colour_name}-cards-{first}-{total}'
+                else:
+                    pdf_name = f'{colour_name}-cards'
+                pdffile = f'{output_path}{pdf_name}.pdf'
+                if builtin_pdf:
+                    pdf_call = (print_vector_pdf, merged_pages, pdffile, card_colour, card_title, layout)
+                else:
+                    merged_html = (f'{open_head}<title>CARDS {first} - {total}</title>\n'
+                                   f'{open_style}{page_css}{merged_css}{layout.print_css()}{close_style}'
+                                   f'{close_head}{open_body}{"".join(merged_pages)}</body></html>')
+                    pdf_call = (print_pdf, merged_html, pdffile, layout)
+                if not merged_dirty and os.path.exists(pdffile):
+                    pass
+                elif pdf_pool:
+                    pdf_jobs[f'Sheets {first}-{total}'] = (pdf_pool.submit(*pdf_call),
+                                                           list(range(first, total + 1)))
+                    pdf_count += 1
+                else:
+                    run_pdf(pdf_call, f'Sheets {first}-{total}', range(first, total + 1), pdf_failed,
+                            manifest)
+                    pdf_count += 1
+                merged_pages = []
+                merged_dirty = False
+        elif arguments['pdf']:
+            pdffile = f'{output_path}{str(total)}-{colour_name}.pdf'
+            if record.get('pdf') and os.path.exists(pdffile):
+                pdf_call = None
+            elif builtin_pdf:
+                pdf_call = (print_vector_pdf, [(total, sheet_cards)], pdffile, card_colour, card_title,
+                            layout)
+            else:
+                pdf_call = (print_pdf, f'{open_head}{title}{print_style}' +
+                            print_page(total, body_title, card_grid(layout, sheet_cards, print_free),
+                                       print_footer) + '</body></html>', pdffile, layout)
+            if pdf_call is None:
+                pass
+            elif pdf_pool:
+                pdf_jobs[f'Sheet {str(total)}'] = (pdf_pool.submit(*pdf_call), [total])
+                pdf_count += 1
+            else:
+                run_pdf(pdf_call, f'Sheet {str(total)}', [total], pdf_failed, manifest)
+                pdf_count += 1
+        if pdf_pool:
+            wait_for_pdfs(pdf_jobs, pdf_failed, jobs * 2, manifest)
+        if tracker is not None:
+            tracker.add_sheet(total, sheet_cards)
+        current_count = total - first_sheet + 1
+        if progress is not None:
+            progress(current_count, int(arguments['num']))
         total += 1
+    card_index.save()
+    if pdf_pool:
+        wait_for_pdfs(pdf_jobs, pdf_failed, manifest=manifest)
+        pdf_pool.shutdown()
+    if pdf_failed:
+        print(f"{len(pdf_failed)} of {pdf_count} PDF's failed: {', '.join(pdf_failed)}")
+    manifest.close()
     if current_count == 1:
         print(f"{str(current_count)} card written")
     elif current_count > 1:
         print(f"{str(current_count)} cards written")
 
 
-def convert_logo(logo):
-    """When logo is chosen, will load, resize, then add the logo to the HTML"""
-    file_name, file_ext = os.path.splitext(logo)
-    basewidth = 40
-    img = Image.open(logo)
+def number_cells(sheet_cards):
+    """Maps each number on a sheet to the ids of the cells it appears in, for easy mode"""
+    cells = {'FREE': []}
+    for card, numbers in enumerate(sheet_cards, start=1):
+        for position, number in enumerate(numbers, start=1):
+            if position == 13:
+                cells['FREE'].append(f'card{card}-c{position}')
+            else:
+                cells.setdefault(str(number), []).append(f'card{card}-c{position}')
+    return cells
+
+def save_asset(data, base_name, file_ext):
+    """Writes a shared file named by a hash of its contents, so a later run with other options never
+    changes the files earlier cards link to, returning its name to link from the cards"""
+    asset_name = f'{base_name}-{hashlib.sha256(data).hexdigest()[:8]}.{file_ext}'
+    if not os.path.exists(asset_name):
+        with open(f'{asset_name}.tmp', 'wb') as asset:
+            asset.write(data)
+        os.replace(f'{asset_name}.tmp', asset_name)
+    return os.path.basename(asset_name)
+
+def save_image(data_uri, base_name):
+    """Writes an inline data URI out as a shared image file, returning its name"""
+    header, data = data_uri.split(',', 1)
+    return save_asset(base64.b64decode(data), base_name, header.split(';')[0].split('/')[-1])
+
+dauber_svgs = {
+    'circle': '<circle cx="20" cy="20" r="17" fill="{colour}" stroke="#2f4f4f" stroke-opacity="0.5"/>'
+              '<circle cx="15" cy="14" r="5" fill="#fff" fill-opacity="0.3"/>',
+    'square': '<rect x="3" y="3" width="34" height="34" rx="3.5" fill="{colour}" stroke="#2f4f4f"'
+              ' stroke-opacity="0.5"/><rect x="7" y="7" width="10" height="10" rx="2" fill="#fff"'
+              ' fill-opacity="0.3"/>',
+    'maple-leaf': '<polygon fill="{colour}" points="18.8,40 19.2,28 10,29.2 11.2,26 2.8,18.8 4.4,17.6'
+                  ' 3.2,12 8,12.8 9.2,10.8 14,16 12.8,5.2 15.6,6.4 20,0 24.4,6.4 27.2,5.2 26,16'
+                  ' 30.8,10.8 32,12.8 36.8,12 35.6,17.6 37.2,18.8 28.8,26 30,29.2 20.8,28 21.2,40"/>',
+    'heart': '<path fill="{colour}" d="M20 36C20 36 3 25.5 3 14C3 8.5 7.2 4.5 12.3 4.5C15.8 4.5 18.6'
+             ' 6.4 20 9.4C21.4 6.4 24.2 4.5 27.7 4.5C32.8 4.5 37 8.5 37 14C37 25.5 20 36 20 36Z"/>',
+    'star': '<polygon fill="#ffcc4d" stroke="#f4900c" stroke-width="1.5" stroke-linejoin="round"'
+            ' points="20,2 25.3,13.9 38.1,15.1 28.5,23.8 31.2,36.4 20,29.9 8.8,36.4 11.5,23.8 1.9,15.1'
+            ' 14.7,13.9"/>',
+    'x-mark': '<path stroke="#dd2e44" stroke-width="7" stroke-linecap="round" d="M7 7L33 33M33 7L7 33"/>',
+    'checkmark': '<rect x="2" y="2" width="36" height="36" rx="6" fill="#77b255"/><path fill="none"'
+                 ' stroke="#fff" stroke-width="6" stroke-linecap="round" stroke-linejoin="round"'
+                 ' d="M9 21L16.5 28.5L31 11"/>',
+}
+
+def sprite_css(page_css, dauber_colour):
+    """Swaps the drawn daubers in the page CSS for SVG images rendered once in the dauber colour"""
+    shapes = '|'.join(re.escape(shape) for shape in dauber_svgs)
+    page_css = re.sub(r'\n\.(' + shapes + r')(:after)? \{[^}]*\}', '', page_css)
+    after = ', '.join(f'.{shape}:after' for shape in dauber_svgs)
+    sprites = ['''
+.number {
+  position: relative;
+}
+''' + after + ''' {
+  display: block;
+  content: '';
+  position: absolute;
+  top: 50%;
+  left: 50%;
+  width: 40px;
+  height: 40px;
+  margin: -20px 0 0 -20px;
+  background-repeat: no-repeat;
+}
+''']
+    colour = dauber_colour.replace('&', '&amp;').replace('"', '&quot;').replace('<', '&lt;')
+    for shape, svg in dauber_svgs.items():
+        svg = ('<svg xmlns="http://www.w3.org/2000/svg" width="40" height="40" viewBox="0 0 40 40">'
+               + svg.replace('{colour}', colour) + '</svg>')
+        b64_svg = base64.b64encode(svg.encode('utf-8')).decode('utf-8')
+        sprites.append(f'.{shape}:after {{\n  background-image: url(data:image/svg+xml;base64,{b64_svg});\n}}\n')
+    return page_css + ''.join(sprites)
+
+def print_page(sheet, body_title, grid, print_footer):
+    """Builds the body of the printed copy of a sheet"""
+    return ('<div class="card-number"><button class="button button-clear">'
+            f'CARD {str(sheet)}</button></div>\n{body_title}{grid}{print_footer}\n')
+
+def card_grid(layout, sheet_cards=None, free_space=''):
+    """Builds the grid of cards for a sheet, a row of the layout at a time, filling in the numbers
+    when they are provided"""
+    header = ['B', 'I', 'N', 'G', 'O']
+    columns = {1: [1, 6, 11, 16, 21],
+               2: [2, 7, 12, 17, 22],
+               3: [3, 8, 13, 18, 23],
+               4: [4, 9, 14, 19, 24],
+               5: [5, 10, 15, 20, 25]
+              }
+    grid = []
+    for row, row_cards in enumerate(layout.card_rows(), start=1):
+        grid.append(f'<div class="grid-container {row}">\n')
+        for card in row_cards:
+            grid.append(f'<div class="grid-child {card}">\n')
+            grid.append('<div class="clear"></div>\n')
+            grid.append(f'<div class="card {card}">\n')
+            grid.append('  <div class="headers">\n')
+            for letter in header:
+                grid.append(f'    <div><span>{letter}</span></div>\n')
+            grid.append('  </div>\n')
+            for col, _ in columns.items():
+                grid.append(f'  <div class="column {col}">\n')
+                for colnumber in columns[col]:
+                    if sheet_cards is None:
+                        content = ''
+                    elif colnumber == 13:
+                        content = free_space
+                    else:
+                        content = f'<span>{sheet_cards[card - 1][colnumber - 1]}</span>'
+                    grid.append(f'    <div class="number col-{colnumber}"'
+                                f' id="card{card}-c{colnumber}">{content}</div>\n')
+                grid.append('  </div>\n')
+            grid.append('</div>\n</div>\n')
+        grid.append('</div>\n')
+    return ''.join(grid)
+
+def cache_dir():
+    """Returns the per-user cache directory, creating it on first use"""
+    base = (os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME') or
+            os.path.join(os.path.expanduser('~'), '.cache'))
+    path = os.path.join(base, 'bingo-card-generator')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def convert_logo(logo, basewidth=40):
+    """When logo is chosen, will resize it in memory, then add the logo to the HTML"""
+    with open(logo, 'rb') as logo_file:
+        logo_data = logo_file.read()
+    digest = hashlib.sha256(logo_data).hexdigest()
+    try:
+        cached_logo = os.path.join(cache_dir(), f'logo-{digest}-{basewidth}.uri')
+    except OSError:
+        cached_logo = None
+    if cached_logo and os.path.exists(cached_logo):
+        with open(cached_logo, 'r', encoding='utf-8') as cached:
+            return cached.read()
+
+    from io import BytesIO
+    from PIL import Image
+    img = Image.open(BytesIO(logo_data))
+    file_format = img.format or 'PNG'
     wpercent = (basewidth / float(img.size[0]))
     hsize = int((float(img.size[1]) * float(wpercent)))
     img = img.resize((basewidth, hsize), Image.Resampling.LANCZOS)
-    resized_logo = f'{file_name}-resized{file_ext}'
-    img.save(resized_logo)
+    resized_logo = BytesIO()
+    img.save(resized_logo, format=file_format)
 
-    filetype = imghdr.what(resized_logo)
-    file_handle = open(resized_logo, 'rb').read()
-    b64_logo = base64.b64encode(file_handle).decode('utf-8')
-    data_uri = f'data:image/{filetype};base64,{b64_logo}'
+    mime_type = Image.MIME.get(file_format, f'image/{file_format.lower()}')
+    b64_logo = base64.b64encode(resized_logo.getvalue()).decode('utf-8')
+    data_uri = f'data:{mime_type};base64,{b64_logo}'
+    if cached_logo:
+        # Written to a file of this process's own, then renamed into place, so an interrupted run
+        # or two runs at once never leave a partly written logo for later runs to reuse
+        cached_tmp = f'{cached_logo}.{os.getpid()}.tmp'
+        try:
+            with open(cached_tmp, 'w', encoding='utf-8') as cached:
+                cached.write(data_uri)
+            os.replace(cached_tmp, cached_logo)
+        except OSError:
+            try:
+                os.remove(cached_tmp)
+            except OSError:
+                pass
 
     return data_uri
 
+def generate_cards(number_of_cards, seed=None):
+    """Generate the numbers for a batch of cards in one shot, 25 numbers per card"""
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        rand = numpy.random.default_rng(seed)
+        cards = numpy.empty((number_of_cards, 5, 5), dtype=numpy.int16)
+        for column in range(5):
+            draws = rand.random((number_of_cards, 15)).argsort(axis=1)[:, :5]
+            cards[:, :, column] = draws + (column * 15) + 1
+        return cards.reshape(number_of_cards, 25).tolist()
+    rand = Random(seed)
+    return [draw_card(rand) for _ in range(number_of_cards)]
+
+def draw_card(rand):
+    """Draws five numbers per column from a Random, laid out row by row"""
+    columns = [rand.sample(range((column * 15) + 1, (column * 15) + 16), 5)
+               for column in range(5)]
+    return [columns[column][row] for row in range(5) for column in range(5)]
+
+def card_numbers(seed, sheet, card, attempt=0):
+    """Derives the numbers of one card from the series seed, its sheet and its place on the sheet"""
+    return draw_card(Random(f'{seed}:{sheet}:{card}:{attempt}'))
+
+def verify_card(seed, sheet, card, numbers, attempts=4):
+    """Checks claimed numbers against the card derived from the series seed"""
+    numbers = [int(number) for number in numbers]
+    for attempt in range(attempts):
+        if card_numbers(seed, sheet, card, attempt) == numbers:
+            return True
+    return False
+
 def generate_numbers():
     """Generate random numbers for each column"""
-    rand = Random()
-    card_array = []
-    for _ in range(5):
-        b_nums = rand.sample(range(1, 16), 1)[0]
-        while b_nums in card_array:
-            b_nums = rand.sample(range(1, 16), 1)[0]
-        card_array.append(b_nums)
-        i_nums = rand.sample(range(16, 31), 1)[0]
-        while i_nums in card_array:
-            i_nums = rand.sample(range(16, 31), 1)[0]
-        card_array.append(i_nums)
-        n_nums = rand.sample(range(31, 46), 1)[0]
-        while n_nums in card_array:
-            n_nums = rand.sample(range(31, 46), 1)[0]
-        card_array.append(n_nums)
-        g_nums = rand.sample(range(46, 61), 1)[0]
-        while g_nums in card_array:
-            g_nums = rand.sample(range(46, 61), 1)[0]
-        card_array.append(g_nums)
-        o_nums = rand.sample(range(61, 76), 1)[0]
-        while o_nums in card_array:
-            o_nums = rand.sample(range(61, 76), 1)[0]
-        card_array.append(o_nums)
-    return card_array
-
-def print_pdf(html_file, out_file):
-    """Configure options for printing to PDF"""
-    if sys.platform == 'linux':
-        left = '0.25in'
-        right = '0.25in'
+    return generate_cards(1)[0]
+
+def run_pdf(pdf_call, sheets, sheet_numbers, failed, manifest=None):
+    """Prints one PDF straight away, noting the sheets if it failed"""
+    try:
+        pdf_call[0](*pdf_call[1:])
+    except OSError as err:
+        failed.append(sheets)
+        print(f"{sheets}: PDF could not be created - {str(err).strip()}")
     else:
-        left = '0.1in'
-        right = '0in'
-    options = {
-        'page-size': 'Letter',
-        'page-width': '8.5in',
-        'page-height': '11in',
-        'orientation': 'Landscape',
-        'margin-top': '0.5in',
-        'margin-right': right,
-        'margin-bottom': '0.25in',
-        'margin-left': left,
-        'quiet': ''
-    }
-    with open(html_file, "r") as html:
-        html = html.read().replace(' - CLICK HERE TO CLEAR CARD', '')
-        html = html.replace('<a href="https://github.com/digitalsleuth/bingo-card-generator" class="footer"></a>',
-                            '<div align="center" style="font-family: Roboto Condensed">'
-                            'https://github.com/digitalsleuth/bingo-card-generator</div>')
-        html = html.replace('<select', '<!-- <select').replace('</select>', '</select> -->')
-
-    html_back = f'{html_file}.html'
-    with open(html_back, "w") as backup:
-        backup.write(html)
-    pdfkit.from_file(html_back, out_file, options=options)
-    os.remove(html_back)
-
-def grab_numbers(arguments):
-    """Extracts the generated numbers from the HTML files to forward to other functions"""
+        if manifest is not None:
+            manifest.pdf_done(sheet_numbers)
+
+def wait_for_pdfs(pdf_jobs, failed, keep=0, manifest=None):
+    """Waits for the oldest queued PDF's until only keep are left, noting any sheet which failed"""
+    while len(pdf_jobs) > keep:
+        sheets = next(iter(pdf_jobs))
+        job, sheet_numbers = pdf_jobs.pop(sheets)
+        try:
+            job.result()
+        except CancelledError:
+            continue
+        except OSError as err:
+            failed.append(sheets)
+            print(f"{sheets}: PDF could not be created - {str(err).strip()}")
+        else:
+            if manifest is not None:
+                manifest.pdf_done(sheet_numbers)
+
+def read_numbers(arguments):
+    """Extracts the generated numbers from the HTML files when the cards are not in memory"""
     num = int(arguments['num'])
     if num == 1:
         amt = 'card'
@@ -968,178 +1076,76 @@ def grab_numbers(arguments):
         basecolour = arguments['card_colour'].upper()
     else:
         basecolour = arguments['base_colour'].upper()
-    pattern = '\$card\d = \[*;*'
+    pattern = r'\$card\d+ = \[*;*'
     if '.html' not in basecolour:
         basecolour = basecolour + '.html'
+    cards = {}
     while total <= num:
         input_filename = f'{output_path}{os.sep}{str(total)}-{basecolour}'
         input_filename = input_filename.replace('#', '')
-        input_file = open(input_filename, 'r')
-        input_file = input_file.readlines()
-        html_name, _ = os.path.splitext(basecolour)
-        output_filename = f'{output_path}{os.sep}{str(total)}-{(html_name.upper())}.csv'
-        output_file = open(output_filename, 'w+')
-        full_sheet = []
+        with open(input_filename, 'r', encoding='utf-8') as input_file:
+            input_file = input_file.readlines()
+        sheet_cards = []
         for line in input_file:
             match = re.match(pattern, line)
             if match:
-                row_1, row_2, row_3, row_4, row_5, \
-                row_6, row_7, row_8, row_9, row_10 = ([] for i in range(10))
                 line = re.sub(pattern, '', line)
                 line = line.replace("];\n", "").replace(',', '')
-                line = line.split()
-                for i in line:
-                    full_sheet.append(i)
-
-        indices = {
-            1: [[0, 1, 2, 3, 4], [25, 26, 27, 28, 29], [50, 51, 52, 53, 54]],
-            2: [[5, 6, 7, 8, 9], [30, 31, 32, 33, 34], [55, 56, 57, 58, 59]],
-            3: [[10, 11, 12, 13, 14], [35, 36, 37, 38, 39], [60, 61, 62, 63, 64]],
-            4: [[15, 16, 17, 18, 19], [40, 41, 42, 43, 44], [65, 66, 67, 68, 69]],
-            5: [[20, 21, 22, 23, 24], [45, 46, 47, 48, 49], [70, 71, 72, 73, 74]],
-            6: [[75, 76, 77, 78, 79], [100, 101, 102, 103, 104], [125, 126, 127, 128, 129]],
-            7: [[80, 81, 82, 83, 84], [105, 106, 107, 108, 109], [130, 131, 132, 133, 134]],
-            8: [[85, 86, 87, 88, 89], [110, 111, 112, 113, 114], [135, 136, 137, 138, 139]],
-            9: [[90, 91, 92, 93, 94], [115, 116, 117, 118, 119], [140, 141, 142, 143, 144]],
-            10: [[95, 96, 97, 98, 99], [120, 121, 122, 123, 124], [145, 146, 147, 148, 149]]
-        }
-
-        all_rows = [row_1, row_2, row_3, row_4, row_5, row_6, row_7, row_8, row_9, row_10]
-        for idx in range(len(indices)):
-            for i in indices.get((idx + 1)):
-                (all_rows[idx]).extend(map(full_sheet.__getitem__, i))
-            all_rows[idx].insert(5, " ")
-            all_rows[idx].insert(11, " ")
-        all_rows[2][2] = all_rows[2][8] = all_rows[2][14] = "*"
-        all_rows[7][2] = all_rows[7][8] = all_rows[7][14] = "*"
-        all_rows.insert(5, [", "])
-        for row in all_rows:
-            row = ','.join(map(str, row)) + '\n'
-            output_file.write(row)
-        output_file.close()
+                sheet_cards.append([int(number) for number in line.split()])
+        cards[total] = sheet_cards
         total += 1
     print("Extraction Complete")
+    return cards
 
-def generate_excel(number_of_csvs, base_filename, excel_name, source_path):
-    """Takes the bingo numbers and card numbers and writes the data to an Excel file"""
-    header = [' ', 'B', 'I', 'N', 'G', 'O',
-              ' ', 'B', 'I', 'N', 'G', 'O',
-              ' ', 'B', 'I', 'N', 'G', 'O']
-    excel_name = f'{source_path}{os.sep}{(excel_name.upper())}'
-    call_sheet_header = ['B', 'I', 'N', 'G', 'O']
-    call_sheet = NamedStyle(name="call_sheet")
-    call_sheet.alignment.horizontal = 'center'
-    call_sheet.alignment.vertical = 'center'
-    bingo_header = NamedStyle(name="bingo_header")
-    bingo_header.font = Font(bold=True, name='Arial', size='15')
-    bingo_header.alignment.horizontal = 'center'
-    bingo_header.alignment.vertical = 'center'
-    called_number = PatternFill(bgColor="FFC000")
-    free_space = PatternFill(start_color='FFC000', end_color='FFC000', fill_type='solid')
-    borders = PatternFill(start_color='B2B2B2', end_color='B2B2B2', fill_type='solid')
-    alignment = Alignment(horizontal='center', vertical='center')
-    writer = Workbook(excel_name)
-    call_worksheet = writer.create_sheet('CALL')
-    call_worksheet.append(call_sheet_header)
-    base_name, _ = os.path.splitext(base_filename)
-    for csvnum in range(1, number_of_csvs + 1):
-        csvfile = (f'{source_path}{os.sep}{str(csvnum)}-{(base_name.upper())}.csv')
-        worksheet = writer.create_sheet(str(csvnum))
-        readcsv = open(csvfile, 'r', newline='', encoding='utf-8')
-        reader = csv.reader(readcsv)
-        for row in reader:
-            for item in row:
-                try:
-                    row[row.index(item)] = int(row[row.index(item)])
-                except ValueError:
-                    pass
-            worksheet.append(row)
-        readcsv.close()
-        os.remove(csvfile)
-    writer.save(excel_name)
-    wb = load_workbook(excel_name)
-    wb.add_named_style(bingo_header)
-    wb.add_named_style(call_sheet)
-    ws_call = wb['CALL']
-    for row in range(1, 17):
-        ws_call.row_dimensions[row].height = 20
-    call_font = Font(bold=True, name='Arial', size='20')
-    col_b = ws_call.column_dimensions['A']
-    col_i = ws_call.column_dimensions['B']
-    col_n = ws_call.column_dimensions['C']
-    col_g = ws_call.column_dimensions['D']
-    col_o = ws_call.column_dimensions['E']
-    for col_letter in (col_b, col_i, col_n, col_g, col_o):
-        col_letter.font = call_font
-        col_letter.alignment = alignment
-    for _, cell in enumerate(ws_call["A1":"E1"]):
-        for _, cell_obj in enumerate(cell):
-            cell_obj.style = call_sheet
-            cell_obj.font = Font(bold=True, name='Arial', size='20', color='FF0000')
-    for sheet in range(1, number_of_csvs + 1):
-        ws = wb[str(sheet)]
-        ws.conditional_formatting.add('B1:B14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(B1,CALL!$A$2:$A$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('C1:C14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(C1,CALL!$B$2:$B$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('D1:D14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(D1,CALL!$C$2:$C$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('E1:E14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(E1,CALL!$D$2:$D$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('F1:F14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(F1,CALL!$E$2:$E$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('H1:H14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(H1,CALL!$A$2:$A$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('I1:I14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(I1,CALL!$B$2:$B$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('J1:J14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(J1,CALL!$C$2:$C$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('K1:K14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(K1,CALL!$D$2:$D$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('L1:L14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(L1,CALL!$E$2:$E$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('N1:N14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(N1,CALL!$A$2:$A$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('O1:O14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(O1,CALL!$B$2:$B$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('P1:P14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(P1,CALL!$C$2:$C$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('Q1:Q14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(Q1,CALL!$D$2:$D$16,1,FALSE)))'], fill=called_number))
-        ws.conditional_formatting.add('R1:R14', FormulaRule(formula=['NOT(ISNA(VLOOKUP(R1,CALL!$E$2:$E$16,1,FALSE)))'], fill=called_number))
-        for row in range(1, 18):
-            ws.row_dimensions[row].height = 20
-        column = 1
-        while column <= 19:
-            col = get_column_letter(column)
-            ws.column_dimensions[col].width = 5
-            column += 1
-        ws.insert_cols(1)
-        ws.insert_rows(0)
-        ws.insert_rows(1)
-        ws.insert_rows(8)
-        ws['D5'].fill = ws['J5'].fill = ws['P5'].fill = free_space
-        ws['D12'].fill = ws['J12'].fill = ws['P12'].fill = free_space
-        ws['D5'].alignment = ws['J5'].alignment = ws['P5'].alignment = alignment
-        ws['D12'].alignment = ws['J12'].alignment = ws['P12'].alignment = alignment
-        for col, val in enumerate(header, start=1):
-            ws.cell(row=2, column=col).value = val
-            ws.cell(row=9, column=col).value = val
-        for cell in ws["1:1"]:
-            cell.fill = borders
-        for cell in ws["2:2"]:
-            cell.style = bingo_header
-        for cell in ws["8:8"]:
-            cell.fill = borders
-        for cell in ws["9:9"]:
-            cell.style = bingo_header
-        for cell in ws["15:15"]:
-            cell.fill = borders
-        for _, cell in enumerate(ws["A1":"A15"]):
-            for _, cell_obj in enumerate(cell):
-                cell_obj.fill = borders
-        for _, cell in enumerate(ws["G1":"G15"]):
-            for _, cell_obj in enumerate(cell):
-                cell_obj.fill = borders
-        for _, cell in enumerate(ws["M1":"M15"]):
-            for _, cell_obj in enumerate(cell):
-                cell_obj.fill = borders
-        for _, cell in enumerate(ws["S1":"S15"]):
-            for _, cell_obj in enumerate(cell):
-                cell_obj.fill = borders
-        for row in ws.rows:
-            for cell in row:
-                cell.alignment = alignment
-    wb.save(excel_name)
+def load_manifest_cards(manifest_file):
+    """Reads the cards of each sheet recorded in a run's manifest"""
+    manifest = Manifest(manifest_file)
+    manifest.close()
+    return dict(manifest.all_cards())
+
+def play(arguments):
+    """Checks for winners as each called number is entered at the prompt"""
+    import bingo_engine
+    colour = (arguments['base_colour'] or arguments['card_colour']).upper().strip('#')
+    manifest_file = f"{arguments['output']}{os.sep}{colour}-manifest.jsonl"
+    if os.path.exists(manifest_file):
+        cards = load_manifest_cards(manifest_file)
+    elif arguments['num']:
+        arguments['base_colour'] = colour
+        cards = read_numbers(arguments)
+    else:
+        print(f"{manifest_file} not found - give NUM_OF_CARDS to read the numbers from the HTML files")
+        raise SystemExit(1)
+    try:
+        engine = bingo_engine.WinnerEngine(cards, arguments['pattern'] or ['line'])
+    except ValueError as err:
+        print(err)
+        raise SystemExit(1)
+    print(f"{len(engine.card_ids)} cards in play - enter each number as it is called (eg. N42), "
+          f"or q to quit")
+    while True:
+        try:
+            text = input('Call: ').strip()
+        except EOFError:
+            break
+        if text.lower() in ('q', 'quit', 'exit'):
+            break
+        if not text:
+            continue
+        try:
+            wins = engine.call(bingo_engine.parse_call(text))
+        except ValueError as err:
+            print(err)
+            continue
+        for sheet, card, line in wins:
+            print(f"BINGO! Card {sheet}, #{card} - {line}")
 
 def main():
     """Parse arguments for PDF, card and dauber colour, and dauber shape"""
+    if sys.argv[1:2] == ['serve']:
+        import bingo_server
+        bingo_server.main(sys.argv[2:])
+        return
     arg_parse = argparse.ArgumentParser(
         description='Bingo Card Generator v' + str(__version__),
         epilog=f"If you'd like to see a few other color options, you can visit:\n{__colour_groups__}",
@@ -1166,10 +1172,44 @@ Customization options:
 -z, --easy                    Enables "Easy Mode" - meaning once a number is clicked on one card, it is selected on all cards
 -x, --excel <path>            When not choosing "everything", generates an Excel document for the call numbers - requires -b
 -b, --base-colour <colour>    Identifies the base colour of the HTML files from which to generate the Excel Spreadsheet
+-j, --jobs <N>                Number of PDF's to render at the same time - default is 1 (one after the other)
+-m, --merge-pdf               Print all sheets as the pages of one PDF instead of one PDF per sheet
+-k, --pages-per-pdf <K>       With --merge-pdf, starts a new PDF every K sheets - default is 0 (all sheets in one PDF)
+                              Each PDF is named <COLOUR>-cards-<first>-<last>.pdf, or <COLOUR>-cards.pdf when it
+                              holds every sheet from sheet 1
+--shared-assets               Writes the CSS, script and images once to the output directory and links them from
+                              each card, instead of including them in every HTML file - each file is named by a
+                              hash of its contents, so runs for other colours or options never change it
+--offline                     Uses a built-in script instead of loading jQuery, so cards work without a network
+--sprite-daubers              Draws the circle, square, maple-leaf, heart, star, x-mark and checkmark daubers once
+                              as small SVG images, so daubing and PDF rendering need no layered CSS shapes
+--pdf-engine <engine>         wkhtmltopdf (default) prints the HTML cards, builtin draws the cards straight to PDF
+                              in Python - much faster, with no wkhtmltopdf needed
+--cards-per-sheet <N>         Number of cards on each sheet - default is 6 - eg. 1, 2, 4, 6, 9 or 12
+--paper <size>                Paper size for the PDF's - default is letter. Options are: letter, legal, tabloid, a3,
+                              a4, a5
+--orientation <orientation>   landscape (default) or portrait - the cards are arranged in rows and columns to suit
+--series-index                Keeps bingo-cards.idx in the output directory, so later runs into the same directory
+                              never repeat a card from an earlier run
+--seed <seed>                 Series seed - each card's numbers are derived from the seed, sheet and card number,
+                              so any card can be regenerated or verified later from the same seed
+--resume                      Continues an interrupted run into the same output directory, keeping every sheet whose
+                              HTML and PDF are already complete in the manifest and regenerating the rest
+--start-at <N>                Number of the first sheet to generate - default is 1 - so a series can be extended
+--count <N>                   Number of sheets to generate, in place of NUM_OF_CARDS
+--play                        Loads the cards in the output directory (colour from -b or -c) and checks for winners
+                              as each called number is entered
+--pattern <pattern>           With --play, the winning pattern - default is line. Options are: line, four-corners, x,
+                              blackout, postage-stamp, t, l, or a 5x5 grid with X on the cells to cover,
+                              eg. "X...X/.X.X./..X../.X.X./X...X" - can be given more than once
+serve -o <output_dir>         Runs the local caller server for the cards in the output directory - see serve --help
+--table-tracker               Writes the spreadsheet as one CARDS table of sheet, card, position and number, instead
+                              of a worksheet per sheet - stays responsive with thousands of sheets, and is used
+                              automatically for runs of more than 500 sheets
 ''')
     group.add_argument('-p', '--pdf', action='store_true', help=argparse.SUPPRESS)
     group.add_argument('-o', '--output', metavar='', help=argparse.SUPPRESS, required=True)
-    group.add_argument('num', metavar='', help=argparse.SUPPRESS, type=int, nargs=1)
+    group.add_argument('num', metavar='', help=argparse.SUPPRESS, type=int, nargs='?')
     group.add_argument('-c', '--card-colour', help=argparse.SUPPRESS, default='blue')
     group.add_argument('-d', '--dauber-colour', help=argparse.SUPPRESS, default='red')
     group.add_argument('-s', '--dauber-shape', help=argparse.SUPPRESS,
@@ -1191,6 +1231,27 @@ Customization options:
     group.add_argument('-x', '--excel', help=argparse.SUPPRESS)
     group.add_argument('-e', '--everything', help=argparse.SUPPRESS, action='store_true')
     group.add_argument('-z', '--easy', help=argparse.SUPPRESS, action='store_true')
+    group.add_argument('-j', '--jobs', help=argparse.SUPPRESS, type=int, default=1)
+    group.add_argument('-m', '--merge-pdf', help=argparse.SUPPRESS, action='store_true')
+    group.add_argument('-k', '--pages-per-pdf', help=argparse.SUPPRESS, type=int, default=0)
+    group.add_argument('--shared-assets', help=argparse.SUPPRESS, action='store_true')
+    group.add_argument('--offline', help=argparse.SUPPRESS, action='store_true')
+    group.add_argument('--sprite-daubers', help=argparse.SUPPRESS, action='store_true')
+    group.add_argument('--pdf-engine', help=argparse.SUPPRESS, choices=['wkhtmltopdf', 'builtin'],
+                       default='wkhtmltopdf')
+    group.add_argument('--cards-per-sheet', help=argparse.SUPPRESS, type=int, default=6)
+    group.add_argument('--paper', help=argparse.SUPPRESS, type=str.lower, choices=list(paper_sizes),
+                       default='letter')
+    group.add_argument('--orientation', help=argparse.SUPPRESS, type=str.lower, choices=orientations,
+                       default='landscape')
+    group.add_argument('--series-index', help=argparse.SUPPRESS, action='store_true')
+    group.add_argument('--seed', help=argparse.SUPPRESS)
+    group.add_argument('--resume', help=argparse.SUPPRESS, action='store_true')
+    group.add_argument('--start-at', help=argparse.SUPPRESS, type=int, default=1)
+    group.add_argument('--count', help=argparse.SUPPRESS, type=int)
+    group.add_argument('--table-tracker', help=argparse.SUPPRESS, action='store_true')
+    group.add_argument('--play', help=argparse.SUPPRESS, action='store_true')
+    group.add_argument('--pattern', help=argparse.SUPPRESS, action='append')
 
     if len(sys.argv[1:]) == 0:
         arg_parse.print_help()
@@ -1198,28 +1259,45 @@ Customization options:
 
     args = arg_parse.parse_args()
     all_args = vars(args)
-    all_args['num'] = all_args['num'][0]
-    if all_args['excel'] and all_args['base_colour']:
-        grab_numbers(all_args)
-        generate_excel(all_args['num'], all_args['base_colour'],
-                       all_args['excel'], all_args['output'])
-    elif all_args['excel'] and not all_args['base_colour']:
-        print("The Excel option requires the -b, --base-colour value as well")
-        raise SystemExit(0)
-    elif all_args['everything'] and all_args['excel']:
-        all_args['pdf'] = True
-        create_card(all_args)
-        grab_numbers(all_args)
-        generate_excel(all_args['num'], all_args['card_colour'],
-                       all_args['excel'], all_args['output'])
-    elif all_args['everything'] and not all_args['excel']:
-        all_args['pdf'] = True
-        create_card(all_args)
-        grab_numbers(all_args)
-        generate_excel(all_args['num'], all_args['card_colour'],
-                       str(f'{all_args["card_colour"]}-cards.xlsx'), all_args['output'])
-    else:
-        create_card(all_args)
+    if all_args['count'] is not None:
+        all_args['num'] = all_args['count']
+    if all_args['num'] is None and not all_args['play']:
+        arg_parse.error('the number of cards is required - give NUM_OF_CARDS or --count')
+    if all_args['cards_per_sheet'] < 1:
+        arg_parse.error('--cards-per-sheet must be 1 or more')
+    if all_args['start_at'] < 1:
+        arg_parse.error('--start-at must be 1 or more')
+    if all_args['pages_per_pdf'] < 0:
+        arg_parse.error('--pages-per-pdf must be 0 (all sheets in one PDF) or more')
+    layout = layout_from_args(all_args)
+    if all_args['everything'] or all_args['excel']:
+        from bingo_excel import generate_excel, open_tracker
+    try:
+        if all_args['play']:
+            play(all_args)
+        elif all_args['excel'] and all_args['base_colour']:
+            generate_excel(read_numbers(all_args), all_args['excel'], all_args['output'],
+                           all_args['table_tracker'], layout)
+        elif all_args['excel'] and not all_args['base_colour']:
+            print("The Excel option requires the -b, --base-colour value as well")
+            raise SystemExit(0)
+        elif all_args['everything'] and all_args['excel']:
+            all_args['pdf'] = True
+            tracker = open_tracker(all_args['excel'], all_args['output'], all_args['table_tracker'], layout,
+                                   all_args['start_at'] - 1 + int(all_args['num']))
+            create_card(all_args, tracker)
+            tracker.save()
+        elif all_args['everything'] and not all_args['excel']:
+            all_args['pdf'] = True
+            tracker = open_tracker(str(f'{all_args["card_colour"]}-cards.xlsx'), all_args['output'],
+                                   all_args['table_tracker'], layout,
+                                   all_args['start_at'] - 1 + int(all_args['num']))
+            create_card(all_args, tracker)
+            tracker.save()
+        else:
+            create_card(all_args)
+    except ValueError as err:
+        arg_parse.error(str(err))
 
 
 if __name__ == '__main__':
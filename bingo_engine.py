@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+'''
+Checks the generated cards for winners as each number is called,
+for use from the bingo_card_generator command line and GUI
+
+Each winning pattern compiles to one or more 25-bit masks (bit 0 is B1, bit 24
+is O5), and a card has won when its marked cells cover any of the masks in play.
+The WinnerEngine counts down the cells each card has left in each mask, so that
+a called number only touches the cards holding it.
+'''
+
+import heapq
+import re
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__author__ = 'Corey Forman'
+
+FREE = 12
+# The count a winning card's counters are set to, beyond any mask's 24 cells
+WON = 100
+LINES = ([tuple(range(row * 5, row * 5 + 5)) for row in range(5)] +
+         [tuple(range(column, 25, 5)) for column in range(5)] +
+         [(0, 6, 12, 18, 24), (4, 8, 12, 16, 20)])
+LINE_NAMES = ([f'row {row}' for row in range(1, 6)] +
+              [f'column {letter}' for letter in 'BINGO'] +
+              ['diagonal down', 'diagonal up'])
+
+
+def cell_mask(positions):
+    """Builds the mask of the given card positions, numbered 0 to 24 across each row"""
+    mask = 0
+    for position in positions:
+        mask |= 1 << position
+    return mask
+
+
+PATTERNS = {
+    'line': [(name, cell_mask(line)) for name, line in zip(LINE_NAMES, LINES)],
+    'four-corners': [('four corners', cell_mask((0, 4, 20, 24)))],
+    'x': [('X', cell_mask(LINES[10] + LINES[11]))],
+    'blackout': [('blackout', cell_mask(range(25)))],
+    'postage-stamp': [('postage stamp', cell_mask(corner)) for corner in
+                      ((0, 1, 5, 6), (3, 4, 8, 9), (15, 16, 20, 21), (18, 19, 23, 24))],
+    't': [('T', cell_mask(LINES[0] + LINES[7]))],
+    'l': [('L', cell_mask(LINES[5] + LINES[4]))],
+}
+
+
+def compile_grid(grid):
+    """Compiles a 5x5 grid of rows split by / or new lines, with X for each cell of the pattern"""
+    rows = [row.strip() for row in re.split(r'[/\n]', grid.strip())]
+    if len(rows) != 5 or any(len(row) != 5 for row in rows):
+        raise ValueError(f'{grid} is not a 5x5 grid - eg. X...X/.X.X./..X../.X.X./X...X')
+    mask = 0
+    for row, cells in enumerate(rows):
+        for column, cell in enumerate(cells):
+            if cell.upper() in ('X', '1', '#'):
+                mask |= 1 << (row * 5 + column)
+    if not mask:
+        raise ValueError(f'{grid} has no cells marked with X')
+    if not mask & ~(1 << FREE):
+        raise ValueError(f'{grid} only marks the FREE space, which every card starts with')
+    return mask
+
+
+def compile_pattern(pattern):
+    """Returns the (name, mask) pairs of a named pattern, or of a custom 5x5 grid"""
+    name = pattern.strip().lower().replace(' ', '-')
+    if name in PATTERNS:
+        return PATTERNS[name]
+    return [('custom', compile_grid(pattern))]
+
+
+def card_marks(numbers, called):
+    """Builds the marked-cells bitmap of one card from the numbers called so far"""
+    called = set(called)
+    return cell_mask(position for position, number in enumerate(numbers)
+                     if position == FREE or number in called)
+
+
+def check_card(numbers, called, patterns=('line',)):
+    """Returns the name of the first pattern one card has completed, or None"""
+    marks = card_marks(numbers, called)
+    for pattern in patterns:
+        for name, mask in compile_pattern(pattern):
+            if marks & mask == mask:
+                return name
+    return None
+
+
+class WinnerEngine():
+    """Keeps the cells each card has left in each mask, updating only the cards holding each called number"""
+    def __init__(self, cards, patterns=('line',), use_numpy=None):
+        """Index the cards of each sheet, as loaded from a run's manifest or by read_numbers"""
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        self.use_numpy = use_numpy
+        self.masks = []
+        for pattern in patterns:
+            self.masks.extend(compile_pattern(pattern))
+        # The cells each mask needs, besides the FREE space, and the masks covering each position
+        self.cells = [bin(mask & ~(1 << FREE)).count('1') for _, mask in self.masks]
+        self.mask_ids = [tuple(mask_id for mask_id, (_, mask) in enumerate(self.masks) if mask & 1 << position)
+                         for position in range(25)]
+        self.card_ids = [(sheet, card_number) for sheet in sorted(cards)
+                         for card_number in range(1, len(cards[sheet]) + 1)]
+        if use_numpy:
+            self.index = self.slot_index([numbers for sheet in sorted(cards) for numbers in cards[sheet]])
+        else:
+            # The cards holding each number, and the number's position on each of them
+            self.index = [([], []) for _ in range(76)]
+            card = 0
+            for sheet in sorted(cards):
+                for numbers in cards[sheet]:
+                    for position, number in enumerate(numbers):
+                        if position != FREE:
+                            hits = self.index[int(number)]
+                            hits[0].append(card)
+                            hits[1].append(position)
+                    card += 1
+        self.reset()
+
+    def slot_index(self, cards):
+        """Lists the counter of every card's mask covering each number, as one NumPy array per number"""
+        numbers = numpy.array(cards, dtype=numpy.uint8).reshape(len(cards), 25)
+        mask_count = len(self.masks)
+        slot_type = numpy.int32 if len(cards) * mask_count < 2 ** 31 else numpy.int64
+        first_slots = numpy.arange(len(cards), dtype=slot_type) * mask_count
+        covered = numpy.array([(position, mask_id) for position in range(25) if position != FREE
+                               for mask_id in self.mask_ids[position]]).reshape(-1, 2)
+        # Laid out card by card, so that each number's counters stay in order after a stable sort,
+        # and a call sweeps through the counters once
+        keys = numbers[:, covered[:, 0]].ravel()
+        slots = (first_slots[:, None] + covered[:, 1].astype(slot_type)).ravel()
+        bounds = numpy.cumsum(numpy.bincount(keys, minlength=76))[:-1]
+        return numpy.split(slots[numpy.argsort(keys, kind='stable')], bounds)
+
+    def reset(self):
+        """Clear the called numbers and winners to start a new game with the same cards"""
+        self.called = []
+        self.winners = {}
+        self.nearest = None
+        if self.use_numpy:
+            self.left = numpy.tile(numpy.array(self.cells, dtype=numpy.int8), len(self.card_ids))
+            self.won = numpy.zeros(len(self.card_ids), dtype=bool)
+        else:
+            # Without NumPy the cells each card needs are kept up to date as its counters go down,
+            # rather than taken over every card's counters each time the closest cards are asked for
+            self.left = bytearray(self.cells) * len(self.card_ids)
+            self.needed = [min(self.cells)] * len(self.card_ids)
+
+    def call(self, number):
+        """Marks a called number and returns the (sheet, card, pattern) of each card it makes a winner"""
+        number = int(number)
+        if not 1 <= number <= 75:
+            raise ValueError(f'{number} is not a bingo number')
+        if number in self.called:
+            return []
+        self.called.append(number)
+        self.nearest = None
+        wins = []
+        if self.use_numpy:
+            # Each number covers a counter at most once, so the counters can be updated in one step
+            slots = self.index[number]
+            counts = self.left[slots] - 1
+            self.left[slots] = counts
+            done = slots[counts == 0]
+            cards, mask_ids = numpy.divmod(done, len(self.masks))
+            # The first mask each card completes - a winning card's counters are then set out of
+            # reach of 0, so that the cards which have already won drop out of later calls
+            first = numpy.ones(len(cards), dtype=bool)
+            first[1:] = cards[1:] != cards[:-1]
+            self.won[cards[first]] = True
+            self.left.reshape(len(self.card_ids), len(self.masks))[cards[first]] = WON
+            card_ids = [self.card_ids[card] for card in cards[first].tolist()]
+            names = [self.masks[mask_id][0] for mask_id in mask_ids[first].tolist()]
+            self.winners.update(zip(card_ids, names))
+            wins = [card_id + (name,) for card_id, name in zip(card_ids, names)]
+        else:
+            left = self.left
+            needed = self.needed
+            mask_count = len(self.masks)
+            mask_ids = self.mask_ids
+            cards, positions = self.index[number]
+            for card, position in zip(cards, positions):
+                slot = card * mask_count
+                for mask_id in mask_ids[position]:
+                    count = left[slot + mask_id] - 1
+                    left[slot + mask_id] = count
+                    # A card's needed cells only reach 0 once, with the first mask it completes
+                    if count < needed[card]:
+                        needed[card] = count
+                        if not count:
+                            wins.append(self.card_ids[card] + (self.masks[mask_id][0],))
+            for sheet, card, name in wins:
+                self.winners[(sheet, card)] = name
+        return wins
+
+    def cells_needed(self):
+        """Returns how many more cells each card needs to complete its nearest pattern"""
+        if self.use_numpy:
+            needed = self.left.reshape(len(self.card_ids), len(self.masks)).min(axis=1, initial=25)
+            needed[self.won] = 0
+            return needed
+        return self.needed
+
+    def closest(self, limit=10):
+        """Returns the (sheet, card, cells needed) of the cards nearest to winning, worked out
+        once per called number"""
+        if self.nearest is not None and self.nearest[0] == limit:
+            return self.nearest[1]
+        needed = self.cells_needed()
+        if self.use_numpy:
+            nearest = numpy.argsort(needed, kind='stable')[:limit].tolist()
+        else:
+            nearest = heapq.nsmallest(limit, range(len(needed)), key=needed.__getitem__)
+        self.nearest = (limit, [self.card_ids[card] + (int(needed[card]),) for card in nearest])
+        return self.nearest[1]
+
+
+def parse_call(text):
+    """Reads a called number typed as either 42 or N42"""
+    text = text.strip().upper()
+    letter = ''
+    if text[:1] in ('B', 'I', 'N', 'G', 'O'):
+        letter, text = text[0], text[1:]
+    if not text.isdigit():
+        raise ValueError(f'{letter}{text} is not a bingo number')
+    number = int(text)
+    if letter and (number - 1) // 15 != 'BINGO'.index(letter):
+        raise ValueError(f'{letter}{number} is not on a bingo card')
+    return number
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+'''
+Writes the Excel spreadsheet used to track the called numbers, with openpyxl
+'''
+
+import os
+from copy import copy
+from openpyxl import Workbook
+from openpyxl.styles import Font, NamedStyle, PatternFill, Alignment
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import FormulaRule
+from bingo_layout import Layout
+
+__author__ = 'Corey Forman'
+
+# openpyxl keeps every worksheet of a workbook in memory until it is saved - about 45 KB for each
+# sheet of cards - so runs of more sheets than this are tracked in the single CARDS table instead
+TRACKER_SHEET_LIMIT = 500
+
+
+class Tracker():
+    """Streams each sheet into the Excel tracking spreadsheet as soon as it is generated"""
+    call_columns = ['A', 'B', 'C', 'D', 'E']
+
+    def __init__(self, excel_name, source_path, layout=None):
+        """Open a write-only workbook and write the CALL sheet"""
+        layout = layout or Layout()
+        self.card_columns = layout.columns
+        self.card_rows = layout.rows
+        self.header = [' ', 'B', 'I', 'N', 'G', 'O'] * self.card_columns
+        self.excel_name = f'{source_path}{os.sep}{(excel_name.upper())}'
+        self.call_sheet = NamedStyle(name="call_sheet")
+        self.call_sheet.alignment.horizontal = 'center'
+        self.call_sheet.alignment.vertical = 'center'
+        self.bingo_header = NamedStyle(name="bingo_header")
+        self.bingo_header.font = Font(bold=True, name='Arial', size='15')
+        self.bingo_header.alignment.horizontal = 'center'
+        self.bingo_header.alignment.vertical = 'center'
+        self.called_number = PatternFill(bgColor="FFC000")
+        self.free_space = PatternFill(start_color='FFC000', end_color='FFC000', fill_type='solid')
+        self.borders = PatternFill(start_color='B2B2B2', end_color='B2B2B2', fill_type='solid')
+        self.alignment = Alignment(horizontal='center', vertical='center')
+        self.writer = Workbook(write_only=True)
+        self.writer.add_named_style(self.bingo_header)
+        self.writer.add_named_style(self.call_sheet)
+        ws_call = self.writer.create_sheet('CALL')
+        for row in range(1, 17):
+            ws_call.row_dimensions[row].height = 20
+        call_font = Font(bold=True, name='Arial', size='20')
+        for col_letter in self.call_columns:
+            ws_call.column_dimensions[col_letter].font = call_font
+            ws_call.column_dimensions[col_letter].alignment = self.alignment
+        call_row = []
+        for letter in ['B', 'I', 'N', 'G', 'O']:
+            cell = WriteOnlyCell(ws_call, letter)
+            cell.style = self.call_sheet
+            cell.font = Font(bold=True, name='Arial', size='20', color='FF0000')
+            call_row.append(cell)
+        ws_call.append(call_row)
+        for _ in range(2, 17):
+            ws_call.append([])
+        self.cell_styles = {'header': self.bingo_header.name}
+        for kind in ('plain', 'header-border', 'border', 'free'):
+            style = NamedStyle(name=f'bingo_{kind.replace("-", "_")}', font=copy(DEFAULT_FONT),
+                               alignment=copy(self.alignment))
+            if kind == 'header-border':
+                style.font = copy(self.bingo_header.font)
+            if kind.endswith('border'):
+                style.fill = copy(self.borders)
+            elif kind == 'free':
+                style.fill = copy(self.free_space)
+            self.writer.add_named_style(style)
+            self.cell_styles[kind] = style.name
+        ws_call.close()
+        self.called_rules = []
+        for column in range(5 * self.card_columns):
+            letter = get_column_letter(column + (column // 5) + 2)
+            call_letter = self.call_columns[column % 5]
+            self.called_rules.append((f'{letter}1:{letter}{self.card_rows * 7}', FormulaRule(
+                formula=[f'NOT(ISNA(VLOOKUP({letter}1,CALL!${call_letter}$2:${call_letter}$16,1,FALSE)))'],
+                fill=self.called_number)))
+
+    def styled_cell(self, ws, value, kind):
+        """Creates a cell with one of the styles registered when the workbook was opened"""
+        cell = WriteOnlyCell(ws, value)
+        cell.style = self.cell_styles[kind]
+        return cell
+
+    def add_sheet(self, sheet, sheet_cards):
+        """Writes one sheet's worksheet with every row in its final position and style"""
+        ws = self.writer.create_sheet(str(sheet))
+        width = 6 * self.card_columns + 1
+        for row in range(1, 7 * self.card_rows + 4):
+            ws.row_dimensions[row].height = 20
+        for column in range(1, width + 1):
+            ws.column_dimensions[get_column_letter(column)].width = 5
+        for cell_range, rule in self.called_rules:
+            ws.conditional_formatting.add(cell_range, rule)
+        border_row = [self.styled_cell(ws, None, 'border') for _ in range(width)]
+        header_row = [self.styled_cell(ws, value, 'header') for value in self.header]
+        header_row.append(self.styled_cell(ws, None, 'border'))
+        for column in range(0, width - 1, 6):
+            header_row[column] = self.styled_cell(ws, self.header[column], 'header-border')
+        ws.append(border_row)
+        for block in sheet_rows(sheet_cards, self.card_columns):
+            ws.append(header_row)
+            for values in block:
+                row = [self.styled_cell(ws, None, 'border')]
+                for column, value in enumerate(values):
+                    if column % 6 == 5:
+                        kind = 'border'
+                    elif value == "*":
+                        kind = 'free'
+                    else:
+                        kind = 'plain'
+                    row.append(self.styled_cell(ws, value, kind))
+                row.append(self.styled_cell(ws, None, 'border'))
+                ws.append(row)
+            ws.append(border_row)
+        for _ in range(-(-len(sheet_cards) // self.card_columns) * 7 + 1, 7 * self.card_rows + 3):
+            ws.append([])
+        ws.close()
+
+    def save(self):
+        """Finish the workbook"""
+        self.writer.save(self.excel_name)
+
+class TableTracker(Tracker):
+    """Tracks every card in one long table, so large runs don't need a worksheet per sheet"""
+    columns = ['Sheet', 'Card', 'Position', 'Number', 'Called']
+    column_widths = [10, 8, 10, 10, 10]
+
+    def __init__(self, excel_name, source_path, layout=None):
+        """Open the workbook, then add the CALLED lookup and the start of the CARDS table"""
+        super().__init__(excel_name, source_path, layout)
+        ws_called = self.writer.create_sheet('CALLED')
+        for number in range(1, 76):
+            ws_called.append([f'=COUNTIF(CALL!$A$2:$E$16,{number})>0'])
+        ws_called.close()
+        self.ws = self.writer.create_sheet('CARDS')
+        self.ws.freeze_panes = 'A2'
+        for column, width in enumerate(self.column_widths, start=1):
+            self.ws.column_dimensions[get_column_letter(column)].width = width
+        self.ws.append([self.styled_cell(self.ws, value, 'header') for value in self.columns])
+        self.row = 1
+
+    def add_sheet(self, sheet, sheet_cards):
+        """Appends a row for each position of each card on the sheet"""
+        for card, numbers in enumerate(sheet_cards, start=1):
+            for position, number in enumerate(numbers):
+                self.row += 1
+                if position == 12:
+                    self.ws.append([sheet, card, position + 1, 'FREE', True])
+                else:
+                    self.ws.append([sheet, card, position + 1, number,
+                                    f'=INDEX(CALLED!$A$1:$A$75,D{self.row})'])
+
+    def save(self):
+        """Highlight the called rows with a single rule, then finish the workbook"""
+        self.ws.auto_filter.ref = f'A1:E{self.row}'
+        self.ws.conditional_formatting.add(f'A2:E{self.row}', FormulaRule(
+            formula=['$E2=TRUE'], fill=self.called_number))
+        self.ws.close()
+        super().save()
+
+def sheet_rows(sheet_cards, columns=3):
+    """Lays out a sheet's cards as blocks of five rows, with the layout's columns of cards side by side"""
+    blocks = []
+    for first in range(0, len(sheet_cards), columns):
+        block = []
+        for row in range(5):
+            line = []
+            for card in sheet_cards[first:first + columns]:
+                card_row = card[(row * 5):(row * 5) + 5]
+                if row == 2:
+                    card_row[2] = "*"
+                line.extend(card_row)
+                line.append(" ")
+            block.append(line[:-1])
+        blocks.append(block)
+    return blocks
+
+def open_tracker(excel_name, source_path, table_tracker=False, layout=None, sheets=0):
+    """Opens the tracking spreadsheet in the chosen layout, switching to the single table, whose
+    memory use stays flat, when there are more sheets than a worksheet each allows"""
+    if not table_tracker and sheets > TRACKER_SHEET_LIMIT:
+        print(f"{sheets} sheets is more than the {TRACKER_SHEET_LIMIT} the spreadsheet can give a worksheet "
+              f"each - tracking them in a single CARDS table instead")
+        table_tracker = True
+    if table_tracker:
+        return TableTracker(excel_name, source_path, layout)
+    return Tracker(excel_name, source_path, layout)
+
+def generate_excel(cards, excel_name, source_path, table_tracker=False, layout=None):
+    """Takes the bingo numbers of each sheet and writes them to the Excel tracking spreadsheet"""
+    tracker = open_tracker(excel_name, source_path, table_tracker, layout, len(cards))
+    for sheet, sheet_cards in cards.items():
+        tracker.add_sheet(sheet, sheet_cards)
+    tracker.save()
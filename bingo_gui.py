@@ -5,8 +5,15 @@ from within bingo_card_generator
 '''
 
 import os
-from PyQt6 import QtGui, QtWidgets
+import threading
+import webcolors
+from PyQt6 import QtCore, QtGui, QtWidgets
 import bingo_card_generator
+import bingo_engine
+from bingo_card_generator import (__colour_groups__, __date__, __description__, __source__,
+                                  create_card, load_manifest_cards)
+from bingo_excel import open_tracker
+from bingo_layout import layout_from_args, orientations, paper_sizes
 
 basedir = os.path.dirname(__file__)
 description = bingo_card_generator.__description__
@@ -18,7 +25,728 @@ try:
 except ImportError:
     pass
 
-class BingoCard(QtWidgets.QMainWindow, bingo_card_generator.UiDialog):
+
+class UiDialog():
+    """This is the main class for setting up the UI"""
+    def setup_ui(self, Dialog):
+        """Instantiate and layout dialog options"""
+        Dialog.setObjectName("Dialog")
+        Dialog.setFixedSize(390, 260)
+        label_font = QtGui.QFont()
+        label_font.setPointSize(10.5)
+        label_font.setFamily("Arial")
+        label_font.StyleHint("SansSerif")
+        self.dauber_shape = QtWidgets.QComboBox(Dialog)
+        self.dauber_shape.setGeometry(QtCore.QRect(134, 167, 131, 27))
+        self.dauber_shape.setEditable(False)
+        self.dauber_shape.setObjectName("dauber_shape")
+        item_count = 1
+        while item_count < 12:
+            self.dauber_shape.addItem("")
+            item_count += 1
+        self.dauber_shape.currentIndexChanged[int].connect(self.on_select)
+        self.dauber_shape_label = QtWidgets.QLabel(Dialog)
+        self.dauber_shape_label.setGeometry(QtCore.QRect(10, 172, 121, 21))
+        self.dauber_shape_label.setToolTipDuration(-1)
+        self.dauber_shape_label.setObjectName("dauber_shape_label")
+        self.dauber_shape_label.setFont(label_font)
+        self.title_label = QtWidgets.QLabel(Dialog)
+        self.title_label.setGeometry(QtCore.QRect(0, 21, 388, 20))
+        title_font = QtGui.QFont()
+        title_font.setWeight(700)
+        title_font.setPointSize(11)
+        title_font.setFamily("Arial")
+        title_font.StyleHint("SansSerif")
+        self.title_label.setFont(title_font)
+        self.title_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.title_label.setObjectName("title_label")
+        self.dauber_colour_label = QtWidgets.QLabel(Dialog)
+        self.dauber_colour_label.setGeometry(QtCore.QRect(10, 132, 121, 21))
+        self.dauber_colour_label.setToolTipDuration(-1)
+        self.dauber_colour_label.setObjectName("dauber_colour_label")
+        self.dauber_colour_label.setFont(label_font)
+        self.card_colour_label = QtWidgets.QLabel(Dialog)
+        self.card_colour_label.setGeometry(QtCore.QRect(10, 92, 121, 21))
+        self.card_colour_label.setToolTipDuration(-1)
+        self.card_colour_label.setObjectName("card_colour_label")
+        self.card_colour_label.setFont(label_font)
+        self.select_logo_button = QtWidgets.QPushButton(Dialog)
+        self.select_logo_button.setGeometry(QtCore.QRect(280, 167, 100, 27))
+        self.select_logo_button.setDefault(False)
+        self.select_logo_button.setObjectName("select_logo_button")
+        self.select_logo_button.clicked.connect(self.select_logo)
+        self.select_logo_button.setEnabled(False)
+        self.select_logo_button.setVisible(False)
+        self.select_logo_button.setFont(label_font)
+        self.select_result = QtWidgets.QLineEdit(Dialog)
+        self.select_result.setObjectName("select_result")
+        self.select_result.setReadOnly(True)
+        self.select_result.setVisible(False)
+        self.select_result.setGeometry(QtCore.QRect(8, 205, 372, 30))
+        self.select_result.setFont(label_font)
+        self.set_card_title = QtWidgets.QPushButton("Card Title", Dialog)
+        self.set_card_title.setObjectName("set_card_title")
+        self.set_card_title.setFont(label_font)
+        self.set_card_title.clicked.connect(self.enter_title)
+        self.set_card_title.setGeometry(QtCore.QRect(280, 47, 100, 31))
+        self.card_title = QtWidgets.QLineEdit(Dialog)
+        self.card_title.setVisible(False)
+        self.pdf_jobs = QtWidgets.QLineEdit(Dialog)
+        self.pdf_jobs.setText("1")
+        self.pdf_jobs.setVisible(False)
+        self.cards_per_sheet = QtWidgets.QLineEdit(Dialog)
+        self.cards_per_sheet.setText("6")
+        self.cards_per_sheet.setVisible(False)
+        self.paper = QtWidgets.QLineEdit(Dialog)
+        self.paper.setText("letter")
+        self.paper.setVisible(False)
+        self.orientation = QtWidgets.QLineEdit(Dialog)
+        self.orientation.setText("landscape")
+        self.orientation.setVisible(False)
+        self.close = QtWidgets.QPushButton(Dialog)
+        self.close.setGeometry(QtCore.QRect(280, 127, 100, 31))
+        self.close.setObjectName("close")
+        self.close.setFont(label_font)
+        self.close.clicked.connect(QtWidgets.QApplication.instance().quit)
+        self.number_label = QtWidgets.QLabel(Dialog)
+        self.number_label.setGeometry(QtCore.QRect(10, 52, 121, 21))
+        self.number_label.setToolTipDuration(-1)
+        self.number_label.setObjectName("number_label")
+        self.number_label.setFont(label_font)
+        self.number = QtWidgets.QLineEdit(Dialog)
+        self.number.setGeometry(QtCore.QRect(134, 47, 131, 31))
+        self.number.setText("1")
+        self.number.setObjectName("number")
+        self.generate = QtWidgets.QPushButton(Dialog)
+        self.generate.setGeometry(QtCore.QRect(280, 87, 100, 31))
+        self.generate.setDefault(False)
+        self.generate.setFont(label_font)
+        self.generate.setObjectName("generate")
+        self.generate.clicked.connect(self.start_generate)
+        self.generate_thread = None
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.wait_generate)
+        self.card_colour = QtWidgets.QLineEdit(Dialog)
+        self.card_colour.setGeometry(QtCore.QRect(134, 87, 131, 31))
+        self.card_colour.setObjectName("card_colour")
+        self.card_colour_picker = QtWidgets.QPushButton(Dialog)
+        self.card_colour_picker.setObjectName("card_colour_picker")
+        self.card_colour_picker.clicked.connect(self.card_colourpicker)
+        self.card_colour_picker.setGeometry(QtCore.QRect(110, 92, 20, 20))
+        self.card_colour_picker.setStyleSheet("background-color: blue; border: 1px solid black")
+        self.dauber_colour = QtWidgets.QLineEdit(Dialog)
+        self.dauber_colour.setGeometry(QtCore.QRect(134, 127, 131, 31))
+        self.dauber_colour.setObjectName("dauber_colour")
+        self.dauber_colour.setEnabled(False)
+        self.dauber_colour_picker = QtWidgets.QPushButton(Dialog)
+        self.dauber_colour_picker.setObjectName("dauber_colour_picker")
+        self.dauber_colour_picker.clicked.connect(self.dauber_colourpicker)
+        self.dauber_colour_picker.setGeometry(QtCore.QRect(110, 132, 20, 20))
+        self.dauber_colour_picker.setStyleSheet("background-color: red; border: 1px solid black")
+        self.dauber_colour_picker.setEnabled(False)
+        self.source_label = QtWidgets.QLabel(Dialog)
+        self.source_label.setGeometry(QtCore.QRect(4, 240, 372, 20))
+        self.source_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.source_label.setObjectName("source_label")
+        self.source_label.setOpenExternalLinks(True)
+        self.source_label.setParent(self)
+        link_template = '<a href={0}>{1}</a>'
+        self.source_label.setText(link_template.format(__source__,
+                                                       'Source @ GitHub.com/digitalsleuth'))
+        self.dauber_shape_label.setBuddy(self.dauber_shape)
+        self.dauber_colour_label.setBuddy(self.dauber_colour)
+        self.card_colour_label.setBuddy(self.card_colour)
+        self.number_label.setBuddy(self.number)
+        self.retranslate_ui(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+        Dialog.setTabOrder(self.number, self.card_colour)
+        Dialog.setTabOrder(self.card_colour, self.dauber_colour)
+        Dialog.setTabOrder(self.dauber_colour, self.dauber_shape)
+        Dialog.setTabOrder(self.dauber_shape, self.set_card_title)
+        Dialog.setTabOrder(self.set_card_title, self.generate)
+        Dialog.setTabOrder(self.generate, self.select_logo_button)
+        Dialog.setTabOrder(self.select_logo_button, self.close)
+
+    def retranslate_ui(self, Dialog):
+        """Translate layout of the UI components"""
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", __description__))
+        self.dauber_shape.setCurrentText(_translate("Dialog", "Circle"))
+        self.dauber_shape.setItemText(0, _translate("Dialog", "Checkmark"))
+        self.dauber_shape.setItemText(1, _translate("Dialog", "Circle"))
+        self.dauber_shape.setItemText(2, _translate("Dialog", "Clover"))
+        self.dauber_shape.setItemText(3, _translate("Dialog", "Heart"))
+        self.dauber_shape.setItemText(4, _translate("Dialog", "Logo"))
+        self.dauber_shape.setItemText(5, _translate("Dialog", "Maple-Leaf"))
+        self.dauber_shape.setItemText(6, _translate("Dialog", "Moon"))
+        self.dauber_shape.setItemText(7, _translate("Dialog", "Square"))
+        self.dauber_shape.setItemText(8, _translate("Dialog", "Star"))
+        self.dauber_shape.setItemText(9, _translate("Dialog", "Unicorn"))
+        self.dauber_shape.setItemText(10, _translate("Dialog", "X-Mark"))
+        self.dauber_shape_label.setToolTip(_translate("Dialog", "Choose the shape of the dauber"))
+        self.dauber_shape_label.setText(_translate("Dialog", "Dauber Shape"))
+        self.title_label.setText(_translate("Dialog", __description__))
+        self.dauber_colour.setText(_translate("Dialog", "Red"))
+        self.dauber_colour_label.setToolTip(_translate("Dialog", "Choose the colour of the dauber"))
+        self.dauber_colour_label.setText(_translate("Dialog", "Dauber Colour"))
+        self.card_colour.setText(_translate("Dialog", "Blue"))
+        self.card_colour_label.setToolTip(_translate("Dialog", "Choose the colour of the card"))
+        self.card_colour_label.setText(_translate("Dialog", "Card Colour"))
+        self.generate.setText(_translate("Dialog", "Generate"))
+        self.select_logo_button.setText(_translate("Dialog", "Select Logo"))
+        self.close.setText(_translate("Dialog", "Close"))
+        self.number_label.setToolTip(_translate("Dialog", "Choose the number of cards"))
+        self.number_label.setText(_translate("Dialog", "# of Cards"))
+        self.card_colour.setPlaceholderText(_translate("Dialog", "Blue"))
+        self.dauber_colour.setPlaceholderText(_translate("Dialog", "Red"))
+        self._menu_bar()
+
+    def get_directory(self):
+        """Get the output directory"""
+        dialogBox = QtWidgets.QFileDialog()
+        dialogBox.setFileMode(QtWidgets.QFileDialog.FileMode.Directory)
+        dialogBox.setOption(QtWidgets.QFileDialog.Option.ShowDirsOnly)
+        chosenPath = dialogBox.getExistingDirectory(self,
+                                                    'Select the output location for your cards',
+                                                    os.path.curdir)
+        selected_dir = QtCore.QDir.toNativeSeparators(chosenPath)
+
+        return selected_dir
+
+    def select_logo(self):
+        """Determine if the Logo option is selected and provide the result"""
+        index = self.dauber_shape.currentIndex()
+        if ((index == 4) and self.select_result.text() == ''):
+            selected_file, _ = QtWidgets.QFileDialog.getOpenFileName(self,
+                                                                     "Select the image to use",
+                                                                     "",
+                                                                     "Image Files (*.jpg *.png)")
+            selected_file = QtCore.QDir.toNativeSeparators(selected_file)
+            self.select_result.setText(selected_file)
+        elif ((index == 4) and self.select_result.text() != ''):
+            selected_file = self.select_result.text()
+        else:
+            selected_file = False
+
+        return selected_file
+
+    def allow_select(self):
+        """Used to determine if the dauber selection option is checked"""
+        return bool(self.allow_choices_action.isChecked())
+
+    def on_select(self, index):
+        """Modifies display of UI components depending on dropdown selection"""
+        self.select_logo_button.setEnabled(index == 4)
+        self.select_logo_button.setVisible(index == 4)
+        self.select_result.setVisible(index == 4)
+        self.dauber_colour.setEnabled(index in (1, 3, 5, 7))
+        self.dauber_colour_picker.setEnabled(index in (1, 3, 5, 7))
+
+    def dauber_colourpicker(self):
+        """Colour picker for choosing the dauber colour"""
+        dauberColour = QtWidgets.QColorDialog.getColor()
+        colour_db = webcolors.CSS3_HEX_TO_NAMES
+        if dauberColour.isValid():
+            if dauberColour.name() in colour_db.keys():
+                colour_name = (colour_db[dauberColour.name()]).capitalize()
+            else:
+                colour_name = (dauberColour.name()).upper()
+            self.dauber_colour_picker.setStyleSheet(f'background-color: {colour_name};'
+                                                    f' border: 1px solid black')
+            self.dauber_colour.setText(colour_name)
+        else:
+            self.dauber_colour_picker.setStyleSheet(f'background-color: {self.dauber_colour.text()};'
+                                                    f' border: 1px solid black')
+            self.dauber_colour.setText(self.dauber_colour.text())
+
+    def card_colourpicker(self):
+        """Colour picker for choosing the card colour"""
+        cardColour = QtWidgets.QColorDialog.getColor()
+        colour_db = webcolors.CSS3_HEX_TO_NAMES
+        if cardColour.isValid():
+            if cardColour.name() in colour_db.keys():
+                colour_name = (colour_db[cardColour.name()]).capitalize()
+            else:
+                colour_name = (cardColour.name()).upper()
+            self.card_colour_picker.setStyleSheet(f'background-color: {colour_name};'
+                                                  f' border: 1px solid black')
+            self.card_colour.setText(colour_name)
+        else:
+            self.card_colour_picker.setStyleSheet(f'background-color: {self.card_colour.text()};'
+                                                  f' border: 1px solid black')
+            self.card_colour.setText(self.card_colour.text())
+
+    def enter_title(self):
+        """Enter the title for the card"""
+        title_dialog = QtWidgets.QInputDialog()
+        title_dialog.setWindowFlags(QtCore.Qt.WindowType.WindowSystemMenuHint |
+                                    QtCore.Qt.WindowType.WindowTitleHint)
+        title, clicked = title_dialog.getText(self,
+                                              "Enter your title choice",
+                                              "Title:",
+                                              QtWidgets.QLineEdit.EchoMode.Normal,
+                                              self.card_title.text())
+        if clicked and title:
+            self.card_title.setText(title)
+        else:
+            self.card_title.setText(self.card_title.text())
+
+    def enter_jobs(self):
+        """Enter the number of PDF's to render at the same time"""
+        jobs, clicked = QtWidgets.QInputDialog.getInt(self,
+                                                      "PDF Jobs",
+                                                      "PDF's to render at the same time:",
+                                                      int(self.pdf_jobs.text()),
+                                                      1, (os.cpu_count() or 1) * 4)
+        if clicked:
+            self.pdf_jobs.setText(str(jobs))
+
+    def enter_layout(self):
+        """Choose the number of cards on each sheet, and the paper and orientation to print them on"""
+        counts = ['1', '2', '3', '4', '6', '8', '9', '12', '16']
+        cards, clicked = QtWidgets.QInputDialog.getItem(self, "Page Layout", "Cards per sheet:", counts,
+                                                        counts.index(self.cards_per_sheet.text()), False)
+        if not clicked:
+            return
+        papers = [name for name, _, _ in paper_sizes.values()]
+        paper, clicked = QtWidgets.QInputDialog.getItem(self, "Page Layout", "Paper:", papers,
+                                                        list(paper_sizes).index(self.paper.text()), False)
+        if not clicked:
+            return
+        turns = [orientation.title() for orientation in orientations]
+        orientation, clicked = QtWidgets.QInputDialog.getItem(self, "Page Layout", "Orientation:", turns,
+                                                              orientations.index(self.orientation.text()),
+                                                              False)
+        if clicked:
+            self.cards_per_sheet.setText(cards)
+            self.paper.setText(paper.lower())
+            self.orientation.setText(orientation.lower())
+
+    def start_generate(self):
+        """Run the pipeline on a worker thread, showing its progress with the option to cancel"""
+        output = self.get_directory()
+        if not output:
+            return
+        number = int(self.number.text())
+        gui_args = (number,
+                    self.card_colour.text(),
+                    self.dauber_colour.text(),
+                    self.dauber_shape.currentText(),
+                    output,
+                    self.select_logo(),
+                    self.allow_select(),
+                    self.easy_mode(),
+                    self.card_title.text(),
+                    int(self.pdf_jobs.text()),
+                    self.merge_pdf(),
+                    self.shared_assets(),
+                    self.offline(),
+                    self.table_tracker(),
+                    self.sprite_daubers(),
+                    self.builtin_pdf(),
+                    int(self.cards_per_sheet.text()),
+                    self.paper.text(),
+                    self.orientation.text())
+        self.generate_done = 0
+        self.progress_box = QtWidgets.QDialog(self, QtCore.Qt.WindowType.WindowTitleHint)
+        self.progress_box.setWindowTitle("Generating")
+        self.progress_box.setFixedSize(360, 115)
+        self.progress_box.setWindowModality(QtCore.Qt.WindowModality.ApplicationModal)
+        self.progress_label = QtWidgets.QLabel(f"Generating {number} cards...", self.progress_box)
+        self.progress_label.setGeometry(QtCore.QRect(10, 10, 340, 21))
+        self.progress_bar = QtWidgets.QProgressBar(self.progress_box)
+        self.progress_bar.setGeometry(QtCore.QRect(10, 37, 340, 25))
+        self.progress_bar.setRange(0, number)
+        self.cancel_button = QtWidgets.QPushButton("Cancel", self.progress_box)
+        self.cancel_button.setGeometry(QtCore.QRect(250, 72, 100, 31))
+        self.cancel_button.clicked.connect(self.cancel_generate)
+        self.progress_box.rejected.connect(self.cancel_generate)
+        self.generate_thread = QtCore.QThread()
+        self.generate_worker = GenerateWorker(gui_args)
+        self.generate_worker.moveToThread(self.generate_thread)
+        self.generate_thread.started.connect(self.generate_worker.run)
+        self.generate_worker.progress.connect(self.generate_progress)
+        self.generate_worker.finished.connect(self.generate_finished)
+        self.generate_worker.failed.connect(self.generate_failed)
+        self.generate.setEnabled(False)
+        self.progress_box.show()
+        self.generate_thread.start()
+
+    def generate_progress(self, done, total):
+        """Move the progress bar on as each card is finished"""
+        self.generate_done = done
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+        if not self.generate_worker.cancel_event.is_set():
+            self.progress_label.setText(f"Card {done} of {total} finished")
+
+    def cancel_generate(self):
+        """Ask the worker to stop once the card it is working on is finished"""
+        self.generate_worker.cancel_event.set()
+        self.cancel_button.setEnabled(False)
+        self.progress_label.setText("Cancelling, finishing the current card...")
+
+    def stop_generate(self):
+        """Wait for the worker thread and close the progress dialog"""
+        self.generate_thread.quit()
+        self.generate_thread.wait()
+        self.generate_thread = None
+        self.progress_box.close()
+        self.generate.setEnabled(True)
+
+    def wait_generate(self):
+        """Stop a run still in progress when the application is closed"""
+        if self.generate_thread is not None:
+            self.generate_worker.cancel_event.set()
+            self.generate_thread.quit()
+            self.generate_thread.wait()
+
+    def generate_finished(self, args):
+        """Report the finished, or cancelled, run"""
+        cancelled = self.generate_worker.cancel_event.is_set()
+        self.stop_generate()
+        if cancelled:
+            results_msgbox = QtWidgets.QMessageBox()
+            results_msgbox.setIcon(QtWidgets.QMessageBox.Icon.Information)
+            results_msgbox.setWindowTitle("Cancelled")
+            results_msgbox.setText(f"Cancelled after {self.generate_done} of {args['num']} cards.\n\n"
+                                   f"The finished cards and the Excel file for them are in "
+                                   f"{args['output']}")
+            results_msgbox.setStandardButtons(QtWidgets.QMessageBox.StandardButton.Ok)
+            results_msgbox.exec()
+        else:
+            show_results(args)
+
+    def generate_failed(self, error):
+        """Report a run which stopped with an error"""
+        self.stop_generate()
+        QtWidgets.QMessageBox.critical(self, "Error", f"The cards could not be generated:\n\n{error}")
+
+    def merge_pdf(self):
+        """Used to determine if all sheets should be printed to a single PDF"""
+        return bool(self.merge_pdf_action.isChecked())
+
+    def shared_assets(self):
+        """Used to determine if the CSS, JS and images should be shared between cards"""
+        return bool(self.shared_assets_action.isChecked())
+
+    def offline(self):
+        """Used to determine if the cards should work without a network connection"""
+        return bool(self.offline_action.isChecked())
+
+    def table_tracker(self):
+        """Used to determine if the spreadsheet should track every card in a single table"""
+        return bool(self.table_tracker_action.isChecked())
+
+    def sprite_daubers(self):
+        """Will draw the daubers as SVG images if checked"""
+        return bool(self.sprite_daubers_action.isChecked())
+
+    def builtin_pdf(self):
+        """Will draw the PDF's with the built-in writer instead of wkhtmltopdf if checked"""
+        return bool(self.builtin_pdf_action.isChecked())
+
+    def easy_mode(self):
+        """That was easy.."""
+
+        return bool(self.easy_mode_action.isChecked())
+
+    def _menu_bar(self):
+        """Add a menu bar"""
+        self.menu_bar = self.menuBar()
+        self.exit_action = QtGui.QAction("&Exit", self)
+        self.exit_action.triggered.connect(QtWidgets.QApplication.instance().quit)
+        self.caller_action = QtGui.QAction("&Call Numbers...", self)
+        self.caller_action.triggered.connect(self._caller)
+        self.file_menu = QtWidgets.QMenu("&File", self)
+        self.file_menu.addAction(self.caller_action)
+        self.file_menu.addAction(self.exit_action)
+        self.menu_bar.addMenu(self.file_menu)
+        self.options_menu = self.menu_bar.addMenu("&Options")
+        self.easy_mode_action = QtGui.QAction("&Easy", self, checkable=True)
+        self.easy_mode_action.triggered.connect(self.easy_mode)
+        self.options_menu.addAction(self.easy_mode_action)
+        self.allow_choices_action = QtGui.QAction("&Allow Dauber Selection", self, checkable=True)
+        self.allow_choices_action.triggered.connect(self.allow_select)
+        self.options_menu.addAction(self.allow_choices_action)
+        self.pdf_jobs_action = QtGui.QAction("PDF &Jobs...", self)
+        self.pdf_jobs_action.triggered.connect(self.enter_jobs)
+        self.options_menu.addAction(self.pdf_jobs_action)
+        self.layout_action = QtGui.QAction("Page &Layout...", self)
+        self.layout_action.triggered.connect(self.enter_layout)
+        self.options_menu.addAction(self.layout_action)
+        self.merge_pdf_action = QtGui.QAction("&Merge PDF's", self, checkable=True)
+        self.merge_pdf_action.triggered.connect(self.merge_pdf)
+        self.options_menu.addAction(self.merge_pdf_action)
+        self.shared_assets_action = QtGui.QAction("&Shared Assets", self, checkable=True)
+        self.shared_assets_action.triggered.connect(self.shared_assets)
+        self.options_menu.addAction(self.shared_assets_action)
+        self.offline_action = QtGui.QAction("&Offline Cards", self, checkable=True)
+        self.offline_action.triggered.connect(self.offline)
+        self.options_menu.addAction(self.offline_action)
+        self.table_tracker_action = QtGui.QAction("Single &Table Tracker", self, checkable=True)
+        self.table_tracker_action.triggered.connect(self.table_tracker)
+        self.options_menu.addAction(self.table_tracker_action)
+        self.sprite_daubers_action = QtGui.QAction("S&prite Daubers", self, checkable=True)
+        self.sprite_daubers_action.triggered.connect(self.sprite_daubers)
+        self.options_menu.addAction(self.sprite_daubers_action)
+        self.builtin_pdf_action = QtGui.QAction("&Built-in PDF Writer", self, checkable=True)
+        self.builtin_pdf_action.triggered.connect(self.builtin_pdf)
+        self.options_menu.addAction(self.builtin_pdf_action)
+        self.help_menu = self.menu_bar.addMenu("&Help")
+        self.help_content_action = QtGui.QAction("&Usage", self)
+        self.help_content_action.triggered.connect(self._help_menu)
+        self.about_action = QtGui.QAction("&About", self)
+        self.about_action.triggered.connect(self._about)
+        self.help_menu.addAction(self.help_content_action)
+        self.help_menu.addAction(self.about_action)
+
+    def _help_menu(self):
+        """Add a help menu to the menu bar"""
+        self.help_box = QtWidgets.QDialog(None, QtCore.Qt.WindowType.WindowCloseButtonHint)
+        self.help_box.setWindowTitle("Help")
+        self.help_label = QtWidgets.QLabel()
+        help_scroll = QtWidgets.QScrollArea(self.help_box)
+        help_scroll.setWidget(self.help_label)
+        help_scroll.setWidgetResizable(True)
+        help_layout = QtWidgets.QVBoxLayout(self.help_box)
+        help_layout.setContentsMargins(0, 0, 0, 0)
+        help_layout.addWidget(help_scroll)
+        help_font = QtGui.QFont()
+        help_font.setPointSize(10)
+        help_font.setFamily("Arial")
+        help_font.StyleHint("SansSerif")
+        self.help_label.setMargin(10)
+        self.help_label.setFont(help_font)
+        text = (f"# of Cards:\tChoose how many cards you would like to generate - must be a "
+                f"number\n\n"
+                f"Card Colour:\tEither click the colour box to open a Colour Picker dialog box\n"
+                f"\t\tor type the colour into the text box. Colour names are drawn from:\n"
+                f"\t\t{__colour_groups__}\n\n"
+                f"Dauber Colour:\tAs with Card Colour, click the colour box for the"
+                f" Colour Picker\n"
+                f"\t\tor type the colour into the text box. Colour names are drawn from:\n"
+                f"\t\t{__colour_groups__}\n\n"
+                f"Dauber Shape:\tClick the dropdown box to choose the shape of the dauber to be"
+                f" used\n"
+                f"\t\tThe 'Logo' option will present the option to choose a custom file or logo to"
+                f" use\n"
+                f"\t\tas a dauber. This file will be resized to 48x48px, so ensure the image you"
+                f" choose\n"
+                f"\t\tis of a good quality to start.\n"
+                f"\t\tThe Dauber Shape option works in conjunction with 'Allow Dauber Choices'."
+                f"\n\n"
+                f"Card Title:\tThis allows you to put a title or text banner at the top of the "
+                f"card, which\n\t\tappears under the card number - eg. 'BINGO BONANZA 2023!'\n\n"
+                f"Generate:\tWill generate the bingo cards with the selected options. "
+                f"If some options\n"
+                f"\t\tare left blank, defaults will be selected (blue card, red circle dauber).\n"
+                f"\t\tWill then pop up a directory selection box to choose where to save the files."
+                f"\n\t\tA progress bar follows the cards as they are finished, and Cancel stops"
+                f" after\n\t\tthe current card.\n\n"
+                f"Close:\t\tSelf-explanatory, will close the application.\n\n"
+                f"Select Logo:\tThis option only appears when 'Logo' is chosen from the"
+                f" 'Dauber Shape'\n"
+                f"\t\tdrop-down box. Opens a File Chooser dialog to select either a"
+                f" JPG or PNG file.\n"
+                f"\t\tThe file chosen will show in the box below to confirm the choice.\n\n"
+                f"Options Menu:\tEasy means when a number is selected, it is selected on all spots "
+                f"that contain\n"
+                f"\t\tthe number which was clicked. If B4 is called, when the player daubs it on\n"
+                f"\t\tone card, it is automatically 'daubbed' on all cards on the sheet.\n"
+                f"\t\tIf this option is not selected, play is as per normal.\n"
+                f"\t\tNOTE: This option is not presented to the player, and is only available "
+                f"within\n\t\tthe application.\n\n"
+                f"\t\tAllow Dauber Choices presents the player the option to choose their own "
+                f"dauber\n\t\tfrom a drop-down box at the top of the card. "
+                f"Option is not available if not selected.\n\n"
+                f"\t\tPDF Jobs sets how many PDF's are rendered at the same time. "
+                f"The default of 1\n\t\trenders them one after the other.\n\n"
+                f"\t\tPage Layout sets the number of cards on each sheet, and the paper size and\n"
+                f"\t\torientation of the PDF's. The cards are arranged in rows and columns to suit.\n\n"
+                f"\t\tMerge PDF's prints all of the sheets as pages of a single PDF.\n\n"
+                f"\t\tShared Assets writes the CSS, script and images once, and links them from "
+                f"each\n\t\tcard. Keep them with the HTML files when sharing the cards."
+                f"\n\n"
+                f"\t\tOffline Cards uses a built-in script instead of loading jQuery, so the "
+                f"cards\n\t\tand PDF's need no network connection.\n\n"
+                f"\t\tSingle Table Tracker lists every card in one CARDS table in the Excel file,\n"
+                f"\t\tinstead of one worksheet per sheet. Filter it by sheet and card number. It is\n"
+                f"\t\tused for every run of more than 500 sheets, to keep the memory used flat.\n\n"
+                f"\t\tSprite Daubers draws the shape daubers once as small SVG images, which are\n"
+                f"\t\tquicker to daub on phones and to print to PDF.\n\n"
+                f"\t\tBuilt-in PDF Writer draws the PDF's straight from the card numbers, which is\n"
+                f"\t\tmuch faster, and does not need wkhtmltopdf to be installed.\n\n"
+                f"The final output of the application will be a combination of HTML files, "
+                f"PDF files and a single Excel\n"
+                f"spreadsheet. The HTML and PDF files will be named for the card number and "
+                f"colour\n(ie. 1-BLUE.html, 1-BLUE.pdf). Both the HTML and PDF file should be given"
+                f" to the player so they have\nan option to print or click.\n\n"
+                f"The Excel file is named for the card colour, and allows you to enter the numbers "
+                f"called into the CALL\n"
+                f"sheet, and when Bingo is called, you can click on the sheet with the card number "
+                f"on it and the called\nnumbers will be automatically highlighted. "
+                f"This enables easy confirmation of a successful BINGO!\n\n"
+                f"File > Call Numbers opens the manifest written with the cards. Choose the pattern"
+                f" to play for,\nthen enter each number as it is called, and every card which"
+                f" completes the pattern is\nlisted straight away.")
+        self.help_label.setText(text)
+        # The dialog fits the help text where the screen allows, and scrolls where it doesn't
+        screen = QtGui.QGuiApplication.primaryScreen().availableGeometry()
+        text_size = self.help_label.sizeHint()
+        self.help_box.resize(text_size.width() + help_scroll.verticalScrollBar().sizeHint().width() + 5,
+                             min(text_size.height() + 5, screen.height() - 80))
+
+        self.help_box.exec()
+
+    def _caller(self):
+        """Open a game's manifest and check for winners as each number is called"""
+        manifest_file, _ = QtWidgets.QFileDialog.getOpenFileName(self,
+                                                                 "Select the manifest of the cards in play",
+                                                                 "",
+                                                                 "Card Manifests (*-manifest.jsonl)")
+        if not manifest_file:
+            return
+        patterns = [name.replace('-', ' ').title() for name in bingo_engine.PATTERNS] + ['Custom...']
+        pattern, clicked = QtWidgets.QInputDialog.getItem(self, "Winning Pattern",
+                                                          "Pattern to play for:", patterns, 0, False)
+        if not clicked:
+            return
+        if pattern == 'Custom...':
+            pattern, clicked = QtWidgets.QInputDialog.getMultiLineText(
+                self, "Custom Pattern", "Mark the cells of the pattern with X:",
+                ".....\n.....\n.....\n.....\n.....")
+            if not clicked:
+                return
+        try:
+            self.engine = bingo_engine.WinnerEngine(load_manifest_cards(manifest_file), [pattern])
+        except ValueError as err:
+            QtWidgets.QMessageBox.warning(self, "Winning Pattern", str(err))
+            return
+        self.caller_box = QtWidgets.QDialog(None, QtCore.Qt.WindowType.WindowCloseButtonHint)
+        self.caller_box.setWindowTitle("Call Numbers")
+        self.caller_box.setFixedSize(420, 400)
+        self.call_number = QtWidgets.QLineEdit(self.caller_box)
+        self.call_number.setGeometry(QtCore.QRect(10, 10, 300, 31))
+        self.call_number.setPlaceholderText("Called number, eg. N42")
+        self.call_button = QtWidgets.QPushButton("Call", self.caller_box)
+        self.call_button.setGeometry(QtCore.QRect(320, 10, 90, 31))
+        self.call_log = QtWidgets.QListWidget(self.caller_box)
+        self.call_log.setGeometry(QtCore.QRect(10, 50, 400, 340))
+        self.call_log.addItem(f"{len(self.engine.card_ids)} cards in play for {pattern}")
+        self.call_button.clicked.connect(self._call_number)
+        self.call_number.returnPressed.connect(self._call_number)
+        self.caller_box.exec()
+
+    def _call_number(self):
+        """Call the entered number and list any new winners"""
+        text = self.call_number.text()
+        self.call_number.clear()
+        try:
+            number = bingo_engine.parse_call(text)
+            wins = self.engine.call(number)
+        except ValueError as err:
+            self.call_log.addItem(str(err))
+            return
+        self.call_log.addItem(f"Called {'BINGO'[(number - 1) // 15]}{number}")
+        for sheet, card, line in wins:
+            self.call_log.addItem(f"BINGO! Card {sheet}, #{card} - {line}")
+        self.call_log.scrollToBottom()
+
+    def _about(self):
+        """Add an About menu to the menu bar"""
+        self.about_box = QtWidgets.QMessageBox()
+        self.about_box.setIcon(QtWidgets.QMessageBox.Icon.Information)
+        self.about_box.setWindowTitle(f"About {__description__}")
+        self.about_box.setText(f"{__description__}\t\t\t\n"
+                               f"Last Updated: {__date__}")
+        link_template = '<a href={0}>{1}</a>'
+        self.about_box.setInformativeText(link_template.format(__source__, __source__))
+        self.about_box.setStandardButtons(QtWidgets.QMessageBox.StandardButton.Ok)
+        self.about_box.exec()
+
+def gui_everything(number, card_colour, dauber_colour, dauber_shape,
+                   output, logo, allow_select, easy, title, jobs=1, merge_pdf=False,
+                   shared_assets=False, offline=False, table_tracker=False,
+                   sprite_daubers=False, builtin_pdf=False, cards_per_sheet=6, paper='letter',
+                   orientation='landscape', progress=None, cancelled=None):
+    """Takes all input from the GUI and passes it to the various functions"""
+    args = {'num': number,
+            'pdf': True,
+            'card_colour': card_colour,
+            'dauber_colour': dauber_colour,
+            'dauber_shape': dauber_shape,
+            'logo': logo,
+            'allow_select': allow_select,
+            'base_colour': card_colour,
+            'output': output,
+            'easy': easy,
+            'title': title,
+            'excel': f'{str((card_colour).strip("#"))}-cards.xlsx',
+            'everything': True,
+            'jobs': jobs,
+            'merge_pdf': merge_pdf,
+            'shared_assets': shared_assets,
+            'offline': offline,
+            'table_tracker': table_tracker,
+            'sprite_daubers': sprite_daubers,
+            'pdf_engine': 'builtin' if builtin_pdf else 'wkhtmltopdf',
+            'cards_per_sheet': cards_per_sheet,
+            'paper': paper,
+            'orientation': orientation}
+    if not output:
+        return
+    tracker = open_tracker(args['excel'], args['output'], table_tracker, layout_from_args(args),
+                           int(args['num']))
+    create_card(args, tracker, progress, cancelled)
+    tracker.save()
+    return args
+
+def show_results(args):
+    """Tells the user what was created once the GUI run has finished"""
+    if args['num'] == 1:
+        amt = 'card'
+    else:
+        amt = 'cards'
+    dauber_shape = args['dauber_shape']
+    if dauber_shape.lower() not in ('circle', 'square', 'maple-leaf', 'heart'):
+        dauber_colour = ''
+    else:
+        dauber_colour = f"{args['dauber_colour'].lower()} "
+    results_msgbox = QtWidgets.QMessageBox()
+    results_msgbox.setIcon(QtWidgets.QMessageBox.Icon.Information)
+    results_msgbox.setWindowTitle("Finished")
+    results_msgbox.setText(f"All files created in {args['output']}\n\n{str(args['num'])}"
+                           f" {args['card_colour'].upper().strip('#')} {amt} created with a "
+                           f"{dauber_colour.upper().strip('#')}{dauber_shape.upper()} dauber.\n"
+                           f"Excel file named {(args['excel'].upper())} created for tracking "
+                           f"called numbers.\n\n"
+                           f"You may now close the Bingo Card Generator, or generate more cards.")
+    results_msgbox.setStandardButtons(QtWidgets.QMessageBox.StandardButton.Ok)
+    results_msgbox.exec()
+
+class GenerateWorker(QtCore.QObject):
+    """Runs the GUI pipeline on a worker thread, reporting each card as it is finished"""
+    progress = QtCore.pyqtSignal(int, int)
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, gui_args):
+        """Keep the GUI input for the run"""
+        super().__init__()
+        self.gui_args = gui_args
+        self.cancel_event = threading.Event()
+
+    def run(self):
+        """Generate everything, then report back to the GUI thread"""
+        try:
+            args = gui_everything(*self.gui_args, progress=self.progress.emit,
+                                  cancelled=self.cancel_event.is_set)
+        except Exception as err:  # shown to the user, rather than lost with the thread
+            self.failed.emit(str(err))
+        else:
+            self.finished.emit(args)
+
+class BingoCard(QtWidgets.QMainWindow, UiDialog):
     """BingoCard Class"""
     def __init__(self, parent=None):
         """Call and setup the UI"""
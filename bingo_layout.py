@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+'''
+Describes how the cards are arranged on each sheet and the paper it is printed on,
+so the HTML cards, the PDF's and the Excel tracker all follow the same layout
+'''
+
+import sys
+
+__author__ = 'Corey Forman'
+
+# wkhtmltopdf page size name, then the width and height in inches when upright
+paper_sizes = {
+    'letter': ('Letter', 8.5, 11),
+    'legal': ('Legal', 8.5, 14),
+    'tabloid': ('Tabloid', 11, 17),
+    'a3': ('A3', 11.69, 16.54),
+    'a4': ('A4', 8.27, 11.69),
+    'a5': ('A5', 5.83, 8.27),
+}
+orientations = ['landscape', 'portrait']
+# Rough size in CSS pixels of one card with its spacing, and of the card button, title and footer
+card_px = (430, 390)
+heading_px = 110
+
+
+class Layout():
+    """Arranges the cards of a sheet in rows and columns to suit the paper and orientation"""
+    def __init__(self, cards_per_sheet=6, paper='letter', orientation='landscape'):
+        """Work out the grid and the printed page from the cards per sheet, paper and orientation"""
+        cards_per_sheet = int(cards_per_sheet)
+        paper = paper.lower()
+        orientation = orientation.lower()
+        if cards_per_sheet < 1:
+            raise ValueError(f'{cards_per_sheet} cards per sheet is not possible - use 1 or more')
+        if paper not in paper_sizes:
+            raise ValueError(f'{paper} is not a supported paper size - use one of {", ".join(paper_sizes)}')
+        if orientation not in orientations:
+            raise ValueError(f'{orientation} is not an orientation - use landscape or portrait')
+        self.cards_per_sheet = cards_per_sheet
+        self.paper = paper
+        self.orientation = orientation
+        self.page_size, self.width, self.height = paper_sizes[paper]
+        rows = max(1, int(cards_per_sheet ** 0.5))
+        columns = -(-cards_per_sheet // rows)
+        if orientation == 'landscape':
+            self.width, self.height = self.height, self.width
+        else:
+            columns = rows
+        self.columns = columns
+        self.rows = -(-cards_per_sheet // columns)
+        self.margin_top = 0.5
+        self.margin_bottom = 0.25
+        if sys.platform == 'linux':
+            self.margin_left = 0.25
+            self.margin_right = 0.25
+        else:
+            self.margin_left = 0.1
+            self.margin_right = 0
+
+    def card_rows(self):
+        """Returns the numbers of the cards in each row of the sheet, from 1"""
+        return [list(range(first, min(first + self.columns, self.cards_per_sheet + 1)))
+                for first in range(1, self.cards_per_sheet + 1, self.columns)]
+
+    def grid_css(self):
+        """Returns the CSS grid columns for one row of cards"""
+        return ' '.join(['auto'] * self.columns)
+
+    def print_css(self):
+        """Widens a printed sheet whose cards are too tall for the page, so shrinking it to fit the
+        width also fits the height"""
+        width = self.width - self.margin_left - self.margin_right
+        height = self.height - self.margin_top - self.margin_bottom
+        grid_width = self.columns * card_px[0]
+        grid_height = heading_px + self.rows * card_px[1]
+        if grid_height / grid_width <= height / width:
+            return ''
+        return f'\nbody {{\n  min-width: {-(-grid_height * width // height):.0f}px;\n}}\n'
+
+    def pdf_options(self):
+        """Configure options for printing to PDF with wkhtmltopdf"""
+        upright = paper_sizes[self.paper]
+        options = {
+            'page-size': self.page_size,
+            'page-width': f'{upright[1]}in',
+            'page-height': f'{upright[2]}in',
+            'orientation': self.orientation.title(),
+            'margin-top': f'{self.margin_top}in',
+            'margin-right': f'{self.margin_right}in',
+            'margin-bottom': f'{self.margin_bottom}in',
+            'margin-left': f'{self.margin_left}in',
+            'quiet': ''
+        }
+        return options
+
+
+def layout_from_args(arguments):
+    """Builds the layout chosen in the command line or GUI arguments"""
+    return Layout(arguments.get('cards_per_sheet') or 6, arguments.get('paper') or 'letter',
+                  arguments.get('orientation') or 'landscape')
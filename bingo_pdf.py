@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+'''
+Prints the generated cards to PDF, either with wkhtmltopdf through pdfkit,
+or with the built-in writer which draws the cards straight to PDF as vector shapes
+'''
+
+import zlib
+from bingo_layout import Layout
+
+__author__ = 'Corey Forman'
+
+# Advance widths of the printable ASCII characters in the standard Helvetica fonts, per 1000 units
+helvetica_widths = {
+    False: [278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+            556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+            1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+            667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+            333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+            556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584],
+    True: [278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+           556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+           975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+           667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+           333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+           611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584],
+}
+source_url = 'https://github.com/digitalsleuth/bingo-card-generator'
+
+
+def pdf_options(layout=None):
+    """Configure options for printing to PDF"""
+    return (layout or Layout()).pdf_options()
+
+def print_pdf(html, out_file, layout=None):
+    """Prints the HTML of one sheet, or of several merged sheets, to PDF over wkhtmltopdf's stdin"""
+    import pdfkit
+    pdfkit.from_string(html, out_file, options=pdf_options(layout))
+
+def text_width(text, size, bold=False):
+    """Measures a line of text set in Helvetica, in points"""
+    widths = helvetica_widths[bold]
+    return sum(widths[ord(char) - 32] if 32 <= ord(char) < 127 else 556 for char in text) * size / 1000
+
+def pdf_text(text):
+    """Escapes text for a PDF string in the WinAnsi encoding of the standard fonts"""
+    text = text.encode('cp1252', 'replace').decode('latin-1')
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def pdf_colour(colour):
+    """Converts a CSS colour name or hex value to a PDF RGB colour"""
+    import webcolors
+    rgb = webcolors.html5_parse_legacy_color(colour)
+    return f'{rgb.red / 255:.3f} {rgb.green / 255:.3f} {rgb.blue / 255:.3f}'
+
+def rounded_rect(x, y, width, height, radius):
+    """Builds the path of a rectangle with rounded corners"""
+    curve = radius * 0.448
+    right = x + width
+    top = y + height
+    return (f'{x + radius:.2f} {y:.2f} m {right - radius:.2f} {y:.2f} l '
+            f'{right - curve:.2f} {y:.2f} {right:.2f} {y + curve:.2f} {right:.2f} {y + radius:.2f} c '
+            f'{right:.2f} {top - radius:.2f} l '
+            f'{right:.2f} {top - curve:.2f} {right - curve:.2f} {top:.2f} {right - radius:.2f} {top:.2f} c '
+            f'{x + radius:.2f} {top:.2f} l '
+            f'{x + curve:.2f} {top:.2f} {x:.2f} {top - curve:.2f} {x:.2f} {top - radius:.2f} c '
+            f'{x:.2f} {y + radius:.2f} l '
+            f'{x:.2f} {y + curve:.2f} {x + curve:.2f} {y:.2f} {x + radius:.2f} {y:.2f} c h\n')
+
+class VectorPdf():
+    """Draws sheets of cards straight to a PDF, one page per sheet in the layout's paper size"""
+    margin = 18
+    gap = 12
+    forms = {}
+
+    def __init__(self, out_file, card_colour, title='', layout=None):
+        """Start the PDF, drawing the parts every sheet shares once as a form"""
+        self.layout = layout or Layout()
+        self.width = round(self.layout.width * 72)
+        self.height = round(self.layout.height * 72)
+        form_key = (card_colour, title, self.layout.cards_per_sheet, self.layout.paper, self.layout.orientation)
+        if form_key not in self.forms:
+            form = self.sheet_form(pdf_colour(card_colour), title)
+            self.forms[form_key] = (zlib.compress(form.encode('latin-1'), 6), self.button_y,
+                                    self.number_size, self.number_at)
+        form, self.button_y, self.number_size, self.number_at = self.forms[form_key]
+        self.pdf = open(out_file, 'wb')
+        self.offsets = {}
+        self.page_ids = []
+        self.next_id = 5
+        self.pdf.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        self.write_object(3, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica '
+                             b'/Encoding /WinAnsiEncoding >>')
+        self.write_object(4, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold '
+                             b'/Encoding /WinAnsiEncoding >>')
+        self.write_stream(5, form, f'/Type /XObject /Subtype /Form /BBox [0 0 {self.width} {self.height}] '
+                         '/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >>')
+
+    def write_object(self, object_id, body):
+        """Writes one numbered object, noting where it starts for the cross-reference table"""
+        self.offsets[object_id] = self.pdf.tell()
+        self.pdf.write(f'{object_id} 0 obj\n'.encode('ascii') + body + b'\nendobj\n')
+
+    def write_stream(self, object_id, data, entries=''):
+        """Writes a content stream object, already compressed"""
+        self.write_object(object_id, f'<< {entries} /Filter /FlateDecode /Length {len(data)} >>\nstream\n'
+                          .encode('ascii') + data + b'\nendstream')
+
+    def card_boxes(self, grid_top):
+        """Returns the (x, y, width, height) of each card, in the layout's rows from the top"""
+        columns = self.layout.columns
+        rows = self.layout.rows
+        space_width = (self.width - 2 * self.margin - (columns - 1) * self.gap) / columns
+        space_height = (grid_top - 2 * self.margin - (rows - 1) * self.gap) / rows
+        card_width = min(space_width, space_height * 1.25)
+        card_height = min(space_height, space_width * 1.25)
+        left = (self.width - columns * card_width - (columns - 1) * self.gap) / 2
+        boxes = []
+        for card in range(self.layout.cards_per_sheet):
+            row, column = divmod(card, columns)
+            boxes.append((left + column * (card_width + self.gap),
+                          grid_top - (row + 1) * card_height - row * self.gap,
+                          card_width, card_height))
+        return boxes
+
+    def sheet_form(self, colour, title):
+        """Draws the card button, title, cards, headers, empty cells and footer common to every sheet"""
+        top = self.height - 2 * self.margin
+        button_y = top - 26
+        parts = [f'q {colour} RG 1.5 w ', rounded_rect(self.margin, button_y,
+                                                         self.width - 2 * self.margin, 26, 6), 'S Q\n']
+        grid_top = button_y - 8
+        if title:
+            grid_top -= 36
+            parts.append(f'BT {colour} rg /F2 24 Tf {(self.width - text_width(title, 24, True)) / 2:.2f} '
+                         f'{button_y - 32:.2f} Td ({pdf_text(title)}) Tj ET\n')
+        cells = []
+        for x, y, card_width, card_height in self.card_boxes(grid_top):
+            # Sizes are set for the cards of the default layout, and scaled with the cards
+            scale = min(card_width / 244, card_height / 229)
+            padding = 6 * scale
+            header_height = 24 * scale
+            header_size = 18 * scale
+            free_size = 11 * scale
+            parts.append(f'{colour} rg ')
+            parts.append(rounded_rect(x, y, card_width, card_height, 5 * scale))
+            parts.append('f\n')
+            cell_width = (card_width - 2 * padding) / 5
+            cell_height = (card_height - 2 * padding - header_height) / 5
+            header_y = y + card_height - padding - header_height
+            parts.append(f'BT 1 1 1 rg /F2 {header_size:.2f} Tf\n')
+            for column, letter in enumerate('BINGO'):
+                centre = x + padding + (column + 0.5) * cell_width
+                parts.append(f'1 0 0 1 {centre - text_width(letter, header_size, True) / 2:.2f} '
+                             f'{header_y + header_height / 4:.2f} Tm ({letter}) Tj\n')
+            parts.append(f'ET 1 1 1 rg {colour} RG {1.5 * min(scale, 1):.2f} w\n')
+            card_cells = []
+            for position in range(25):
+                row, column = divmod(position, 5)
+                cell_x = x + padding + column * cell_width
+                cell_y = header_y - (row + 1) * cell_height
+                parts.append(f'{cell_x:.2f} {cell_y:.2f} {cell_width:.2f} {cell_height:.2f} re\n')
+                card_cells.append((cell_x + cell_width / 2, cell_y + cell_height / 2))
+            parts.append('B\n')
+            free_x, free_y = card_cells[12]
+            parts.append(f'BT {colour} rg /F2 {free_size:.2f} Tf '
+                         f'{free_x - text_width("FREE", free_size, True) / 2:.2f} '
+                         f'{free_y - free_size * 0.359:.2f} Td (FREE) Tj ET\n')
+            cells.append(card_cells)
+        self.button_y = button_y
+        self.number_size = round(16 * scale, 2)
+        parts.append(f'BT 0 0 0 rg /F1 9 Tf {(self.width - text_width(source_url, 9)) / 2:.2f} '
+                     f'{self.margin / 2:.2f} Td ({source_url}) Tj ET\n')
+        digit_width = self.number_size * 0.556
+        self.number_at = [[{digits: f'1 0 0 1 {cell_x - digits * digit_width / 2:.2f} '
+                                    f'{cell_y - self.number_size * 0.359:.2f} Tm ('
+                            for digits in (1, 2)} for cell_x, cell_y in card_cells]
+                          for card_cells in cells]
+        return ''.join(parts)
+
+    def add_sheet(self, sheet, sheet_cards):
+        """Adds a page for one sheet, drawing only its card number and numbers over the shared form"""
+        label = f'CARD {sheet}'
+        parts = ['/Sheet Do\nBT 0 0 0 rg /F1 13 Tf ',
+                 f'{(self.width - text_width(label, 13)) / 2:.2f} {self.button_y + 8.5:.2f} Td ({label}) Tj\n',
+                 f'/F1 {self.number_size} Tf\n']
+        for number_at, numbers in zip(self.number_at, sheet_cards):
+            for position, number in enumerate(numbers):
+                if position != 12:
+                    number = str(number)
+                    parts.append(f'{number_at[position][len(number)]}{number}) Tj\n')
+        parts.append('ET\n')
+        content_id = self.next_id + 1
+        page_id = self.next_id + 2
+        self.next_id = page_id
+        self.write_stream(content_id, zlib.compress(''.join(parts).encode('latin-1'), 6))
+        self.write_object(page_id, f'<< /Type /Page /Parent 2 0 R /Contents {content_id} 0 R >>'
+                          .encode('ascii'))
+        self.page_ids.append(page_id)
+
+    def close(self):
+        """Writes the page tree, catalog and cross-reference table, then closes the file"""
+        kids = ' '.join(f'{page_id} 0 R' for page_id in self.page_ids)
+        self.write_object(2, f'<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} '
+                             f'/MediaBox [0 0 {self.width} {self.height}] '
+                             '/Resources << /Font << /F1 3 0 R /F2 4 0 R >> /XObject << /Sheet 5 0 R >> >> >>'
+                          .encode('ascii'))
+        self.write_object(1, b'<< /Type /Catalog /Pages 2 0 R >>')
+        xref = self.pdf.tell()
+        size = self.next_id + 1
+        lines = [f'xref\n0 {size}\n0000000000 65535 f \n']
+        for object_id in range(1, size):
+            if object_id in self.offsets:
+                lines.append(f'{self.offsets[object_id]:010d} 00000 n \n')
+            else:
+                lines.append('0000000000 65535 f \n')
+        lines.append(f'trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n')
+        self.pdf.write(''.join(lines).encode('ascii'))
+        self.pdf.close()
+
+def print_vector_pdf(sheets, out_file, card_colour, title='', layout=None):
+    """Draws (sheet, cards) pairs to a PDF with the built-in writer, one page per sheet"""
+    pdf = VectorPdf(out_file, card_colour, title, layout)
+    try:
+        for sheet, sheet_cards in sheets:
+            pdf.add_sheet(sheet, sheet_cards)
+    finally:
+        pdf.close()
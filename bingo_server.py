@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+'''
+Serves the generated cards on the local network, pushes each called number
+to the connected cards and verifies bingo claims against the stored card data.
+
+Only asyncio from the standard library is used - the HTTP parsing and the
+WebSocket handshake and framing are done here - so the server runs offline
+on a single event loop. Generate the cards with --offline so they don't
+need to load jQuery from the internet either.
+
+Start with: bingo-card-generator serve -o <output_dir> -c <card colour>
+'''
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import secrets
+import struct
+from itertools import islice
+from urllib.parse import parse_qs, unquote, urlsplit
+import bingo_engine
+
+__author__ = 'Corey Forman'
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+# The shared files written by --shared-assets - the manifest, tracker and index are never served
+SHARED_ASSETS = re.compile(r'bingo-[0-9a-f]{8}\.(css|js)|'
+                           r'bingo-(logo|github)-[0-9a-f]{8}\.(png|jpeg|jpg|gif|webp|bmp)')
+MAX_MESSAGE = 65536
+MAX_BUFFER = 1 << 20
+SHOWN = 50
+
+card_script = '''
+<style>
+#caller-bar { position: sticky; top: 0; z-index: 10; padding: 6px; text-align: center;
+              font-family: Arial, sans-serif; background: #222222; color: #FFFFFF; }
+#caller-bar .last-call { font-size: 28px; font-weight: bold; margin-right: 12px; }
+#caller-bar button, #caller-bar select { font-size: 16px; margin-left: 6px; }
+@media print { #caller-bar { display: none; } }
+</style>
+<script>
+(function () {
+    var sheet = %(sheet)d;
+    var cards = %(cards)d;
+    var called = [];
+    var socket = null;
+    var bar = document.createElement('div');
+    var options = '';
+    for (var card = 1; card <= cards; card++) {
+        options += '<option value="' + card + '">Card ' + card + '</option>';
+    }
+    bar.id = 'caller-bar';
+    bar.innerHTML = '<span class="last-call" id="last-call">Waiting for the caller</span>' +
+                    '<span id="called-numbers"></span>' +
+                    '<select id="claim-card">' + options + '</select>' +
+                    '<button id="claim-button">BINGO!</button> <span id="claim-result"></span>';
+    document.body.insertBefore(bar, document.body.firstChild);
+    function label(number) {
+        return 'BINGO'.charAt(Math.floor((number - 1) / 15)) + number;
+    }
+    function show() {
+        var labels = [];
+        for (var i = 0; i < called.length; i++) {
+            labels.push(label(called[i]));
+        }
+        document.getElementById('last-call').innerHTML = called.length ?
+            labels[labels.length - 1] : 'Waiting for the caller';
+        document.getElementById('called-numbers').innerHTML = labels.slice(0, -1).reverse().join(' ');
+    }
+    function connect() {
+        var scheme = window.location.protocol === 'https:' ? 'wss://' : 'ws://';
+        socket = new WebSocket(scheme + window.location.host + '/ws?sheet=' + sheet);
+        socket.onmessage = function (event) {
+            var message = JSON.parse(event.data);
+            if (message.called) {
+                called = message.called;
+            }
+            if (message.call) {
+                called.push(message.call);
+            }
+            if (message.reset) {
+                called = [];
+                document.getElementById('claim-result').innerHTML = '';
+            }
+            if (message.claim) {
+                document.getElementById('claim-result').innerHTML = message.valid ?
+                    'Card ' + message.claim + ' has BINGO - ' + message.pattern + '!' :
+                    'Card ' + message.claim + ' does not have BINGO yet';
+            }
+            show();
+        };
+        socket.onclose = function () {
+            window.setTimeout(connect, 2000);
+        };
+    }
+    document.getElementById('claim-button').onclick = function () {
+        if (socket && socket.readyState === 1) {
+            socket.send(JSON.stringify({claim: parseInt(document.getElementById('claim-card').value, 10)}));
+        }
+    };
+    connect();
+})();
+</script>
+'''
+
+caller_page = '''<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Bingo Caller</title>
+<style>
+body { font-family: Arial, sans-serif; margin: 20px; }
+table { border-collapse: collapse; margin-bottom: 12px; }
+td { width: 36px; height: 30px; text-align: center; border: 1px solid #B2B2B2; font-size: 16px; }
+td.letter { font-weight: bold; background: #222222; color: #FFFFFF; }
+td.called { background: #FFC000; font-weight: bold; }
+input, button { font-size: 18px; }
+.columns { display: flex; gap: 40px; }
+.error { color: #FF0000; }
+</style></head>
+<body>
+<h2>Bingo Caller - %(cards)d cards - playing for %(patterns)s</h2>
+<table id="board"></table>
+<input id="number" placeholder="eg. N42" autofocus> <button id="call">Call</button>
+<button id="reset">New Game</button> <span id="error" class="error"></span>
+<p>Players connected: <span id="players">0</span></p>
+<div class="columns">
+<div><h3>Winners</h3><ol id="winners"></ol></div>
+<div><h3>Claims</h3><ol id="claims"></ol></div>
+<div><h3>Closest to BINGO</h3><ol id="closest"></ol></div>
+</div>
+<script>
+(function () {
+    var socket = null;
+    var board = document.getElementById('board');
+    var rows = '';
+    for (var column = 0; column < 5; column++) {
+        rows += '<tr><td class="letter">' + 'BINGO'.charAt(column) + '</td>';
+        for (var number = column * 15 + 1; number <= column * 15 + 15; number++) {
+            rows += '<td id="number-' + number + '">' + number + '</td>';
+        }
+        rows += '</tr>';
+    }
+    board.innerHTML = rows;
+    function items(id, lines) {
+        document.getElementById(id).innerHTML = '<li>' + lines.join('</li><li>') + '</li>';
+        if (!lines.length) {
+            document.getElementById(id).innerHTML = '';
+        }
+    }
+    function connect() {
+        var scheme = window.location.protocol === 'https:' ? 'wss://' : 'ws://';
+        socket = new WebSocket(scheme + window.location.host + '/ws?key=%(key)s');
+        socket.onmessage = function (event) {
+            var message = JSON.parse(event.data);
+            var lines = [];
+            var i;
+            document.getElementById('error').innerHTML = message.error || '';
+            if (message.called) {
+                for (i = 1; i <= 75; i++) {
+                    document.getElementById('number-' + i).className = '';
+                }
+                for (i = 0; i < message.called.length; i++) {
+                    document.getElementById('number-' + message.called[i]).className = 'called';
+                }
+            }
+            if (message.winners) {
+                for (i = 0; i < message.winners.length; i++) {
+                    lines.push('Card ' + message.winners[i][0] + ', #' + message.winners[i][1] +
+                               ' - ' + message.winners[i][2]);
+                }
+                items('winners', lines);
+                lines = [];
+            }
+            if (message.closest) {
+                for (i = 0; i < message.closest.length; i++) {
+                    lines.push('Card ' + message.closest[i][0] + ', #' + message.closest[i][1] +
+                               ' - needs ' + message.closest[i][2]);
+                }
+                items('closest', lines);
+                lines = [];
+            }
+            if (message.claims) {
+                for (i = 0; i < message.claims.length; i++) {
+                    lines.push('Card ' + message.claims[i][0] + ', #' + message.claims[i][1] +
+                               (message.claims[i][2] ? ' - BINGO, ' + message.claims[i][2] : ' - not yet'));
+                }
+                items('claims', lines);
+            }
+            if ('players' in message) {
+                document.getElementById('players').innerHTML = message.players;
+            }
+        };
+        socket.onclose = function () {
+            window.setTimeout(connect, 2000);
+        };
+    }
+    function call() {
+        var number = document.getElementById('number');
+        if (number.value && socket && socket.readyState === 1) {
+            socket.send(JSON.stringify({call: number.value}));
+        }
+        number.value = '';
+        number.focus();
+    }
+    document.getElementById('call').onclick = call;
+    document.getElementById('number').onkeydown = function (event) {
+        if (event.keyCode === 13) {
+            call();
+        }
+    };
+    document.getElementById('reset').onclick = function () {
+        if (window.confirm('Start a new game? The called numbers will be cleared.')) {
+            socket.send(JSON.stringify({reset: true}));
+        }
+    };
+    connect();
+})();
+</script>
+</body></html>
+'''
+
+
+def frame(payload, opcode=1):
+    """Builds an unmasked, unfragmented WebSocket frame for sending to a client"""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 65536:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    return header + payload
+
+async def read_frame(reader):
+    """Reads one WebSocket frame from a client and returns its opcode and unmasked payload"""
+    head = await reader.readexactly(2)
+    opcode = head[0] & 0x0F
+    length = head[1] & 0x7F
+    if length == 126:
+        length = struct.unpack('!H', await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack('!Q', await reader.readexactly(8))[0]
+    if length > MAX_MESSAGE:
+        raise ConnectionError('WebSocket message too large')
+    mask = await reader.readexactly(4) if head[1] & 0x80 else b''
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+    return opcode, payload
+
+
+class BingoServer():
+    """Holds the cards and the game in progress, and talks to the caller and the players"""
+    def __init__(self, output, card_colour, patterns=('line',)):
+        """Load the cards from the manifest of a run"""
+        import bingo_card_generator
+        self.output = os.path.realpath(output)
+        self.colour = card_colour.upper().strip('#')
+        manifest_file = os.path.join(self.output, f'{self.colour}-manifest.jsonl')
+        if not os.path.exists(manifest_file):
+            raise FileNotFoundError(f'{manifest_file} not found - generate the cards first')
+        self.cards = bingo_card_generator.load_manifest_cards(manifest_file)
+        self.patterns = list(patterns)
+        self.engine = bingo_engine.WinnerEngine(self.cards, self.patterns)
+        self.key = secrets.token_urlsafe(12)
+        self.players = set()
+        self.callers = set()
+        self.claims = []
+
+    async def handle(self, reader, writer):
+        """Answers one HTTP request, or upgrades it to a WebSocket"""
+        try:
+            request = await reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        lines = request.decode('latin-1').split('\r\n')
+        try:
+            method, target, _ = lines[0].split(' ', 2)
+        except ValueError:
+            writer.close()
+            return
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        try:
+            if method != 'GET':
+                await self.respond(writer, '405 Method Not Allowed', b'Only GET is supported')
+            elif url.path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+                await self.websocket(reader, writer, headers, query)
+            elif url.path == '/caller' and query.get('key') == [self.key]:
+                await self.respond(writer, '200 OK', self.caller_page())
+            elif url.path.startswith('/cards/'):
+                await self.card_file(writer, unquote(url.path[len('/cards/'):]))
+            else:
+                await self.respond(writer, '404 Not Found',
+                                   b'Open the card link you were given by the caller')
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, body, content_type='text/html; charset=utf-8'):
+        """Sends a complete HTTP response"""
+        writer.write(f'HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n'
+                     f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode('latin-1') + body)
+        await writer.drain()
+
+    def caller_page(self):
+        """Builds the caller's page"""
+        return (caller_page % {'cards': len(self.engine.card_ids),
+                               'patterns': ', '.join(self.patterns),
+                               'key': self.key}).encode('utf-8')
+
+    async def card_file(self, writer, name):
+        """Serves a card or a shared asset from the output directory, adding the caller bar to each card"""
+        path = os.path.realpath(os.path.join(self.output, name))
+        file_name = os.path.basename(path)
+        match = re.fullmatch(rf'(\d+)-{re.escape(self.colour)}\.html', file_name)
+        allowed = (match and int(match.group(1)) in self.cards) or SHARED_ASSETS.fullmatch(file_name)
+        if not allowed or os.path.dirname(path) != self.output or not os.path.isfile(path):
+            await self.respond(writer, '404 Not Found', b'Not found')
+            return
+        with open(path, 'rb') as card:
+            body = card.read()
+        if match:
+            sheet = int(match.group(1))
+            script = card_script % {'sheet': sheet, 'cards': len(self.cards[sheet])}
+            body = body.replace(b'</body>', script.encode('utf-8') + b'</body>', 1)
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type == 'application/javascript':
+            content_type += '; charset=utf-8'
+        await self.respond(writer, '200 OK', body, content_type)
+
+    async def websocket(self, reader, writer, headers, query):
+        """Completes the WebSocket handshake, then relays messages until the client leaves"""
+        if query.get('key') == [self.key]:
+            clients = self.callers
+            sheet = None
+        else:
+            try:
+                sheet = int(query.get('sheet', [''])[0])
+            except ValueError:
+                sheet = None
+            if sheet not in self.cards:
+                await self.respond(writer, '404 Not Found', b'Unknown sheet')
+                return
+            clients = self.players
+        accept = base64.b64encode(hashlib.sha1((headers.get('sec-websocket-key', '') +
+                                                WS_GUID).encode('latin-1')).digest())
+        writer.write(b'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n'
+                     b'Connection: Upgrade\r\nSec-WebSocket-Accept: ' + accept + b'\r\n\r\n')
+        clients.add(writer)
+        try:
+            if sheet is None:
+                writer.write(frame(json.dumps(self.status()).encode('utf-8')))
+            else:
+                writer.write(frame(json.dumps({'called': self.engine.called}).encode('utf-8')))
+            self.send(self.callers, {'players': len(self.players)})
+            while True:
+                opcode, payload = await read_frame(reader)
+                if opcode == 8:
+                    writer.write(frame(payload[:2], 8))
+                    break
+                if opcode == 9:
+                    writer.write(frame(payload, 10))
+                elif opcode == 1:
+                    try:
+                        message = json.loads(payload)
+                    except ValueError:
+                        continue
+                    if sheet is None:
+                        self.caller_message(writer, message)
+                    else:
+                        self.player_message(writer, sheet, message)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            clients.discard(writer)
+            self.send(self.callers, {'players': len(self.players)})
+
+    def caller_message(self, writer, message):
+        """Calls a number or starts a new game"""
+        if not isinstance(message, dict):
+            return
+        if message.get('reset'):
+            self.engine.reset()
+            self.claims = []
+            self.send(self.players, {'reset': True})
+            self.send(self.callers, self.status())
+            return
+        try:
+            number = bingo_engine.parse_call(str(message.get('call', '')))
+            self.engine.call(number)
+        except ValueError as err:
+            writer.write(frame(json.dumps({'error': str(err)}).encode('utf-8')))
+            return
+        self.send(self.players, {'call': number})
+        self.send(self.callers, self.status())
+
+    def player_message(self, writer, sheet, message):
+        """Verifies a player's claim against the card data and the numbers called"""
+        if not isinstance(message, dict):
+            return
+        try:
+            card = int(message.get('claim'))
+        except (TypeError, ValueError):
+            return
+        if not 1 <= card <= len(self.cards[sheet]):
+            return
+        numbers = self.cards[sheet][card - 1]
+        pattern = bingo_engine.check_card(numbers, self.engine.called, self.patterns)
+        writer.write(frame(json.dumps({'claim': card, 'valid': pattern is not None,
+                                       'pattern': pattern}).encode('utf-8')))
+        self.claims.append((sheet, card, pattern))
+        del self.claims[:-SHOWN]
+        self.send(self.callers, {'claims': self.claims})
+
+    def status(self):
+        """The state of the game as shown to the caller"""
+        return {'called': self.engine.called,
+                'winners': [sheet_card + (pattern,) for sheet_card, pattern
+                            in islice(self.engine.winners.items(), SHOWN)],
+                'closest': self.engine.closest(),
+                'claims': self.claims,
+                'players': len(self.players)}
+
+    def send(self, clients, message):
+        """Pushes a message to every client, dropping any that have stopped reading"""
+        data = frame(json.dumps(message).encode('utf-8'))
+        for writer in list(clients):
+            if writer.is_closing() or writer.transport.get_write_buffer_size() > MAX_BUFFER:
+                clients.discard(writer)
+                writer.close()
+            else:
+                writer.write(data)
+
+    async def serve(self, host, port):
+        """Serve until interrupted"""
+        server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        shown_host = 'localhost' if host in ('', '0.0.0.0') else host
+        print(f"{len(self.engine.card_ids)} cards loaded from {self.output}")
+        print(f"Caller: http://{shown_host}:{port}/caller?key={self.key}")
+        print(f"Cards:  http://{shown_host}:{port}/cards/<sheet>-{self.colour}.html")
+        print("Press Ctrl+C to stop")
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    """Parse the serve arguments and run the server"""
+    arg_parse = argparse.ArgumentParser(
+        prog='bingo-card-generator serve',
+        description='Serves the generated cards and checks claims as numbers are called')
+    arg_parse.add_argument('-o', '--output', required=True,
+                           help='Directory the cards were generated into')
+    arg_parse.add_argument('-c', '--card-colour', default='blue',
+                           help='Colour of the cards to serve - default is BLUE')
+    arg_parse.add_argument('--host', default='0.0.0.0',
+                           help='Address to listen on - default is all addresses')
+    arg_parse.add_argument('--port', type=int, default=8080,
+                           help='Port to listen on - default is 8080')
+    arg_parse.add_argument('--pattern', action='append',
+                           help='Winning pattern, as for --play - default is line')
+    args = arg_parse.parse_args(argv)
+    try:
+        server = BingoServer(args.output, args.card_colour, args.pattern or ['line'])
+    except (FileNotFoundError, ValueError) as err:
+        arg_parse.error(str(err))
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -15,7 +15,8 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
-    py_modules=['bingo_card_generator', 'bingo_gui'],
+    py_modules=['bingo_card_generator', 'bingo_engine', 'bingo_excel', 'bingo_gui',
+                'bingo_layout', 'bingo_pdf', 'bingo_server'],
     data_files=[(os.sep, ['bingo.ico', 'README.md', 'LICENSE.md'])],
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -24,6 +25,7 @@ setup(
     ],
     install_requires=[
         "PyQt6",
+        "numpy",
         "openpyxl",
         "pdfkit",
         "Pillow",